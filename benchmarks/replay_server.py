@@ -0,0 +1,280 @@
+"""
+A local stand-in for statsapi.mlb.com that replays recorded responses.
+
+Recordings are JSON files ({"path", "query", "status", "body"}) in a folder,
+made with 'python -m benchmarks.replay_server record'. Requests without a
+recording get a synthetic response (see synthetic.py), so the server works
+with no recordings at all.
+
+Latency and errors can be injected to see how the client copes with a slow
+or flaky API. Responses carry an ETag and answer If-None-Match with 304,
+like the real API, so conditional revalidation can be measured too. Like the
+real API, a 'fields' parameter trims the response to the keys it names, and
+bodies are gzipped for clients that accept it.
+
+Point the CLI at it with MLB_STATS_API_URL=http://127.0.0.1:<port>.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+from benchmarks import synthetic
+
+# What 'record' downloads by default: a bit of everything the benchmarks request
+RECORD_SEASON = 2024
+RECORD_PLAYER_IDS = (660271, 592450, 605141, 677951, 665742)
+
+
+def request_key(path, query):
+    """Identifies a request by its path and (sorted) query string."""
+    return path + "?" + "&".join(f"{key}={query[key]}" for key in sorted(query))
+
+
+def load_recordings(folder):
+    """
+    Reads every recording in a folder.
+
+    Returns:
+        dict: {request_key: (status, body bytes)}; also keyed by the bare path
+              as a fallback for requests whose query differs.
+    """
+    recordings = {}
+    if not folder or not os.path.isdir(folder):
+        return recordings
+    for name in sorted(os.listdir(folder)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(folder, name), encoding="utf-8") as f:
+            record = json.load(f)
+        body = json.dumps(record["body"], separators=(",", ":")).encode("utf-8")
+        entry = (record.get("status", 200), body)
+        recordings[request_key(record["path"], record.get("query", {}))] = entry
+        recordings.setdefault(record["path"], entry)
+    return recordings
+
+
+def project(data, names):
+    """Keeps only the keys in names, at every depth (what the API's 'fields' parameter does)."""
+    if isinstance(data, dict):
+        return {key: project(value, names) for key, value in data.items() if key in names}
+    if isinstance(data, list):
+        return [project(value, names) for value in data]
+    return data
+
+
+class ReplayServer:
+    """
+    Runs the stand-in API on a background thread.
+
+    Usage:
+        with ReplayServer(latency=0.02, error_rate=0.01) as server:
+            os.environ["MLB_STATS_API_URL"] = server.url
+    """
+
+    def __init__(self, recordings_dir=None, latency=0.0, jitter=0.0, error_rate=0.0, seed=0,
+                 host="127.0.0.1", port=0, compress=True):
+        """
+        Args:
+            recordings_dir (str, optional): Folder of recorded responses.
+            latency (float, optional): Seconds added to every response.
+            jitter (float, optional): Up to this many extra seconds, picked at random per response.
+            error_rate (float, optional): Fraction of requests answered with a 503 (0.0 - 1.0).
+            seed (int, optional): Seed for the jitter and errors, so runs are repeatable.
+            host (str, optional): Address to listen on.
+            port (int, optional): Port to listen on (0 picks a free one).
+            compress (bool, optional): Gzip bodies for clients that send Accept-Encoding: gzip.
+        """
+        self.recordings = load_recordings(recordings_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.compress = compress
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "not_modified": 0, "bytes_sent": 0}
+        self._server = self._make_server(host, port)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _draw(self):
+        """Picks this response's delay and whether it fails."""
+        with self._random_lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+    def respond(self, path, query, if_none_match=None, accept_encoding=""):
+        """
+        Answers one request.
+
+        Returns:
+            tuple: (status, body bytes, ETag or None, Content-Encoding or None).
+        """
+        self._count("requests")
+        delay, fail = self._draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._count("errors")
+            return 503, b"Injected error.", None, None
+
+        status, body = self.recordings.get(request_key(path, query)) or self.recordings.get(path) or (None, None)
+        if body is None:
+            generated = synthetic.response_for(path, query)
+            if generated is None:
+                return 404, b"No recording for this request.", None, None
+            status, body = 200, json.dumps(generated, separators=(",", ":")).encode("utf-8")
+        if query.get("fields") and status == 200:
+            names = set(query["fields"].split(","))
+            body = json.dumps(project(json.loads(body), names), separators=(",", ":")).encode("utf-8")
+
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if if_none_match == etag:
+            self._count("not_modified")
+            return 304, b"", etag, None
+        encoding = None
+        if self.compress and status == 200 and "gzip" in accept_encoding:
+            body, encoding = gzip.compress(body, compresslevel=6), "gzip"
+        self._count("bytes_sent", len(body))
+        return status, body, etag, encoding
+
+    def _make_server(self, host, port):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qsl, urlparse
+
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, like the real API, so pooled connections get reused
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this, Nagle + delayed ACK add ~40ms
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+                status, body, etag, encoding = replay.respond(
+                    parsed.path, query, self.headers.get("If-None-Match"), self.headers.get("Accept-Encoding", "")
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json" if status == 200 else "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+    def serve_forever(self):
+        """Serves on the current thread until interrupted (Ctrl+C)."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def start(self):
+        """Serves on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def record(folder, team_ids, season=RECORD_SEASON, player_ids=RECORD_PLAYER_IDS):
+    """
+    Downloads real API responses into a folder of recordings.
+
+    Args:
+        folder (str): Where to write the recordings.
+        team_ids (iterable): Teams whose rosters to record.
+        season (int, optional): The season for stats and leaders.
+        player_ids (iterable, optional): Players whose stats to record.
+
+    Returns:
+        int: How many responses were recorded.
+    """
+    from src import client
+
+    requests_to_record = [(f"/api/v1/teams/{team_id}/roster", {}) for team_id in team_ids]
+    requests_to_record += [
+        (f"/api/v1/people/{player_id}/stats",
+         {"stats": "season", "group": "hitting,pitching", "season": str(season), "sportId": "1"})
+        for player_id in player_ids
+    ]
+    requests_to_record.append(
+        ("/api/v1/stats/leaders",
+         {"leaderCategories": "homeRuns", "season": str(season), "statGroup": "hitting", "limit": "10"})
+    )
+
+    os.makedirs(folder, exist_ok=True)
+    for number, (path, query) in enumerate(requests_to_record):
+        response = client.get(f"https://statsapi.mlb.com{path}", params=query or None)
+        record_data = {"path": path, "query": query, "status": response.status_code, "body": response.json()}
+        with open(os.path.join(folder, f"{number:03d}.json"), "w", encoding="utf-8") as f:
+            json.dump(record_data, f)
+    return len(requests_to_record)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded MLB API responses locally.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the replay server until Ctrl+C.")
+    serve_parser.add_argument("--recordings", type=str, help="Folder of recorded responses.")
+    serve_parser.add_argument("--port", type=int, default=8799, help="Port to listen on (default: 8799).")
+    serve_parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response.")
+    serve_parser.add_argument("--jitter-ms", type=float, default=0, help="Up to this much extra random delay.")
+    serve_parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests that get a 503.")
+
+    record_parser = subparsers.add_parser("record", help="Record real API responses (needs network).")
+    record_parser.add_argument("folder", type=str, help="Where to write the recordings.")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        from src.main import TEAM_MAP
+        print(f"Recorded {record(args.folder, TEAM_MAP.values())} responses into {args.folder}.")
+        return
+
+    server = ReplayServer(
+        args.recordings, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate, port=args.port
+    )
+    print(f"Replaying on {server.url} (set MLB_STATS_API_URL={server.url}); Ctrl+C to stop...", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
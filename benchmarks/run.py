@@ -0,0 +1,283 @@
+"""
+Runs the benchmark suite against the local replay server and writes the results as JSON.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --latency-ms 40 --error-rate 0.02 --baseline results.json
+
+Each benchmark reports its samples' mean, p50, p95, min and max in seconds.
+With --baseline, p50s are compared to an earlier results file, and the exit
+code is 1 if any benchmark got slower than --threshold percent.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.replay_server import ReplayServer
+
+SCHEMA_VERSION = 1
+BENCH_SEASON = 2024
+BATCH_PLAYERS = 120  # How many players the batch-stats benchmarks ask for
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Registers a benchmark function under a name."""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def summarize(name, samples, unit="s", **extra):
+    """Turns raw timings into one result entry."""
+    ordered = sorted(samples)
+    return {
+        "name": name,
+        "unit": unit,
+        "samples": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "min": ordered[0],
+        "max": ordered[-1],
+        **extra,
+    }
+
+
+def timed(func, repeat):
+    """Calls func() repeat times and returns each call's duration."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def roster_player_ids(count):
+    """Player IDs that exist on the replay server (synthetic roster slots)."""
+    from benchmarks import synthetic
+    from src.main import TEAM_MAP
+
+    ids = [synthetic.player_id(team_id, slot) for team_id in TEAM_MAP.values() for slot in range(synthetic.ROSTER_SIZE)]
+    return ids[:count]
+
+
+@benchmark("single_call")
+def bench_single_call(options):
+    """One roster request at a time, cache off: the latency of a single API call."""
+    from src import api
+
+    api.configure_cache(enabled=False)
+    return [summarize("single_call", timed(lambda: api.get_roster(113), options.repeat))]
+
+
+@benchmark("fanout_rosters")
+def bench_fanout_rosters(options):
+    """All 30 rosters through fetch_concurrently, as 'roster --all' does."""
+    from src import api
+    from src.main import TEAM_MAP, fetch_concurrently
+
+    api.configure_cache(enabled=False)
+
+    def fan_out():
+        results = dict(fetch_concurrently(api.get_roster, TEAM_MAP.values(), workers=options.workers))
+        assert len(results) == len(TEAM_MAP)
+
+    samples = timed(fan_out, max(1, options.repeat // 4))
+    return [summarize("fanout_rosters", samples, requests=len(TEAM_MAP),
+                      requests_per_second=len(TEAM_MAP) / statistics.median(samples))]
+
+
+@benchmark("batch_player_stats")
+def bench_batch_player_stats(options):
+    """Stats for many players: the batched /people call vs. one request per player."""
+    from src import api
+    from src.main import fetch_concurrently
+
+    api.configure_cache(enabled=False)
+    player_ids = roster_player_ids(BATCH_PLAYERS)
+    repeat = max(1, options.repeat // 4)
+
+    batched = timed(lambda: api.get_people_stats(player_ids, BENCH_SEASON), repeat)
+    one_by_one = timed(
+        lambda: list(fetch_concurrently(lambda pid: api.get_player_stats(pid, BENCH_SEASON), player_ids,
+                                        workers=options.workers)),
+        repeat,
+    )
+    return [
+        summarize("batch_player_stats", batched, players=len(player_ids)),
+        summarize("per_player_stats", one_by_one, players=len(player_ids)),
+    ]
+
+
+@benchmark("cache")
+def bench_cache(options):
+    """The 30-roster fan-out with an empty cache, a fresh one, and one that needs revalidating."""
+    from src import api
+    from src.main import TEAM_MAP, fetch_concurrently
+
+    def fan_out(ttl):
+        list(fetch_concurrently(lambda team_id: api.get_roster(team_id, ttl=ttl), TEAM_MAP.values(),
+                                workers=options.workers))
+
+    cold, warm, revalidated = [], [], []
+    for _ in range(max(1, options.repeat // 4)):
+        with tempfile.TemporaryDirectory() as folder:
+            api.configure_cache(cache_dir=folder)
+            cold += timed(lambda: fan_out(None), 1)
+            warm += timed(lambda: fan_out(None), 1)
+        with tempfile.TemporaryDirectory() as folder:
+            # Entries stored with ttl=0 are stale at once, so each later read costs a conditional request (304)
+            api.configure_cache(cache_dir=folder)
+            fan_out(0)
+            revalidated += timed(lambda: fan_out(0), 1)
+        api.configure_cache(enabled=False)
+    return [
+        summarize("cache_cold", cold),
+        summarize("cache_warm", warm),
+        summarize("cache_revalidate", revalidated),
+    ]
+
+
+@benchmark("projection")
+def bench_projection(options):
+    """The 30-roster fan-out with complete responses vs. only the fields the CLI reads (fields=)."""
+    from src import api, metrics
+    from src.main import TEAM_MAP, fetch_concurrently
+
+    api.configure_cache(enabled=False)
+    results = []
+    for name, enabled in (("rosters_full", False), ("rosters_projected", True)):
+        api.configure_projection(enabled)
+        collector = metrics.add_hook(metrics.Collector())
+        samples = timed(lambda: list(fetch_concurrently(api.get_roster, TEAM_MAP.values(), workers=options.workers)),
+                        max(1, options.repeat // 4))
+        metrics.remove_hook(collector)
+        runs = len(samples)
+        results.append(summarize(name, samples, bytes_decoded=collector.counter("bytes_received") // runs,
+                                 bytes_wire=collector.counter("bytes_wire") // runs))
+    api.configure_projection(False)
+    return results
+
+
+@benchmark("cli_startup")
+def bench_cli_startup(options):
+    """Fresh interpreter runs: '--help' (import cost only) and a full 'roster CIN' against the replay server."""
+    env = {**os.environ, "MLB_STATS_API_URL": options.server_url}
+    python = [sys.executable, "-m", "src.main"]
+
+    def run(args):
+        subprocess.run(python + args, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    repeat = max(1, options.repeat // 2)
+    return [
+        summarize("cli_help", timed(lambda: run(["--help"]), repeat)),
+        summarize("cli_roster", timed(lambda: run(["roster", "CIN", "--no-cache", "--no-server"]), repeat)),
+    ]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares p50s with an earlier run.
+
+    Returns:
+        list: (name, old p50, new p50, change in percent, regressed) for benchmarks in both runs.
+    """
+    old = {result["name"]: result for result in baseline.get("results", [])}
+    rows = []
+    for result in results:
+        before = old.get(result["name"])
+        if before is None or not before["p50"]:
+            continue
+        change = (result["p50"] - before["p50"]) / before["p50"] * 100
+        rows.append((result["name"], before["p50"], result["p50"], change, change > threshold))
+    return rows
+
+
+def run(options):
+    """Starts the replay server, runs the chosen benchmarks and returns the report."""
+    from src import api, client
+
+    # Retry quickly when errors are injected, so the numbers show retry cost rather than backoff sleeps
+    client.configure(backoff=options.backoff)
+
+    with ReplayServer(options.recordings, latency=options.latency_ms / 1000, jitter=options.jitter_ms / 1000,
+                      error_rate=options.error_rate, seed=options.seed) as server:
+        options.server_url = server.url
+        api.BASE_URL = server.url
+        results = []
+        for name in options.only or list(BENCHMARKS):
+            print(f"Running {name}...", file=sys.stderr, flush=True)
+            results += BENCHMARKS[name](options)
+        server_stats = dict(server.stats)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "latency_ms": options.latency_ms, "jitter_ms": options.jitter_ms, "error_rate": options.error_rate,
+            "repeat": options.repeat, "workers": options.workers, "seed": options.seed,
+            "recordings": options.recordings,
+        },
+        "server": server_stats,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CLI against a local replay of the MLB API.")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append", help="Run only this benchmark (repeatable).")
+    parser.add_argument("--output", type=str, help="Write the JSON report here (default: stdout).")
+    parser.add_argument("--recordings", type=str, help="Folder of recorded responses (default: synthetic ones).")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Delay added to every response (default: 20).")
+    parser.add_argument("--jitter-ms", type=float, default=10, help="Up to this much extra random delay (default: 10).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that get a 503 (default: 0).")
+    parser.add_argument("--repeat", type=int, default=20, help="Samples for the single-call benchmark; others use fewer.")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrency for the fan-out benchmarks (default: 8).")
+    parser.add_argument("--backoff", type=float, default=0.01, help="Client retry backoff in seconds (default: 0.01).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter and injected errors.")
+    parser.add_argument("--baseline", type=str, help="An earlier report to compare p50s with.")
+    parser.add_argument("--threshold", type=float, default=10, help="Percent slower that counts as a regression (default: 10).")
+    options = parser.parse_args()
+
+    report = run(options)
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if options.baseline:
+        with open(options.baseline, encoding="utf-8") as f:
+            rows = compare(report["results"], json.load(f), options.threshold)
+        regressed = False
+        for name, before, after, change, slower in rows:
+            regressed = regressed or slower
+            flag = "  REGRESSION" if slower else ""
+            print(f"{name:<22} {before * 1000:9.1f}ms -> {after * 1000:9.1f}ms ({change:+.1f}%){flag}", file=sys.stderr)
+        sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
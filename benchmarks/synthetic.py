@@ -0,0 +1,259 @@
+"""
+Made-up but realistically shaped statsapi responses.
+
+The replay server falls back to these for any request it has no recording
+for, so the benchmarks run anywhere without network access. Everything is
+derived from the IDs in the request, so the same request always gets the
+same body (and ETag).
+"""
+import datetime
+import random
+import re
+
+POSITIONS = ["Pitcher"] * 13 + ["Catcher", "Catcher", "First Base", "Second Base", "Third Base",
+                                "Shortstop", "Outfielder", "Outfielder", "Outfielder", "Designated Hitter"]
+ROSTER_SIZE = 40
+TEAM_IDS = list(range(108, 122)) + list(range(133, 148)) + [158]
+DIVISION_IDS = [200, 201, 202, 203, 204, 205]
+ABBREVIATIONS = {"Pitcher": "P", "Catcher": "C", "First Base": "1B", "Second Base": "2B", "Third Base": "3B",
+                 "Shortstop": "SS", "Outfielder": "OF", "Designated Hitter": "DH"}
+
+FIRST_NAMES = ["Aaron", "Bryce", "Carlos", "Dylan", "Elly", "Freddie", "Gunnar", "Hunter", "Ian", "Jose",
+               "Kyle", "Luis", "Matt", "Nolan", "Ozzie", "Pete", "Rafael", "Shohei", "Tyler", "Yordan"]
+LAST_NAMES = ["Alvarez", "Betts", "Cruz", "De La Cruz", "Freeman", "Guerrero", "Harper", "India", "Judge",
+              "Lindor", "Machado", "Ohtani", "Perez", "Ramirez", "Soto", "Trout", "Turner", "Witt", "Yelich", "Zunino"]
+
+
+def player_id(team_id, slot):
+    return 600000 + team_id * 100 + slot
+
+
+def player_name(pid):
+    return f"{FIRST_NAMES[pid % 20]} {LAST_NAMES[(pid // 20) % 20]} {pid}"
+
+
+def person(pid):
+    return {"id": pid, "fullName": player_name(pid), "link": f"/api/v1/people/{pid}"}
+
+
+def hitting_stat(rng):
+    ab = rng.randint(200, 620)
+    hits = int(ab * rng.uniform(0.2, 0.33))
+    doubles, triples, homers = rng.randint(5, 45), rng.randint(0, 8), rng.randint(0, 50)
+    walks = rng.randint(10, 110)
+    avg = hits / ab
+    obp = (hits + walks) / (ab + walks)
+    slg = (hits + doubles + 2 * triples + 3 * homers) / ab
+    return {
+        "gamesPlayed": rng.randint(60, 162), "plateAppearances": ab + walks + rng.randint(0, 15), "atBats": ab,
+        "runs": rng.randint(20, 130), "hits": hits, "doubles": doubles, "triples": triples, "homeRuns": homers,
+        "rbi": rng.randint(20, 140), "baseOnBalls": walks, "hitByPitch": rng.randint(0, 20),
+        "sacFlies": rng.randint(0, 10), "strikeOuts": rng.randint(40, 220), "stolenBases": rng.randint(0, 60),
+        "totalBases": hits + doubles + 2 * triples + 3 * homers,
+        "avg": f"{avg:.3f}".lstrip("0"), "obp": f"{obp:.3f}".lstrip("0"), "slg": f"{slg:.3f}".lstrip("0"),
+        "ops": f"{obp + slg:.3f}".lstrip("0"),
+    }
+
+
+def pitching_stat(rng):
+    innings = rng.randint(20, 210)
+    earned = int(innings * rng.uniform(0.25, 0.6))
+    return {
+        "gamesPitched": rng.randint(10, 70), "gamesStarted": rng.randint(0, 33), "wins": rng.randint(0, 18),
+        "losses": rng.randint(0, 15), "saves": rng.randint(0, 40), "inningsPitched": f"{innings}.{rng.randint(0, 2)}",
+        "hits": int(innings * rng.uniform(0.7, 1.1)), "earnedRuns": earned, "homeRuns": rng.randint(2, 35),
+        "baseOnBalls": rng.randint(5, 80), "strikeOuts": rng.randint(15, 280),
+        "era": f"{earned * 9 / innings:.2f}", "whip": f"{rng.uniform(0.9, 1.6):.2f}",
+    }
+
+
+def stat_groups(pid, season):
+    """The "stats" list for one player: hitting for position players, pitching for pitchers."""
+    rng = random.Random(pid * 10000 + int(season or 0))
+    team_id = (pid - 600000) // 100
+    is_pitcher = POSITIONS[pid % 100 % len(POSITIONS)] == "Pitcher"
+    group = "pitching" if is_pitcher else "hitting"
+    stat = pitching_stat(rng) if is_pitcher else hitting_stat(rng)
+    return [{
+        "type": {"displayName": "season"},
+        "group": {"displayName": group},
+        "splits": [{"season": str(season), "stat": stat, "team": {"id": team_id, "name": f"Team {team_id}"},
+                    "player": person(pid)}],
+    }]
+
+
+def roster(team_id):
+    return {
+        "roster": [
+            {
+                "person": person(player_id(team_id, slot)),
+                "jerseyNumber": str(slot + 1),
+                "position": {"name": POSITIONS[slot % len(POSITIONS)],
+                             "abbreviation": ABBREVIATIONS[POSITIONS[slot % len(POSITIONS)]]},
+                "status": {"code": "A", "description": "Active"},
+                "parentTeamId": team_id,
+            }
+            for slot in range(ROSTER_SIZE)
+        ],
+        "teamId": team_id,
+        "rosterType": "40Man",
+    }
+
+
+def people_stats(query):
+    ids = [int(pid) for pid in query.get("personIds", "").split(",") if pid]
+    season = re.search(r"season=(\d+)", query.get("hydrate", ""))
+    season = season.group(1) if season else "2024"
+    return {"people": [{**person(pid), "stats": stat_groups(pid, season)} for pid in ids]}
+
+
+def search(query):
+    # Names look like "<first> <last> <id>", so the ID can be read back
+    match = re.search(r"(\d+)$", query.get("names", ""))
+    return {"people": [person(int(match.group(1)))] if match else []}
+
+
+def leaders(query):
+    categories = query.get("leaderCategories", "homeRuns").split(",")
+    limit = int(query.get("limit", 10))
+    rng = random.Random(",".join(categories))
+    return {"leagueLeaders": [
+        {
+            "leaderCategory": category,
+            "season": query.get("season", "2024"),
+            "leaders": [
+                {"rank": rank + 1, "value": str(60 - rank), "person": person(player_id(108 + rank % 30, rng.randint(13, 39))),
+                 "team": {"name": f"Team {108 + rank % 30}"}}
+                for rank in range(limit)
+            ],
+        }
+        for category in categories
+    ]}
+
+
+def day_matchups(date):
+    """Every team plays once a day: 15 (away, home) pairs, shuffled by the date."""
+    teams = list(TEAM_IDS)
+    random.Random(date).shuffle(teams)
+    return list(zip(teams[::2], teams[1::2]))
+
+
+def game_pk(date, number):
+    return int(date.replace("-", "")) * 100 + number
+
+
+def game(date, number, away, home):
+    rng = random.Random(game_pk(date, number))
+    final = date < datetime.date.today().isoformat()
+    entry = {
+        "gamePk": game_pk(date, number),
+        "officialDate": date,
+        "status": {"abstractGameState": "Final" if final else "Preview",
+                   "detailedState": "Final" if final else "Scheduled"},
+        "teams": {side: {"team": {"id": team, "name": f"Team {team}"}} for side, team in (("away", away), ("home", home))},
+    }
+    if final:
+        runs = {"away": rng.randint(0, 9), "home": rng.randint(0, 9)}
+        if runs["away"] == runs["home"]:
+            runs["home"] += 1
+        winner, loser = ("away", "home") if runs["away"] > runs["home"] else ("home", "away")
+        sides = {"away": away, "home": home}
+        for side in ("away", "home"):
+            entry["teams"][side]["score"] = runs[side]
+        entry["linescore"] = {"teams": {side: {"runs": runs[side], "hits": runs[side] + rng.randint(2, 7),
+                                                "errors": rng.randint(0, 2)} for side in ("away", "home")}}
+        entry["decisions"] = {"winner": person(player_id(sides[winner], rng.randint(0, 12))),
+                              "loser": person(player_id(sides[loser], rng.randint(0, 12)))}
+    return entry
+
+
+def schedule(query):
+    start = datetime.date.fromisoformat(query.get("startDate") or query.get("date"))
+    end = datetime.date.fromisoformat(query.get("endDate") or start.isoformat())
+    team_id = int(query["teamId"]) if query.get("teamId") else None
+    dates = []
+    day = start
+    while day <= end:
+        date = day.isoformat()
+        games = [game(date, number, away, home) for number, (away, home) in enumerate(day_matchups(date))
+                 if team_id is None or team_id in (away, home)]
+        dates.append({"date": date, "games": games})
+        day += datetime.timedelta(days=1)
+    return {"dates": dates}
+
+
+def boxscore(pk):
+    date = str(pk // 100)
+    date = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+    away, home = day_matchups(date)[pk % 100]
+    rng = random.Random(pk)
+    teams = {}
+    for side, team_id in (("away", away), ("home", home)):
+        starter = player_id(team_id, rng.randint(0, 12))
+        batters = [player_id(team_id, slot) for slot in range(13, 22)]
+        players = {f"ID{pid}": {"person": person(pid), "stats": {"batting": {"homeRuns": rng.choice([0, 0, 0, 1, 2])}}}
+                   for pid in batters}
+        players[f"ID{starter}"] = {"person": person(starter), "stats": {"pitching": {
+            "inningsPitched": f"{rng.randint(3, 8)}.{rng.randint(0, 2)}", "hits": rng.randint(2, 9),
+            "earnedRuns": rng.randint(0, 5), "strikeOuts": rng.randint(2, 12)}}}
+        teams[side] = {"team": {"id": team_id, "name": f"Team {team_id}"}, "players": players, "pitchers": [starter]}
+    return {"teams": teams}
+
+
+def standings(query):
+    rng = random.Random(query.get("season", "2024"))
+    teams = list(TEAM_IDS)
+    rng.shuffle(teams)
+    leagues = query.get("leagueId", "103,104").split(",")
+    records = []
+    for number, division_id in enumerate(DIVISION_IDS):
+        if ("103" if division_id <= 202 else "104") not in leagues:
+            continue
+        wins = sorted((rng.randint(60, 100) for _ in range(5)), reverse=True)
+        records.append({"division": {"id": division_id}, "teamRecords": [
+            {"team": {"id": team_id, "name": f"Team {team_id}"}, "divisionRank": str(rank + 1),
+             "wins": wins[rank], "losses": 162 - wins[rank], "winningPercentage": f"{wins[rank] / 162:.3f}".lstrip("0"),
+             "divisionGamesBack": "-" if rank == 0 else str(wins[0] - wins[rank]),
+             "streak": {"streakCode": f"W{rng.randint(1, 5)}"}}
+            for rank, team_id in enumerate(teams[number * 5:number * 5 + 5])
+        ]})
+    return {"records": records}
+
+
+def response_for(path, query):
+    """
+    Builds a response body for a statsapi path.
+
+    Args:
+        path (str): The URL path, e.g. "/api/v1/teams/113/roster".
+        query (dict): The query string, one value per key.
+
+    Returns:
+        dict: The response body, or None for paths we don't imitate.
+    """
+    match = re.fullmatch(r"/api/v1/teams/(\d+)/roster", path)
+    if match:
+        data = roster(int(match.group(1)))
+        if "stats" in query.get("hydrate", ""):
+            # 'team-stats' asks for every person's season stats inside the roster
+            season = query.get("season", "2024")
+            for entry in data["roster"]:
+                entry["person"]["stats"] = stat_groups(entry["person"]["id"], season)
+        return data
+    match = re.fullmatch(r"/api/v1/people/(\d+)/stats", path)
+    if match:
+        return {"stats": stat_groups(int(match.group(1)), query.get("season", "2024"))}
+    if path == "/api/v1/people":
+        return people_stats(query)
+    if path == "/api/v1/people/search":
+        return search(query)
+    if path == "/api/v1/stats/leaders":
+        return leaders(query)
+    if path == "/api/v1/schedule":
+        return schedule(query)
+    match = re.fullmatch(r"/api/v1/game/(\d+)/boxscore", path)
+    if match:
+        return boxscore(int(match.group(1)))
+    if path == "/api/v1/standings":
+        return standings(query)
+    return None
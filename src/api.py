@@ -1,52 +1,392 @@
-import requests
-from requests.exceptions import RequestException
+import datetime
+import os
+import threading
+from contextlib import contextmanager
 
-def get_roster(team_id):
+from src import cache, client, fields, metrics, streaming
+from src.models import loads
+from src.singleflight import SingleFlight
+
+# Where the MLB API lives. MLB_STATS_API_URL points every call somewhere else,
+# e.g. the replay server in benchmarks/ (read when each URL is built).
+BASE_URL = os.environ.get("MLB_STATS_API_URL", "https://statsapi.mlb.com").rstrip("/")
+
+# How long cached responses stay fresh, in seconds. None means "never expires".
+COMPLETED_SEASON_TTL = None   # Stats for a finished season never change
+CURRENT_SEASON_TTL = 15 * 60  # Current-season stats and leaders move every game
+ROSTER_TTL = 6 * 60 * 60      # Rosters change a few times a week at most
+SEARCH_TTL = 24 * 60 * 60     # A player's ID never changes once we've found it
+
+# The on-disk response cache. It stays off until configure_cache() is called (the CLI does this).
+_cache = None
+
+# Base URL of a running 'serve' process to forward requests to (set by configure_server)
+_server_url = None
+SERVER_TIMEOUT = 30  # Seconds; the server may itself be waiting on the API
+
+# Identical requests made at the same time (by different threads) share one fetch
+_flights = SingleFlight()
+
+# Whether to ask only for the fields the CLI reads (see fields.py). Off until configure_projection() is called.
+_projection = False
+
+class StreamError(Exception):
+    """
+    Raised while reading a streamed response (stream_roster, stream_players) that
+    breaks off or turns out not to be valid JSON. The error has already been printed.
+    """
+
+
+# Set by warming() on the thread that's filling the cache for the 'warm' command
+_warming = threading.local()
+
+
+def configure_cache(cache_dir=None, enabled=True, max_mb=cache.DEFAULT_MAX_CACHE_MB):
+    """
+    Turns the on-disk response cache on or off for every API function.
+
+    Args:
+        cache_dir (str, optional): Folder for the cache file. Defaults to cache.default_cache_dir().
+        enabled (bool, optional): Pass False to turn caching off. Defaults to True.
+        max_mb (float, optional): Size limit in megabytes before old entries are evicted.
+    """
+    global _cache
+
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+    if enabled:
+        _cache = cache.ResponseCache(cache_dir or cache.default_cache_dir(), max_bytes=int(max_mb * 1024 * 1024))
+
+
+def season_ttl(season):
+    """
+    Picks the cache lifetime for season-based data.
+
+    Args:
+        season (int or str): The 4-digit season year.
+
+    Returns:
+        int: CURRENT_SEASON_TTL for this season (or a future one).
+        None: For a completed season, which never needs refetching.
+    """
+    if int(season) < datetime.date.today().year:
+        return COMPLETED_SEASON_TTL
+    return CURRENT_SEASON_TTL
+
+
+def configure_projection(enabled=True):
+    """
+    Turns the 'fields' projection on or off for the functions that support it.
+
+    With it on, get_roster(), get_league_leaders(), search_for_player() and
+    get_player_stats() ask the API for only the keys listed in fields.SPECS,
+    which makes their responses a fraction of the size. Callers that read
+    anything else from those responses should leave it off.
+    """
+    global _projection
+    _projection = enabled
+
+
+def _project(params, spec):
+    """Adds the 'fields' parameter for a response kind (from fields.SPECS) when the projection is on."""
+    if not _projection:
+        return params
+    return {**(params or {}), "fields": fields.projection(fields.SPECS[spec])}
+
+
+@contextmanager
+def warming():
+    """
+    Makes every fetch in the block (on this thread) refresh the cache instead of reading it.
+
+    Even fresh entries are revalidated (a 304 when nothing changed). Refreshed
+    entries keep the API function's own ttl, so a warmed entry goes stale (and
+    is revalidated by the next read) just like one the user fetched. Requests
+    are never forwarded to 'serve' here.
+    """
+    _warming.active = True
+    try:
+        yield
+    finally:
+        _warming.active = False
+
+
+def configure_server(url=None):
+    """
+    Sends every fetch through a running 'serve' process instead of calling the API directly.
+
+    Args:
+        url (str, optional): The server's base URL (e.g., "http://127.0.0.1:8787"). None turns forwarding off.
+    """
+    global _server_url
+    _server_url = url
+
+
+def _forward(url, params=None, ttl=None):
+    """
+    Asks the local 'serve' process for a response body.
+
+    Returns:
+        bytes: The raw JSON body.
+        None: If the server can't be reached. Forwarding is then turned off for
+              the rest of this process and the caller fetches the data itself.
+
+    Raises:
+        requests.exceptions.RequestException: If the server reached the API but the API call failed.
+    """
+    import json
+    from urllib.error import HTTPError, URLError
+    from urllib.parse import urlencode
+    from urllib.request import urlopen
+
+    query = urlencode({"url": url, "params": json.dumps(params or {}), "ttl": "none" if ttl is None else ttl})
+    try:
+        with metrics.timer("forward", metrics.endpoint(url)):
+            with urlopen(f"{_server_url}/fetch?{query}", timeout=SERVER_TIMEOUT) as response:
+                return response.read()
+    except HTTPError as e:
+        if e.code == 502:
+            # The server is fine, the upstream API call failed: report it like a local failure
+            raise client.RequestException(e.read().decode("utf-8", "replace"))
+        configure_server(None)
+        return None
+    except (URLError, OSError):
+        configure_server(None)
+        return None
+
+
+def fetch_body(url, params=None, ttl=None):
+    """
+    Fetches a URL and returns the raw response body, going through the response cache if it's on.
+
+    Fresh cache entries are returned without touching the network. Stale ones are
+    revalidated with If-None-Match / If-Modified-Since, so an unchanged resource
+    only costs a tiny 304 response.
+
+    Args:
+        url (str): The API URL.
+        params (dict, optional): Query string parameters.
+        ttl (float, optional): How long the response stays fresh. None means forever. It's also
+            the oldest cached copy this call accepts: an entry fetched longer ago than ttl is
+            revalidated even if an earlier caller stored it for longer.
+
+    Returns:
+        bytes: The raw JSON body.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    if _cache is None:
+        metrics.emit("cache", "off")
+        response = client.get(url, params=params)
+        return response.content
+
+    warm = getattr(_warming, "active", False)
+    key = cache.make_key(url, params)
+    entry = _cache.get(key)
+    if entry is not None and cache.is_fresh(entry, max_age=ttl) and not warm:
+        metrics.emit("cache", "hit", size=len(entry.body))
+        return entry.body
+
+    # Stale (or missing) entry: ask the server, conditionally if we can
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    response = client.get(url, params=params, headers=headers or None)
+
+    if response.status_code == 304 and entry is not None:
+        # Nothing changed on the server, so our copy is good for another ttl
+        _cache.refresh(key, ttl)
+        metrics.emit("cache", "revalidated", size=len(entry.body))
+        return entry.body
+
+    metrics.emit("cache", "miss" if entry is None else "stale")
+
+    _cache.put(
+        key,
+        response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        ttl=ttl,
+    )
+    return response.content
+
+
+def _fetch_json(url, params=None, ttl=None):
+    """
+    Fetches a URL and parses the JSON body.
+
+    If a 'serve' process is running (see configure_server) it answers from its
+    warm caches; otherwise the data comes from fetch_body() in this process.
+    When several threads ask for the same URL + params at the same moment, only
+    the first one fetches and the others wait for its body. Each caller still
+    parses its own copy, so they never share (and accidentally modify) one dict.
+
+    Args:
+        url (str): The API URL.
+        params (dict, optional): Query string parameters.
+        ttl (float, optional): How long the response stays fresh. None means forever.
+
+    Returns:
+        dict: The parsed JSON response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    return _parse(_load_body(url, params=params, ttl=ttl))
+
+
+def _load_body(url, params=None, ttl=None):
+    """Gets a raw body from the 'serve' process or fetch_body(), one fetch per key at a time."""
+    def load():
+        if _server_url is not None and not getattr(_warming, "active", False):
+            body = _forward(url, params=params, ttl=ttl)
+            if body is not None:
+                return body
+        return fetch_body(url, params=params, ttl=ttl)
+
+    return _flights.do(cache.make_key(url, params), load)
+
+
+def _parse(body):
+    """Parses a JSON body, timing it when metrics are on."""
+    if not metrics.enabled():
+        return loads(body)
+    with metrics.timer("parse", "json", size=len(body)):
+        return loads(body)
+
+
+def _stream_items(url, prefix, error, params=None, ttl=None):
+    """
+    Starts reading the records under a prefix of a response, one at a time (see streaming.py).
+
+    With the cache and the 'serve' process both off, records are parsed straight
+    off the socket while the body downloads, so neither the body nor the whole
+    document is ever held in memory. Otherwise the body is fetched as usual (the
+    cache has to store it whole) and only the parsing is incremental.
+
+    Args:
+        error (str): How a failure partway through is reported, e.g. "Error fetching roster from API".
+
+    Returns:
+        iterator: The records. The request has been made; the records are read lazily,
+                  and reading them raises StreamError if the body breaks off.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    if _cache is None and _server_url is None:
+        metrics.emit("cache", "off")
+        response = client.get(url, params=params, stream=True)
+        # Undo any gzip/deflate as the parser reads, like response.content would
+        response.raw.decode_content = True
+        return _reading(streaming.iter_items(response.raw, prefix), error, response)
+    return _reading(streaming.iter_items(_load_body(url, params=params, ttl=ttl), prefix), error)
+
+
+def _stream_errors():
+    """What reading a streamed body can raise: the connection dropping or a read timing out
+    (from urllib3, since response.raw is read directly) and malformed JSON."""
+    from urllib3.exceptions import HTTPError as TransportError
+
+    return (client.RequestException, TransportError) + streaming.parse_errors()
+
+
+def _reading(records, error, response=None):
+    """
+    Yields the records, then gives the connection back to the pool (also if the caller stops early).
+
+    The request itself succeeded by now, so errors from here on would otherwise escape
+    as tracebacks wherever the records are read; they're reported like any other API
+    error and turned into StreamError.
+    """
+    try:
+        yield from records
+    except _stream_errors() as e:
+        message = str(e).splitlines()[0] if str(e) else type(e).__name__
+        print(f"{error}: {message}")
+        raise StreamError(message) from e
+    finally:
+        if response is not None:
+            response.close()
+
+
+def get_roster(team_id, ttl=ROSTER_TTL):
     """
     Fetches the 40-man roster for a specific team ID from the MLB API.
 
     Args:
         team_id (str or int): The unique ID for the MLB team (e.g., 113 for Reds).
+        ttl (float, optional): How long a cached roster may be used without asking the API,
+            whoever cached it. Pollers ('watch', 'roster --diff') pass 0, so every call
+            revalidates (a cheap 304 when nothing changed).
 
     Returns:
         dict: A dictionary containing the roster data if the API call is successful.
         None: If a network error or HTTP error occurs.
     """
     # Specific API endpoint for a team's roster
-    url = f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
+    url = f"{BASE_URL}/api/v1/teams/{team_id}/roster"
     
     try:
-        # Make the API call
-        response = requests.get(url)
-        
-        # This checks for bad responses (like 404, 500)
-        response.raise_for_status() 
-        
-        # Parse the JSON response and return it
-        return response.json()
+        # Make the API call (through the cache and the shared, pooled session)
+        # and return the parsed JSON response
+        return _fetch_json(url, params=_project(None, "roster"), ttl=ttl)
 
-    except RequestException as e:
+    except client.RequestException as e:
         # This block catches any network-related/HTTP errors (e.g., no internet)
         print(f"Error fetching roster from API: {e}")
         return None
     
-def get_league_leaders(stat_category, season, group="hitting", limit=10):
+def stream_roster(team_id, ttl=ROSTER_TTL):
+    """
+    Like get_roster(), but yields the roster entries one at a time instead of parsing the whole response.
+
+    Returns:
+        iterator: The roster entries ({"person", "jerseyNumber", "position", ...}). Reading
+                  them raises StreamError (already reported) if the response breaks off.
+        None: If the request fails.
+    """
+    url = f"{BASE_URL}/api/v1/teams/{team_id}/roster"
+
+    try:
+        return _stream_items(url, "roster.item", "Error fetching roster from API", params=_project(None, "roster"), ttl=ttl)
+
+    except client.RequestException as e:
+        print(f"Error fetching roster from API: {e}")
+        return None
+
+def get_league_leaders(stat_category, season, group="hitting", limit=10, league_id=None):
     """
-    Fetches the league leaders for a specific stat category and season.
+    Fetches the league leaders for one or more stat categories and a season.
+
+    All categories must belong to the same stat group; the API returns one
+    "leagueLeaders" entry per category, so several stats cost a single request.
 
     Args:
-        stat_category (str): The API-ready stat category (e.g., "homeRuns").
+        stat_category (str or list): The API-ready stat category (e.g., "homeRuns"),
+            or a list of them (e.g., ["homeRuns", "battingAverage"]).
         season (int or str): The 4-digit season year.
         group (str, optional): "hitting" or "pitching". Defaults to "hitting".
-        limit (int, optional): The number of players to return. Defaults to 10.
+        limit (int, optional): The number of players to return per category. Defaults to 10.
+        league_id (int, optional): Only rank players in this league (103 = AL, 104 = NL).
 
     Returns:
         dict: A dictionary containing the leaders data if the API call is successful.
         None: If an error occurs.
     """
     # Define the base URL and the query parameters
-    url = "https://statsapi.mlb.com/api/v1/stats/leaders"
+    url = f"{BASE_URL}/api/v1/stats/leaders"
     
+    if not isinstance(stat_category, str):
+        stat_category = ",".join(stat_category)
+
     params = {
         "leaderCategories": stat_category,
         "season": season,
@@ -54,14 +394,14 @@ def get_league_leaders(stat_category, season, group="hitting", limit=10):
         "limit": limit,
         "sportId": 1  # MLB sport ID
     }
+    if league_id is not None:
+        params["leagueId"] = league_id
 
     # Make the API call
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()  # Check for HTTP errors
-        return response.json()
+        return _fetch_json(url, params=_project(params, "leaders"), ttl=season_ttl(season))
 
-    except RequestException as e:
+    except client.RequestException as e:
         print(f"Error fetching leaders from API: {e}")
         return None
     
@@ -76,7 +416,7 @@ def search_for_player(full_name):
         str: The player's unique ID if found.
         None: If an error occurs or no active player is found.
     """
-    url = "https://statsapi.mlb.com/api/v1/people/search"
+    url = f"{BASE_URL}/api/v1/people/search"
     
     params = {
         "names": full_name.lower(), # The API is case-insensitive, but this is good practice
@@ -85,9 +425,7 @@ def search_for_player(full_name):
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = _fetch_json(url, params=_project(params, "search"), ttl=SEARCH_TTL)
         
         # 'people' is a list. We check if it's not empty.
         if data.get("people"):
@@ -97,7 +435,7 @@ def search_for_player(full_name):
             # No active player found with that name
             return None
 
-    except RequestException as e:
+    except client.RequestException as e:
         print(f"Error searching for player: {e}")
         return None
 
@@ -113,7 +451,7 @@ def get_player_stats(player_id, season):
         dict: A dictionary containing the player's stat data.
         None: If an error occurs.
     """
-    url = f"https://statsapi.mlb.com/api/v1/people/{player_id}/stats"
+    url = f"{BASE_URL}/api/v1/people/{player_id}/stats"
     
     params = {
         "stats": "season",
@@ -123,10 +461,379 @@ def get_player_stats(player_id, season):
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return _fetch_json(url, params=_project(params, "player_stats"), ttl=season_ttl(season))
+
+    except client.RequestException as e:
+        print(f"Error fetching player stats: {e}")
+        return None
+
+# The /people endpoint accepts a list of IDs; this many per request keeps URLs a sensible length
+PEOPLE_CHUNK_SIZE = 50
+
+def get_people_stats(player_ids, season, chunk_size=PEOPLE_CHUNK_SIZE):
+    """
+    Fetches season stats for many players at once using the multi-person endpoint.
+
+    Instead of one /people/{id}/stats call per player, the IDs are sent in chunks
+    to /people?personIds=...&hydrate=stats(...), so 200 players take 4 requests.
+
+    Args:
+        player_ids (iterable): The players' unique IDs.
+        season (int or str): The 4-digit season year.
+        chunk_size (int, optional): How many IDs to send per request.
+
+    Returns:
+        dict: {"people": [...]} where each person has "id", "fullName" and a "stats" list
+              shaped like the one get_player_stats() returns.
+        None: If any of the requests fails.
+    """
+    url = f"{BASE_URL}/api/v1/people"
+
+    # Sort the IDs so the same set of players always hits the same cache entries
+    player_ids = sorted({int(player_id) for player_id in player_ids})
+    people = []
+
+    try:
+        for start in range(0, len(player_ids), chunk_size):
+            chunk = player_ids[start:start + chunk_size]
+            params = {
+                "personIds": ",".join(str(player_id) for player_id in chunk),
+                "hydrate": f"stats(group=[hitting,pitching],type=[season],season={season})",
+                "sportId": 1
+            }
+            data = _fetch_json(url, params=params, ttl=season_ttl(season))
+            people.extend(data.get("people", []))
 
-    except RequestException as e:
+    except client.RequestException as e:
         print(f"Error fetching player stats: {e}")
-        return None
\ No newline at end of file
+        return None
+
+    return {"people": people}
+
+def get_team_roster_stats(team_id, season, roster_type="fullSeason"):
+    """
+    Fetches a team's roster with every player's season stats in a single request.
+
+    The roster endpoint hydrates each person with their stats, so a whole team
+    costs one call instead of a search and a stats call per player.
+
+    Args:
+        team_id (int): The team's unique ID.
+        season (int or str): The 4-digit season year.
+        roster_type (str, optional): "fullSeason" (everyone who played for the team),
+            "40Man" or "active".
+
+    Returns:
+        dict: The roster JSON; each entry's "person" has a "stats" list shaped like the
+              one get_player_stats() returns.
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/teams/{team_id}/roster"
+
+    params = {
+        "rosterType": roster_type,
+        "season": season,
+        "hydrate": f"person(stats(group=[hitting,pitching],type=[season],season={season}))"
+    }
+
+    try:
+        return _fetch_json(url, params=params, ttl=season_ttl(season))
+
+    except client.RequestException as e:
+        print(f"Error fetching team stats: {e}")
+        return None
+
+def get_players(season):
+    """
+    Fetches every MLB player for a season in one request (used to build the local player index).
+
+    Args:
+        season (int or str): The 4-digit season year.
+
+    Returns:
+        dict: {"people": [...]} with one entry per player (id, fullName, active, currentTeam, ...).
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/sports/1/players"
+
+    params = {
+        "season": season
+    }
+
+    try:
+        return _fetch_json(url, params=params, ttl=season_ttl(season))
+
+    except client.RequestException as e:
+        print(f"Error fetching player list: {e}")
+        return None
+
+def stream_players(season):
+    """
+    Like get_players(), but yields the players one at a time, so the league-wide
+    pool (well over a thousand people) is never one big object in memory.
+
+    Returns:
+        iterator: One person dict per player. Reading them raises StreamError (already
+                  reported) if the response breaks off.
+        None: If the request fails.
+    """
+    url = f"{BASE_URL}/api/v1/sports/1/players"
+
+    params = {
+        "season": season
+    }
+
+    try:
+        return _stream_items(url, "people.item", "Error fetching player list", params=params, ttl=season_ttl(season))
+
+    except client.RequestException as e:
+        print(f"Error fetching player list: {e}")
+        return None
+
+def get_player_stat_history(player_id, stat_types="yearByYear,career"):
+    """
+    Fetches a player's whole career in one request: one split per season, plus career totals.
+
+    Args:
+        player_id (str or int): The player's unique ID.
+        stat_types (str, optional): Comma-separated API stat types. Defaults to "yearByYear,career".
+
+    Returns:
+        dict: A dictionary with a "stats" list. Each entry has "type", "group" and "splits";
+              yearByYear splits carry a "season" (and a "team" when the player moved mid-season).
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/people/{player_id}/stats"
+
+    params = {
+        "stats": stat_types,
+        "group": "hitting,pitching",
+        "sportId": 1
+    }
+
+    try:
+        # The current season is part of the history, so this goes stale like current-season stats
+        return _fetch_json(url, params=params, ttl=CURRENT_SEASON_TTL)
+
+    except client.RequestException as e:
+        print(f"Error fetching player stat history: {e}")
+        return None
+
+STATS_PAGE_SIZE = 1000
+
+def get_season_stats_page(group, season, offset=0, limit=STATS_PAGE_SIZE):
+    """
+    Fetches one page of every player's season line for a stat group (the bulk /stats endpoint).
+
+    Args:
+        group (str): "hitting" or "pitching".
+        season (int or str): The 4-digit season year.
+        offset (int, optional): How many splits to skip (for pagination).
+        limit (int, optional): How many splits to return.
+
+    Returns:
+        dict: A dictionary with a "stats" list whose first entry has "totalSplits" and "splits";
+              each split has "player", "team", "league", "position" and "stat".
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/stats"
+
+    params = {
+        "stats": "season",
+        "group": group,
+        "season": season,
+        "playerPool": "all",  # Everyone who played, not just qualified players
+        "sportId": 1,
+        "limit": limit,
+        "offset": offset
+    }
+
+    try:
+        return _fetch_json(url, params=params, ttl=season_ttl(season))
+
+    except client.RequestException as e:
+        print(f"Error fetching season stats: {e}")
+        return None
+
+SCHEDULE_TTL = 60  # Game states and scores on the schedule change during the day
+
+def get_schedule(date):
+    """
+    Fetches every MLB game scheduled on a date.
+
+    Args:
+        date (str): The date as YYYY-MM-DD.
+
+    Returns:
+        dict: A dictionary with a "dates" list; each date has a "games" list with
+              "gamePk", "status" and "teams".
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/schedule"
+
+    params = {
+        "sportId": 1,
+        "date": date
+    }
+
+    try:
+        return _fetch_json(url, params=params, ttl=SCHEDULE_TTL)
+
+    except client.RequestException as e:
+        print(f"Error fetching schedule: {e}")
+        return None
+
+def _keep_forever(url, params=None):
+    """Marks a cached response as never expiring (finished games can't change any more)."""
+    if _cache is not None:
+        _cache.refresh(cache.make_key(url, params), None)
+
+def get_schedule_range(start_date, end_date, team_id=None, hydrate="linescore,decisions"):
+    """
+    Fetches every game between two dates (inclusive) in a single request.
+
+    With the default hydrations each game already carries its line score
+    (runs, hits, errors) and the winning/losing pitchers, so listing a month
+    of results needs no box scores at all. Once every game in the range is
+    final the response is cached for good.
+
+    Args:
+        start_date (str): The first date, as YYYY-MM-DD.
+        end_date (str): The last date, as YYYY-MM-DD.
+        team_id (int, optional): Only this team's games.
+        hydrate (str, optional): Extra data to attach to each game.
+
+    Returns:
+        dict: A dictionary with a "dates" list; each date has a "games" list.
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/schedule"
+
+    params = {
+        "sportId": 1,
+        "startDate": start_date,
+        "endDate": end_date
+    }
+    if team_id is not None:
+        params["teamId"] = team_id
+    if hydrate:
+        params["hydrate"] = hydrate
+
+    try:
+        data = _fetch_json(url, params=params, ttl=SCHEDULE_TTL)
+
+    except client.RequestException as e:
+        print(f"Error fetching schedule: {e}")
+        return None
+
+    games = [game for date in data.get("dates", []) for game in date.get("games", [])]
+    if games and all((game.get("status") or {}).get("abstractGameState") == "Final" for game in games):
+        _keep_forever(url, params)
+    return data
+
+def get_standings(season, league_ids=(103, 104), standings_type="regularSeason"):
+    """
+    Fetches the division standings for a season.
+
+    Args:
+        season (int or str): The 4-digit season year.
+        league_ids (iterable, optional): League IDs (103 = AL, 104 = NL). Defaults to both.
+        standings_type (str, optional): e.g. "regularSeason", "wildCard" or "springTraining".
+
+    Returns:
+        dict: A dictionary with a "records" list, one per division, each with "teamRecords".
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/standings"
+
+    params = {
+        "leagueId": ",".join(str(league_id) for league_id in league_ids),
+        "season": season,
+        "standingsTypes": standings_type,
+        "hydrate": "team,division"
+    }
+
+    try:
+        return _fetch_json(url, params=params, ttl=season_ttl(season))
+
+    except client.RequestException as e:
+        print(f"Error fetching standings: {e}")
+        return None
+
+LIVE_BOXSCORE_TTL = 30  # A game in progress changes every pitch
+
+def get_boxscore(game_pk, final=False):
+    """
+    Fetches a game's box score.
+
+    Args:
+        game_pk (int): The game's unique ID.
+        final (bool, optional): True if the game is over, so the box score is cached for good.
+
+    Returns:
+        dict: The box score, with "teams" -> "away"/"home" -> "teamStats", "players", "pitchers", ...
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1/game/{game_pk}/boxscore"
+
+    try:
+        return _fetch_json(url, ttl=None if final else LIVE_BOXSCORE_TTL)
+
+    except client.RequestException as e:
+        print(f"Error fetching box score for game {game_pk}: {e}")
+        return None
+
+def _get_live_json(url, params=None):
+    """
+    Fetches live game data straight from the API.
+
+    Live data changes every few seconds, so it skips the response cache (and
+    the 'serve' process) instead of writing hundreds of KB to disk per update.
+    """
+    return _parse(client.get(url, params=params).content)
+
+def get_live_feed(game_pk):
+    """
+    Fetches the full live feed of a game (the whole game state, often several hundred KB).
+
+    Args:
+        game_pk (int): The game's unique ID (gamePk on the schedule).
+
+    Returns:
+        dict: The live feed, with "metaData" (including "timeStamp"), "gameData" and "liveData".
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1.1/game/{game_pk}/feed/live"
+
+    try:
+        return _get_live_json(url)
+
+    except client.RequestException as e:
+        print(f"Error fetching live feed for game {game_pk}: {e}")
+        return None
+
+def get_live_diff(game_pk, start_timecode):
+    """
+    Fetches only what changed in a game's live feed since a timecode.
+
+    Args:
+        game_pk (int): The game's unique ID.
+        start_timecode (str): The "metaData.timeStamp" of the state we already have.
+
+    Returns:
+        list: JSON Patch sets ([{"diff": [operations]}, ...]); empty if nothing changed.
+        dict: The full live feed, when the API decides a patch would be too big.
+        None: If an error occurs.
+    """
+    url = f"{BASE_URL}/api/v1.1/game/{game_pk}/feed/live/diffPatch"
+
+    params = {
+        "startTimecode": start_timecode
+    }
+
+    try:
+        return _get_live_json(url, params=params)
+
+    except client.RequestException as e:
+        print(f"Error fetching live updates for game {game_pk}: {e}")
+        return None
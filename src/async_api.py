@@ -0,0 +1,151 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from src import api, client
+from src.singleflight import AsyncSingleFlight
+
+# How many API calls may be in flight at once by default
+DEFAULT_CONCURRENCY = 16
+
+
+def _hashable(value):
+    """
+    Turns an argument into something that can be part of a single-flight key.
+
+    API functions accept lists (e.g., several leader categories), which can't be
+    dict keys; they become tuples (in order, since the order changes the request).
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
+
+
+class AsyncAPI:
+    """
+    Coroutine versions of the functions in src/api.py with bounded concurrency.
+
+    Every call still goes through the regular sync functions, so it shares the
+    pooled session, the retry/backoff logic and the response cache. The calls
+    run on a private thread pool while a semaphore caps how many are in flight.
+
+    Example:
+        async with AsyncAPI(concurrency=30) as mlb:
+            rosters = await mlb.gather(mlb.get_roster(team_id) for team_id in TEAM_MAP.values())
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, per_host_limit=None):
+        """
+        Args:
+            concurrency (int, optional): Max number of calls in flight at once.
+            per_host_limit (int, optional): Pooled connections to keep for statsapi.mlb.com (the
+                shared pool only grows). Defaults to the concurrency, so every in-flight call can
+                reuse a connection.
+        """
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mlb-api")
+        self._semaphore = None
+        self._loop = None
+        self._flights = AsyncSingleFlight()
+
+        client.grow_pool(per_host_limit or concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shuts down the worker threads (waits for calls that are still running)."""
+        self._executor.shutdown(wait=True)
+
+    def _get_semaphore(self):
+        """Returns the semaphore for the running event loop (a semaphore can't be shared across loops)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def _call(self, func, *args, **kwargs):
+        """
+        Runs one sync API function on the thread pool once a concurrency slot is free.
+
+        Identical calls awaited at the same time share one run (and one slot).
+        """
+        key = (func, _hashable(args), _hashable(kwargs))
+        return await self._flights.do(key, lambda: self._run(func, *args, **kwargs))
+
+    async def _run(self, func, *args, **kwargs):
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def gather(self, coros):
+        """
+        Runs many calls concurrently and returns their results in the same order.
+
+        Args:
+            coros (iterable): Coroutines from this object's methods.
+
+        Returns:
+            list: One result per coroutine (None for calls that failed, like the sync API).
+        """
+        return await asyncio.gather(*coros)
+
+    async def get_roster(self, team_id):
+        """Async version of api.get_roster()."""
+        return await self._call(api.get_roster, team_id)
+
+    async def get_league_leaders(self, stat_category, season, group="hitting", limit=10, league_id=None):
+        """Async version of api.get_league_leaders()."""
+        return await self._call(
+            api.get_league_leaders, stat_category, season, group=group, limit=limit, league_id=league_id
+        )
+
+    async def search_for_player(self, full_name):
+        """Async version of api.search_for_player()."""
+        return await self._call(api.search_for_player, full_name)
+
+    async def get_player_stats(self, player_id, season):
+        """Async version of api.get_player_stats()."""
+        return await self._call(api.get_player_stats, player_id, season)
+
+
+# Shared instance behind the module-level coroutines below
+_default = None
+
+
+def _get_default():
+    """Creates the shared AsyncAPI on first use."""
+    global _default
+    if _default is None:
+        _default = AsyncAPI()
+    return _default
+
+
+async def get_roster(team_id):
+    """Async version of api.get_roster() using the shared AsyncAPI."""
+    return await _get_default().get_roster(team_id)
+
+
+async def get_league_leaders(stat_category, season, group="hitting", limit=10, league_id=None):
+    """Async version of api.get_league_leaders() using the shared AsyncAPI."""
+    return await _get_default().get_league_leaders(
+        stat_category, season, group=group, limit=limit, league_id=league_id
+    )
+
+
+async def search_for_player(full_name):
+    """Async version of api.search_for_player() using the shared AsyncAPI."""
+    return await _get_default().search_for_player(full_name)
+
+
+async def get_player_stats(player_id, season):
+    """Async version of api.get_player_stats() using the shared AsyncAPI."""
+    return await _get_default().get_player_stats(player_id, season)
@@ -0,0 +1,193 @@
+import os
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlencode
+
+# Where the cache lives unless --cache-dir (or the environment variable) says otherwise
+CACHE_DIR_ENV = "MLB_STATS_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mlb-stats-cli")
+DEFAULT_MAX_CACHE_MB = 100
+CACHE_FILENAME = "responses.sqlite3"
+
+# One cached response. expires_at is None for data that never changes (completed seasons).
+# stored_at is when the body was last fetched or revalidated (None in caches written
+# before it was recorded).
+CacheEntry = namedtuple("CacheEntry", ["body", "etag", "last_modified", "expires_at", "stored_at"], defaults=(None,))
+
+
+def default_cache_dir():
+    """Returns the cache directory from the environment, or the default under the home folder."""
+    return os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+
+
+def make_key(url, params=None):
+    """
+    Builds the cache key for a request.
+
+    Params are sorted so {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry.
+
+    Args:
+        url (str): The request URL.
+        params (dict, optional): The query string parameters.
+
+    Returns:
+        str: The cache key (the full URL with a normalised query string).
+    """
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def is_fresh(entry, now=None, max_age=None):
+    """
+    Checks whether a cache entry can be used without asking the server again.
+
+    Args:
+        entry (CacheEntry): The entry.
+        now (float, optional): The current time.
+        max_age (float, optional): The caller's own ttl. An entry fetched this many seconds
+                                   ago or more is stale even if whoever stored it allowed longer
+                                   (a poller passing 0 always revalidates). Entries that never
+                                   expire hold data that can't change, so they stay fresh.
+    """
+    if entry.expires_at is None:
+        return True
+    now = now or time.time()
+    if max_age is not None and (entry.stored_at is None or now - entry.stored_at >= max_age):
+        return False
+    return now < entry.expires_at
+
+
+class ResponseCache:
+    """
+    A persistent HTTP response cache stored in a single SQLite file.
+
+    Entries are keyed by URL + params and evicted least-recently-used first
+    once the file grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_CACHE_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        """Opens the database on first use, so just creating the cache never touches disk."""
+        if self._conn is None:
+            import sqlite3
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, CACHE_FILENAME)
+            # check_same_thread=False because worker threads share this connection (we lock ourselves)
+            self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+            # Cache files from before stored_at was recorded get the column (NULL: age unknown)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "stored_at" not in columns:
+                self._conn.execute("ALTER TABLE responses ADD COLUMN stored_at REAL")
+        return self._conn
+
+    def get(self, key):
+        """
+        Looks up a cached response (fresh or stale) and marks it as recently used.
+
+        Args:
+            key (str): A key built with make_key().
+
+        Returns:
+            CacheEntry: The cached response.
+            None: If nothing is stored under this key.
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires_at, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        return CacheEntry(*row)
+
+    def put(self, key, body, etag=None, last_modified=None, ttl=None):
+        """
+        Stores a response body.
+
+        Args:
+            key (str): A key built with make_key().
+            body (bytes): The raw response body.
+            etag (str, optional): The response's ETag header, used to revalidate later.
+            last_modified (str, optional): The response's Last-Modified header.
+            ttl (float, optional): Seconds until the entry goes stale. None means never.
+        """
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, expires_at, last_access, size, stored_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, expires_at, now, len(body), now),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def refresh(self, key, ttl=None):
+        """Gives an entry a new lease of life after the server answered 304 Not Modified."""
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ?, stored_at = ? WHERE key = ?",
+                (expires_at, now, now, key),
+            )
+            conn.commit()
+
+    def clear(self):
+        """Removes every cached response."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def close(self):
+        """Closes the database connection (it is reopened if the cache is used again)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict(self, conn):
+        """Deletes least-recently-used entries until the cache fits in max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
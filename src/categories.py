@@ -0,0 +1,105 @@
+from collections import namedtuple
+
+# One leaderboard stat: the code users type, the API's "leaderCategories" name,
+# the stat group it belongs to and a readable label. For answering from a local
+# snapshot we also need the matching field in the season stat line, whether
+# lower is better (ERA) and whether it's a rate stat that needs a minimum of
+# plate appearances / innings to qualify.
+Category = namedtuple(
+    "Category", ["code", "api_name", "group", "label", "field", "ascending", "rate"], defaults=(None, False, False)
+)
+
+# Every stat the 'leaders' command knows about. Codes are unique, so a code like
+# "SO" always means the same thing (pitcher strikeouts, as it always has).
+CATEGORIES = {
+    category.code: category
+    for category in [
+        # Hitting
+        Category("HR", "homeRuns", "hitting", "Home Runs", "homeRuns"),
+        Category("AVG", "battingAverage", "hitting", "Batting Average", "avg", rate=True),
+        Category("RBI", "runsBattedIn", "hitting", "Runs Batted In", "rbi"),
+        Category("H", "hits", "hitting", "Hits", "hits"),
+        Category("SB", "stolenBases", "hitting", "Stolen Bases", "stolenBases"),
+        Category("R", "runs", "hitting", "Runs", "runs"),
+        Category("2B", "doubles", "hitting", "Doubles", "doubles"),
+        Category("3B", "triples", "hitting", "Triples", "triples"),
+        Category("XBH", "extraBaseHits", "hitting", "Extra-Base Hits"),
+        Category("TB", "totalBases", "hitting", "Total Bases", "totalBases"),
+        Category("BB", "walks", "hitting", "Walks", "baseOnBalls"),
+        Category("IBB", "intentionalWalks", "hitting", "Intentional Walks", "intentionalWalks"),
+        Category("HBP", "hitByPitches", "hitting", "Hit By Pitch", "hitByPitch"),
+        Category("OBP", "onBasePercentage", "hitting", "On-Base Percentage", "obp", rate=True),
+        Category("SLG", "sluggingPercentage", "hitting", "Slugging Percentage", "slg", rate=True),
+        Category("OPS", "onBasePlusSlugging", "hitting", "On-Base Plus Slugging", "ops", rate=True),
+        Category("AB", "atBats", "hitting", "At Bats", "atBats"),
+        Category("PA", "totalPlateAppearances", "hitting", "Plate Appearances", "plateAppearances"),
+        Category("G", "gamesPlayed", "hitting", "Games Played", "gamesPlayed"),
+        Category("SF", "sacrificeFlies", "hitting", "Sacrifice Flies", "sacFlies"),
+        Category("CS", "caughtStealing", "hitting", "Caught Stealing", "caughtStealing"),
+        Category("GIDP", "groundIntoDoublePlays", "hitting", "Grounded Into Double Plays", "groundIntoDoublePlay"),
+        # Pitching
+        Category("SO", "strikeouts", "pitching", "Strikeouts", "strikeOuts"),
+        Category("ERA", "earnedRunAverage", "pitching", "Earned Run Average", "era", ascending=True, rate=True),
+        Category("W", "wins", "pitching", "Wins", "wins"),
+        Category("L", "losses", "pitching", "Losses", "losses"),
+        Category("SV", "saves", "pitching", "Saves", "saves"),
+        Category("HLD", "holds", "pitching", "Holds", "holds"),
+        Category("BS", "blownSaves", "pitching", "Blown Saves", "blownSaves"),
+        Category("WHIP", "walksAndHitsPerInningPitched", "pitching", "Walks + Hits per Inning", "whip", ascending=True, rate=True),
+        Category("IP", "inningsPitched", "pitching", "Innings Pitched", "inningsPitched"),
+        Category("GS", "gamesStarted", "pitching", "Games Started", "gamesStarted"),
+        Category("CG", "completeGames", "pitching", "Complete Games", "completeGames"),
+        Category("SHO", "shutouts", "pitching", "Shutouts", "shutouts"),
+        Category("K9", "strikeoutsPer9Inn", "pitching", "Strikeouts per 9 Innings", "strikeoutsPer9Inn", rate=True),
+        Category("BB9", "walksPer9Inn", "pitching", "Walks per 9 Innings", "walksPer9Inn", ascending=True, rate=True),
+        Category("H9", "hitsPer9Inn", "pitching", "Hits per 9 Innings", "hitsPer9Inn", ascending=True, rate=True),
+        Category("KBB", "strikeoutWalkRatio", "pitching", "Strikeout-to-Walk Ratio", "strikeoutWalkRatio", rate=True),
+        Category("WPCT", "winPercentage", "pitching", "Winning Percentage", "winPercentage", rate=True),
+    ]
+}
+
+# The API's league IDs for --league
+LEAGUES = {"AL": 103, "NL": 104}
+
+
+def resolve(text):
+    """
+    Turns a comma-separated list of stat codes into categories.
+
+    Codes are case-insensitive, and the API's own names ("onBasePlusSlugging")
+    work too. Duplicates are dropped, keeping the first occurrence.
+
+    Args:
+        text (str): E.g. "HR,AVG,RBI,ERA".
+
+    Returns:
+        tuple: (list of Category in the order given, list of codes that weren't recognised).
+    """
+    by_api_name = {category.api_name.lower(): category for category in CATEGORIES.values()}
+
+    categories = []
+    unknown = []
+    for code in filter(None, (part.strip() for part in text.split(","))):
+        category = CATEGORIES.get(code.upper()) or by_api_name.get(code.lower())
+        if category is None:
+            unknown.append(code)
+        elif category not in categories:
+            categories.append(category)
+    return categories, unknown
+
+
+def by_group(categories):
+    """
+    Splits categories by stat group, so each group can be fetched with one request.
+
+    Args:
+        categories (list): Category tuples.
+
+    Returns:
+        dict: {"hitting": [...], "pitching": [...]} with only the groups that are used,
+            in the order they first appear.
+    """
+    groups = {}
+    for category in categories:
+        groups.setdefault(category.group, []).append(category)
+    return groups
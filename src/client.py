@@ -0,0 +1,316 @@
+import random
+import threading
+import time
+
+from src import metrics
+
+# 'requests' is imported inside the functions that need it, so commands that never
+# touch the network (--help, bad arguments, cache hits) don't pay for loading it.
+
+# Default tuning for the shared session. These can be changed at runtime with configure().
+DEFAULT_POOL_SIZE = 10          # Max keep-alive connections kept open per host
+DEFAULT_TIMEOUT = (3.05, 15)    # (connect timeout, read timeout) in seconds
+DEFAULT_RETRIES = 3             # Extra attempts after the first one fails
+DEFAULT_BACKOFF = 0.5           # Base delay (seconds) for exponential backoff
+MAX_BACKOFF = 30                # Never sleep longer than this between attempts
+
+# HTTP status codes that are worth retrying (rate limited or server-side trouble)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_settings = {
+    "pool_size": DEFAULT_POOL_SIZE,
+    "timeout": DEFAULT_TIMEOUT,
+    "retries": DEFAULT_RETRIES,
+    "backoff": DEFAULT_BACKOFF,
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+# Adapters replaced by grow_pool(). Requests that started before still use them,
+# so they're only closed along with the session.
+_retired_adapters = []
+
+# Optional src.ratelimit.RateLimiter; every attempt (retries included) waits for a slot
+_rate_limiter = None
+
+
+def __getattr__(name):
+    """
+    Makes client.RequestException available without importing requests up front.
+
+    Callers write 'except client.RequestException', and Python only evaluates
+    that expression when an exception is actually raised.
+    """
+    if name == "RequestException":
+        from requests.exceptions import RequestException
+        return RequestException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def configure(pool_size=None, timeout=None, retries=None, backoff=None):
+    """
+    Changes the settings used by the shared HTTP session.
+
+    Any argument left as None keeps its current value. Changing the pool size
+    closes the current session so the next request builds a new one, so only do
+    that at startup; use grow_pool() once requests may be running.
+
+    Args:
+        pool_size (int, optional): Max number of pooled connections per host.
+        timeout (float or tuple, optional): Per-request timeout in seconds, or (connect, read).
+        retries (int, optional): How many times to retry a failed request.
+        backoff (float, optional): Base delay in seconds for exponential backoff.
+    """
+    global _session
+
+    with _session_lock:
+        if pool_size is not None and pool_size != _settings["pool_size"]:
+            _settings["pool_size"] = pool_size
+            if _session is not None:
+                _session.close()
+                _session = None
+        if timeout is not None:
+            _settings["timeout"] = timeout
+        if retries is not None:
+            _settings["retries"] = retries
+        if backoff is not None:
+            _settings["backoff"] = backoff
+
+
+def grow_pool(pool_size):
+    """
+    Makes sure the shared session can keep at least pool_size connections per host.
+
+    Unlike configure(), this never closes the session: other threads (serve
+    handlers, an AsyncAPI executor) may be using it right now. A bigger pool is
+    mounted on the live session instead, and requests already running finish on
+    the old one.
+
+    Args:
+        pool_size (int): The number of pooled connections needed, e.g. one per worker.
+    """
+    with _session_lock:
+        if pool_size <= _settings["pool_size"]:
+            return
+        _settings["pool_size"] = pool_size
+        if _session is not None:
+            _retired_adapters.append(_session.get_adapter("https://"))
+            _mount(_session, pool_size)
+
+
+def configure_rate_limit(rate=None, burst=None, path=None):
+    """
+    Turns the client-side rate limit on (or off with rate=None).
+
+    Args:
+        rate (float, optional): Requests per second; None removes the limit.
+        burst (int, optional): Requests allowed back to back (default: one second's worth).
+        path (str, optional): Lockfile shared by every process that should use the same budget.
+
+    Returns:
+        RateLimiter: The new limiter, or None when the limit is off.
+    """
+    global _rate_limiter
+
+    if rate is None:
+        _rate_limiter = None
+    else:
+        from src.ratelimit import RateLimiter
+        _rate_limiter = RateLimiter(rate, burst=burst, path=path)
+    return _rate_limiter
+
+
+def get_rate_limiter():
+    """Returns the active RateLimiter, or None."""
+    return _rate_limiter
+
+
+def get_session():
+    """
+    Returns the shared requests.Session, creating it on first use.
+
+    The session keeps connections to statsapi.mlb.com alive between calls, so
+    only the first request pays for the TCP + TLS handshake.
+
+    Returns:
+        requests.Session: The pooled session used by every API call.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = _build_session(_settings["pool_size"])
+        return _session
+
+
+def close_session():
+    """Closes the shared session and its pooled connections (if one was created)."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        while _retired_adapters:
+            _retired_adapters.pop().close()
+
+
+def accept_encoding():
+    """
+    The Accept-Encoding header we send: every compression we can decode, best first.
+
+    gzip and deflate are always decoded by urllib3. Brotli ("br") compresses JSON
+    noticeably better, but urllib3 can only decode it with the brotli (or
+    brotlicffi) package installed, so it's offered only then.
+    """
+    encodings = ["gzip", "deflate"]
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        encodings.insert(0, "br")
+        break
+    return ", ".join(encodings)
+
+
+def wire_size(response):
+    """
+    Returns how many body bytes actually came over the network (before decompression).
+
+    Returns:
+        int: The compressed size, or None if it isn't known (e.g., a body that hasn't been read).
+    """
+    try:
+        size = response.raw.tell()
+    except AttributeError:
+        return None
+    return size if isinstance(size, int) else None
+
+
+def _build_session(pool_size):
+    """Creates a new session with a connection pool of the given size."""
+    import requests
+
+    session = requests.Session()
+    _mount(session, pool_size)
+    session.headers.update({"User-Agent": "MLB-Stats-CLI", "Accept-Encoding": accept_encoding()})
+    return session
+
+
+def _mount(session, pool_size):
+    """Gives a session a new connection pool of the given size."""
+    from requests.adapters import HTTPAdapter
+
+    # We do our own retries below, so the adapter should not retry on its own
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _retry_after(response):
+    """
+    Reads the Retry-After header of a response.
+
+    Returns:
+        float: The number of seconds the server asked us to wait.
+        None: If the header is missing or can't be understood.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    # The header is either a number of seconds or an HTTP date
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    import email.utils
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _backoff_delay(attempt):
+    """Exponential backoff with "full jitter" so parallel jobs don't retry in lockstep."""
+    ceiling = min(MAX_BACKOFF, _settings["backoff"] * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+def get(url, params=None, headers=None, stream=False):
+    """
+    Sends a GET request through the shared session, retrying when it makes sense.
+
+    Connection errors, timeouts, 429s and 5xx responses are retried with jittered
+    exponential backoff. If the server sends a Retry-After header we wait that
+    long instead (capped at MAX_BACKOFF).
+
+    Args:
+        url (str): The URL to request.
+        params (dict, optional): Query string parameters.
+        headers (dict, optional): Extra headers for this request only.
+        stream (bool, optional): Return as soon as the headers arrive and leave the body
+                                 to be read from response.raw (close the response when done).
+
+    Returns:
+        requests.Response: The successful response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request still fails after all retries.
+    """
+    from requests.exceptions import ConnectionError, Timeout
+
+    session = get_session()
+    retries = _settings["retries"]
+    name = metrics.endpoint(url) if metrics.enabled() else None
+
+    for attempt in range(retries + 1):
+        # Queue for our share of the request budget instead of getting throttled upstream
+        if _rate_limiter is not None:
+            waited = _rate_limiter.acquire()
+            if waited and name:
+                metrics.emit("ratelimit", name, waited)
+        started = time.perf_counter()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=_settings["timeout"], stream=stream)
+        except (ConnectionError, Timeout) as e:
+            if name:
+                metrics.emit("error", name, time.perf_counter() - started, error=type(e).__name__, attempt=attempt)
+            if attempt >= retries:
+                raise
+            if name:
+                metrics.emit("retry", name, reason=type(e).__name__)
+            time.sleep(_backoff_delay(attempt))
+            continue
+
+        if name:
+            # Reading the body here just moves the download into the timing (callers read it anyway);
+            # "ttfb" (until the headers were parsed) vs. the total separates server time from transfer
+            # (A streamed body hasn't been read yet, so its size isn't known here)
+            size = len(response.content) if response.status_code < 400 and not stream else 0
+            wire = wire_size(response) if size else None
+            metrics.emit(
+                "request", name, time.perf_counter() - started, size,
+                status=response.status_code, attempt=attempt, ttfb=response.elapsed.total_seconds(),
+                wire=size if wire is None else wire, encoding=response.headers.get("Content-Encoding", "identity")
+            )
+
+        if response.status_code in RETRY_STATUSES and attempt < retries:
+            if name:
+                metrics.emit("retry", name, reason=str(response.status_code))
+            delay = _retry_after(response)
+            if delay is None:
+                delay = _backoff_delay(attempt)
+            # Give the connection back to the pool before sleeping
+            response.close()
+            time.sleep(min(delay, MAX_BACKOFF))
+            continue
+
+        # This checks for bad responses (like 404, or a 5xx we gave up on)
+        response.raise_for_status()
+        return response
@@ -0,0 +1,169 @@
+import csv
+import json
+import sys
+
+# Output formats every command accepts. "text" is the normal human-readable output.
+FORMATS = ("text", "json", "ndjson", "csv", "parquet")
+
+# Rows are handed to pyarrow in batches of this size (one Parquet row group each)
+PARQUET_BATCH_SIZE = 5000
+
+
+class ExportError(Exception):
+    """Raised when an export can't be started (e.g., Parquet without pyarrow)."""
+
+
+class RowWriter:
+    """
+    Base class for the streaming writers: rows go out as soon as write() is called.
+
+    Use it as a context manager so the output is finished (closing brackets,
+    Parquet footer) and the file is closed even if the command fails halfway.
+    """
+
+    def __init__(self, stream, fields):
+        self.stream = stream
+        self.fields = list(fields)
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, row):
+        """Writes one row (a dict of field -> value)."""
+        self.count += 1
+        self._write(row)
+
+    def _write(self, row):
+        raise NotImplementedError
+
+    def flush(self):
+        """Pushes the rows written so far to the output (for long-running commands like 'watch')."""
+        self.stream.flush()
+
+    def close(self):
+        """Finishes the output and closes the file (stdout is only flushed)."""
+        self.stream.flush()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
+class NDJSONWriter(RowWriter):
+    """One JSON object per line."""
+
+    def _write(self, row):
+        self.stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class JSONWriter(RowWriter):
+    """A single JSON array, written one element at a time so nothing is buffered."""
+
+    def _write(self, row):
+        self.stream.write("[\n" if self.count == 1 else ",\n")
+        self.stream.write(json.dumps(row, ensure_ascii=False))
+
+    def close(self):
+        self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+        super().close()
+
+
+class CSVWriter(RowWriter):
+    """CSV with a header row. Fields a row doesn't have are left empty."""
+
+    def __init__(self, stream, fields):
+        super().__init__(stream, fields)
+        self._writer = csv.DictWriter(stream, fieldnames=self.fields, extrasaction="ignore", restval="")
+        self._writer.writeheader()
+
+    def _write(self, row):
+        self._writer.writerow(row)
+
+
+class ParquetWriter(RowWriter):
+    """
+    Parquet output through pyarrow (an optional dependency).
+
+    Rows are collected into batches of PARQUET_BATCH_SIZE and each batch is
+    written as its own row group, so memory stays bounded on big exports.
+    """
+
+    def __init__(self, path, fields):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ExportError("Parquet output needs pyarrow (pip install pyarrow).")
+        if not path:
+            raise ExportError("Parquet output is binary; use --output PATH.")
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._path = path
+        self._writer = None
+        self._batch = []
+        self.fields = list(fields)
+        self.count = 0
+
+    def _write(self, row):
+        self._batch.append(row)
+        if len(self._batch) >= PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self._batch:
+            return
+        columns = {field: [row.get(field) for row in self._batch] for field in self.fields}
+        table = self._pa.table(columns)
+        if self._writer is None:
+            # The first batch decides the column types. A column that is empty all through
+            # it (e.g., 'outs' before a game starts) would get the null type, which no
+            # later value fits, so it's stored as text instead.
+            schema = self._pa.schema([
+                field.with_type(self._pa.string()) if self._pa.types.is_null(field.type) else field
+                for field in table.schema
+            ])
+            self._writer = self._pq.ParquetWriter(self._path, schema, compression="zstd")
+        table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+        self._batch = []
+
+    def flush(self):
+        # Nothing in a Parquet file can be read before close() writes the footer, so
+        # there's no point in writing a tiny row group on every update of 'live' or
+        # 'watch'. Keeping the rows together also lets the whole batch decide the types.
+        pass
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_writer(fmt, fields, path=None):
+    """
+    Creates the writer for an output format.
+
+    Args:
+        fmt (str): One of FORMATS except "text".
+        fields (list): The column names, in order (used for the CSV header and Parquet columns).
+        path (str, optional): File to write to. Defaults to stdout.
+
+    Returns:
+        RowWriter: The writer (use it in a 'with' block).
+
+    Raises:
+        ExportError: If the format can't be used.
+    """
+    if fmt == "parquet":
+        return ParquetWriter(path, fields)
+
+    writers = {"json": JSONWriter, "ndjson": NDJSONWriter, "csv": CSVWriter}
+    if fmt not in writers:
+        raise ExportError(f"Unknown output format '{fmt}'.")
+
+    # newline="" stops the csv module from doubling line endings on Windows
+    stream = open(path, "w", encoding="utf-8", newline="") if path else sys.stdout
+    return writers[fmt](stream, fields)
@@ -0,0 +1,34 @@
+from src.models import HITTING_FIELDS, PITCHING_FIELDS
+
+# What the CLI actually reads from each kind of response, as dotted paths. The
+# API's 'fields' parameter keeps only the keys it names (at any depth), so every
+# key along each path is requested; everything else is left out of the response.
+# When a printer or exporter starts reading another key, add its path here.
+SPECS = {
+    # print_roster(), roster --diff and watch (RosterEntry)
+    "roster": (
+        "roster.person.id", "roster.person.fullName", "roster.jerseyNumber",
+        "roster.position.name", "roster.status.description",
+    ),
+    # leaders (fetch_leaders() and LeaderEntry)
+    "leaders": (
+        "leagueLeaders.leaderCategory", "leagueLeaders.leaders.rank", "leagueLeaders.leaders.value",
+        "leagueLeaders.leaders.person.id", "leagueLeaders.leaders.person.fullName", "leagueLeaders.leaders.team.name",
+    ),
+    # stats, when the local index can't resolve a name
+    "search": ("people.id",),
+    # stats and stats --seasons (parse_stat_groups() and SeasonStatLine)
+    "player_stats": (
+        "stats.type.displayName", "stats.group.displayName", "stats.splits.season", "stats.splits.team.name",
+    ) + tuple(f"stats.splits.stat.{field}" for field in dict.fromkeys(HITTING_FIELDS + PITCHING_FIELDS)),
+}
+
+
+def projection(paths):
+    """
+    Turns dotted paths into the API's 'fields' parameter.
+
+    Example:
+        projection(["roster.person.fullName", "roster.jerseyNumber"]) -> "roster,person,fullName,jerseyNumber"
+    """
+    return ",".join(dict.fromkeys(part for path in paths for part in path.split(".")))
@@ -0,0 +1,127 @@
+# Division IDs used by the standings endpoint
+DIVISIONS = {
+    200: "AL West",
+    201: "AL East",
+    202: "AL Central",
+    203: "NL West",
+    204: "NL East",
+    205: "NL Central",
+}
+
+GAME_FIELDS = [
+    "date", "game_pk", "status", "away", "home", "away_score", "home_score",
+    "away_hits", "home_hits", "away_errors", "home_errors", "winner", "loser", "save",
+]
+
+STANDINGS_FIELDS = ["division", "rank", "team", "wins", "losses", "pct", "games_back", "streak"]
+
+
+def team_code(team, team_codes):
+    """Returns our code for a team object ({"id", "name"}), falling back to its abbreviation or name."""
+    return team_codes.get(team.get("id")) or team.get("abbreviation") or team.get("name", "?")
+
+
+def is_final(game):
+    return (game.get("status") or {}).get("abstractGameState") == "Final"
+
+
+def game_rows(schedule_data, team_codes):
+    """
+    Flattens a schedule (from get_schedule_range) into one row per game.
+
+    Args:
+        schedule_data (dict): The schedule, hydrated with linescore and decisions.
+        team_codes (dict): {team_id: code}.
+
+    Returns:
+        list: Dicts with the GAME_FIELDS keys, in schedule order.
+    """
+    rows = []
+    for date in (schedule_data or {}).get("dates", []):
+        for game in date.get("games", []):
+            teams = game.get("teams", {})
+            line = (game.get("linescore") or {}).get("teams", {})
+            decisions = game.get("decisions") or {}
+            row = {"date": date.get("date"), "game_pk": game.get("gamePk"),
+                   "status": (game.get("status") or {}).get("detailedState", "")}
+            for side in ("away", "home"):
+                row[side] = team_code((teams.get(side) or {}).get("team") or {}, team_codes)
+                row[f"{side}_score"] = (teams.get(side) or {}).get("score")
+                row[f"{side}_hits"] = (line.get(side) or {}).get("hits")
+                row[f"{side}_errors"] = (line.get(side) or {}).get("errors")
+            for role in ("winner", "loser", "save"):
+                row[role] = (decisions.get(role) or {}).get("fullName")
+            rows.append(row)
+    return rows
+
+
+def describe(row):
+    """Formats a game row as one line of text."""
+    if row["away_score"] is None:
+        # Padded like a score line, so the status column lines up
+        return f"  {row['date']}  {row['away']:<4}    @ {row['home']:<4}     {row['status']}"
+    score = f"{row['away']:<4} {row['away_score']:>2} @ {row['home']:<4} {row['home_score']:>2}"
+    line = f"  {row['date']}  {score}  {row['status']}"
+    decisions = [f"{label}: {row[role]}" for label, role in (("W", "winner"), ("L", "loser"), ("S", "save")) if row[role]]
+    if decisions:
+        line += f"  ({', '.join(decisions)})"
+    return line
+
+
+def boxscore_notes(boxscore, team_codes):
+    """
+    Pulls the highlights out of a box score: home runs and each starting pitcher's line.
+
+    Returns:
+        list: Lines of text, e.g. "NYY HR: Aaron Judge 2, Juan Soto".
+    """
+    notes = []
+    for side in ("away", "home"):
+        team = (boxscore.get("teams") or {}).get(side) or {}
+        code = team_code(team.get("team") or {}, team_codes)
+        players = team.get("players") or {}
+
+        homers = []
+        for player in players.values():
+            count = ((player.get("stats") or {}).get("batting") or {}).get("homeRuns") or 0
+            if count:
+                name = (player.get("person") or {}).get("fullName", "?")
+                homers.append(f"{name} {count}" if count > 1 else name)
+        if homers:
+            notes.append(f"{code} HR: {', '.join(homers)}")
+
+        pitchers = team.get("pitchers") or []
+        if pitchers:
+            starter = players.get(f"ID{pitchers[0]}") or {}
+            line = (starter.get("stats") or {}).get("pitching") or {}
+            name = (starter.get("person") or {}).get("fullName", "?")
+            notes.append(
+                f"{code} SP: {name} {line.get('inningsPitched', '-')} IP, {line.get('hits', '-')} H, "
+                f"{line.get('earnedRuns', '-')} ER, {line.get('strikeOuts', '-')} K"
+            )
+    return notes
+
+
+def standings_rows(standings_data, team_codes):
+    """
+    Flattens standings (from get_standings) into one row per team, division by division.
+
+    Returns:
+        list: Dicts with the STANDINGS_FIELDS keys.
+    """
+    rows = []
+    for record in (standings_data or {}).get("records", []):
+        division = record.get("division") or {}
+        division_name = division.get("name") or DIVISIONS.get(division.get("id"), "Unknown division")
+        for team_record in record.get("teamRecords", []):
+            rows.append({
+                "division": division_name,
+                "rank": team_record.get("divisionRank"),
+                "team": team_code(team_record.get("team") or {}, team_codes),
+                "wins": team_record.get("wins"),
+                "losses": team_record.get("losses"),
+                "pct": team_record.get("winningPercentage"),
+                "games_back": team_record.get("divisionGamesBack"),
+                "streak": (team_record.get("streak") or {}).get("streakCode", ""),
+            })
+    return rows
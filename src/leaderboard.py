@@ -0,0 +1,342 @@
+import ast
+from collections import namedtuple
+
+from src.categories import CATEGORIES
+from src.snapshot import QUALIFYING_IP_PER_GAME, QUALIFYING_PA_PER_GAME, stat_text
+from src.table import RATE_FIELDS
+
+# A derived stat: the group whose columns it uses, an expression over those
+# columns (and the league constants below), whether lower is better, and how
+# many decimals to show.
+Metric = namedtuple("Metric", ["group", "expression", "ascending", "decimals"], defaults=(False, 3))
+
+METRICS = {
+    # Hitting
+    "ISO": Metric("hitting", "slg - avg"),
+    "BABIP": Metric("hitting", "(hits - homeRuns) / (atBats - strikeOuts - homeRuns + sacFlies)"),
+    "K%": Metric("hitting", "strikeOuts / plateAppearances"),
+    "BB%": Metric("hitting", "baseOnBalls / plateAppearances"),
+    # League-relative OPS (100 = league average). No park factors, so it's a bit rougher than published OPS+.
+    "OPS+": Metric("hitting", "100 * (obp / lg_obp + slg / lg_slg - 1)", decimals=0),
+    # Pitching
+    "K9": Metric("pitching", "9 * strikeOuts / inningsPitched", decimals=2),
+    "BB9": Metric("pitching", "9 * baseOnBalls / inningsPitched", ascending=True, decimals=2),
+    "HR9": Metric("pitching", "9 * homeRuns / inningsPitched", ascending=True, decimals=2),
+    "KBB": Metric("pitching", "strikeOuts / baseOnBalls", decimals=2),
+    "FIP": Metric(
+        "pitching",
+        "(13 * homeRuns + 3 * (baseOnBalls + hitByPitch) - 2 * strikeOuts) / inningsPitched + fip_constant",
+        ascending=True,
+        decimals=2,
+    ),
+}
+
+# Spellings people commonly type
+ALIASES = {"K/9": "K9", "BB/9": "BB9", "HR/9": "HR9", "K/BB": "KBB"}
+
+DEFAULT_METRICS = {
+    "hitting": ["plateAppearances", "homeRuns", "avg", "obp", "slg", "ISO", "OPS+"],
+    "pitching": ["inningsPitched", "strikeOuts", "era", "whip", "K9", "BB9", "FIP"],
+}
+DEFAULT_SORT = {"hitting": "OPS+", "pitching": "FIP"}
+
+# Raw fields where lower is better, and raw fields that are rates (so they need a minimum to qualify)
+ASCENDING_FIELDS = {category.field for category in CATEGORIES.values() if category.ascending}
+RATE_STAT_FIELDS = RATE_FIELDS | {category.field for category in CATEGORIES.values() if category.rate}
+
+
+class ExpressionError(ValueError):
+    """Raised for expressions that can't be parsed or use unknown names."""
+
+
+def _compile(expression):
+    """
+    Turns an expression like "9 * strikeOuts / inningsPitched" into a function.
+
+    Only numbers, names, + - * / ** and a few functions (sqrt, log, abs, min,
+    max) are allowed, so user input can never run arbitrary code.
+
+    Returns:
+        callable: Takes a name lookup function and returns the computed array.
+    """
+    import numpy as np
+
+    binary = {ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply, ast.Div: np.divide, ast.Pow: np.power}
+    unary = {ast.USub: np.negative, ast.UAdd: np.positive}
+    functions = {"sqrt": np.sqrt, "log": np.log, "abs": np.abs, "min": np.minimum, "max": np.maximum}
+
+    def build(node):
+        if isinstance(node, ast.Expression):
+            return build(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            value = float(node.value)
+            return lambda lookup: value
+        if isinstance(node, ast.Name):
+            name = node.id
+            return lambda lookup: lookup(name)
+        if isinstance(node, ast.BinOp) and type(node.op) in binary:
+            func, left, right = binary[type(node.op)], build(node.left), build(node.right)
+            return lambda lookup: func(left(lookup), right(lookup))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in unary:
+            func, operand = unary[type(node.op)], build(node.operand)
+            return lambda lookup: func(operand(lookup))
+        if (
+            isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in functions
+            and not node.keywords
+        ):
+            func, args = functions[node.func.id], [build(arg) for arg in node.args]
+            return lambda lookup: func(*(arg(lookup) for arg in args))
+        raise ExpressionError(f"Unsupported syntax in '{expression}': {ast.dump(node)[:40]}")
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError:
+        raise ExpressionError(f"Could not parse '{expression}'.")
+    return build(tree)
+
+
+def league_constants(group):
+    """
+    Computes league-wide rates from the column totals of a snapshot group.
+
+    Returns:
+        dict: For hitting: lg_avg, lg_obp, lg_slg. For pitching: lg_era and
+            fip_constant (so league FIP equals league ERA).
+    """
+    import numpy as np
+
+    def total(name):
+        column = group.column(name)
+        return float(np.nansum(column)) if column is not None else 0.0
+
+    def ratio(numerator, denominator):
+        return numerator / denominator if denominator else float("nan")
+
+    if group.group == "hitting":
+        on_base = total("hits") + total("baseOnBalls") + total("hitByPitch")
+        return {
+            "lg_avg": ratio(total("hits"), total("atBats")),
+            "lg_obp": ratio(on_base, total("atBats") + total("baseOnBalls") + total("hitByPitch") + total("sacFlies")),
+            "lg_slg": ratio(total("totalBases"), total("atBats")),
+        }
+
+    innings = total("inningsPitched")
+    lg_era = ratio(9 * total("earnedRuns"), innings)
+    fip_core = ratio(
+        13 * total("homeRuns") + 3 * (total("baseOnBalls") + total("hitByPitch")) - 2 * total("strikeOuts"), innings
+    )
+    return {"lg_era": lg_era, "fip_constant": lg_era - fip_core}
+
+
+def parse_metric(text):
+    """
+    Parses one --metric argument.
+
+    Accepts a raw field ("homeRuns"), a derived metric ("OPS+", "K/9"), a named
+    expression ("PWR=homeRuns/atBats") or a bare expression.
+
+    Returns:
+        tuple: (display name, expression or None for raw fields/derived metrics).
+    """
+    text = text.strip()
+    name, sep, expression = text.partition("=")
+    if sep:
+        return name.strip(), expression.strip()
+    name = ALIASES.get(text.upper(), text)
+    if name.upper() in METRICS:
+        return name.upper(), None
+    if text.isidentifier():
+        return text, None
+    # Something like "homeRuns / atBats": the expression is its own label
+    return text, text
+
+
+class Leaderboard:
+    """
+    Ranks a whole season of players by any mix of raw, derived and custom stats.
+
+    Every metric is computed once for all players as a NumPy array, so adding
+    a metric costs one vectorized pass instead of one API call.
+
+    Example:
+        board = Leaderboard(snapshot, "hitting")
+        rows = board.rank(parse_metric("OPS+"), [parse_metric("homeRuns"), parse_metric("ISO")], limit=20)
+    """
+
+    def __init__(self, snapshot, group):
+        """
+        Args:
+            snapshot (Snapshot): A season snapshot (see src/snapshot.py).
+            group (str): "hitting" or "pitching".
+        """
+        if group not in snapshot.groups:
+            raise ExpressionError(f"The {snapshot.season} snapshot has no {group} stats.")
+        self.snapshot = snapshot
+        self.group = group
+        self.table = snapshot.groups[group]
+        self.constants = league_constants(self.table)
+        self._values = {}
+        self._expressions = {}
+
+    def _lookup(self, name):
+        """Resolves a name in an expression: a column, a league constant or another metric."""
+        if name in self.constants:
+            return self.constants[name]
+        if name in METRICS:
+            return self.values(name)
+        column = self.table.column(name) if name in self.table.fields else None
+        if column is not None:
+            return column
+        raise ExpressionError(f"Unknown stat '{name}' for {self.group}.")
+
+    def values(self, name, expression=None):
+        """
+        Computes a metric for every player.
+
+        Args:
+            name (str): A raw field, a derived metric name, or the label of a custom expression.
+            expression (str, optional): The expression for a custom metric.
+
+        Returns:
+            numpy.ndarray: One float per player (nan where it can't be computed, e.g. 0 IP).
+        """
+        import numpy as np
+
+        key = (name, expression)
+        if key in self._values:
+            return self._values[key]
+
+        if expression is None and name in METRICS:
+            metric = METRICS[name]
+            if metric.group != self.group:
+                raise ExpressionError(f"{name} is a {metric.group} stat.")
+            expression = metric.expression
+
+        if expression is None:
+            result = np.asarray(self._lookup(name), dtype=np.float64)
+        else:
+            compiled = self._expressions.get(expression) or _compile(expression)
+            self._expressions[expression] = compiled
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = np.asarray(compiled(self._lookup), dtype=np.float64)
+            if result.ndim == 0:
+                result = np.full(len(self.table), float(result))
+            # 0/0 and x/0 mean "no data", not infinitely good
+            result = np.where(np.isfinite(result), result, np.nan)
+
+        self._values[key] = result
+        return result
+
+    def is_ascending(self, name):
+        """Whether lower is better for a metric (ERA, FIP, BB/9...)."""
+        if name in METRICS:
+            return METRICS[name].ascending
+        return name in ASCENDING_FIELDS
+
+    def needs_qualifying(self, name, expression=None):
+        """Rates and custom expressions need a PA/IP minimum; counting stats don't."""
+        return expression is not None or name in METRICS or name in RATE_STAT_FIELDS
+
+    def qualified_mask(self, min_pa=None, min_ip=None):
+        """
+        Returns which players meet the plate appearance / innings minimum.
+
+        Args:
+            min_pa (float, optional): Minimum plate appearances (hitting).
+            min_ip (float, optional): Minimum innings pitched (pitching).
+        """
+        import numpy as np
+
+        mask = np.ones(len(self.table), dtype=bool)
+        if self.group == "hitting" and min_pa:
+            mask &= np.nan_to_num(self.values("plateAppearances")) >= min_pa
+        if self.group == "pitching" and min_ip:
+            mask &= np.nan_to_num(self.values("inningsPitched")) >= min_ip
+        return mask
+
+    def default_minimums(self):
+        """The qualifying minimums: 3.1 PA or 1 IP per team game."""
+        games = self.snapshot.team_games
+        return QUALIFYING_PA_PER_GAME * games, QUALIFYING_IP_PER_GAME * games
+
+    def top(self, values, mask, limit, ascending=False):
+        """
+        Returns the row numbers of the best players, best first.
+
+        Uses a partial sort (argpartition) to find the top k, then sorts only those k.
+        """
+        import numpy as np
+
+        rows = np.flatnonzero(mask & ~np.isnan(values))
+        keys = values[rows] if ascending else -values[rows]
+        if limit < len(rows):
+            best = np.argpartition(keys, limit - 1)[:limit]
+            rows, keys = rows[best], keys[best]
+        # Ties are broken by row (player ID) so results are stable
+        return rows[np.lexsort((rows, keys))]
+
+    def format_value(self, name, value, expression=None):
+        """Formats one metric value for display."""
+        if value != value:
+            return "-"
+        if expression is None and name in METRICS:
+            decimals = METRICS[name].decimals
+        elif expression is None:
+            return str(stat_text(name, value))
+        elif value.is_integer():
+            # Formulas over counting stats ("strikeOuts * 2") stay whole numbers
+            return str(int(value))
+        else:
+            decimals = 3
+        text = f"{value:.{decimals}f}"
+        # Rates below 1 read like batting averages: 0.250 -> .250
+        return text[1:] if text.startswith("0.") and decimals == 3 else text
+
+    def rank(self, sort, metrics, limit=10, ascending=None, min_pa=None, min_ip=None, league_id=None):
+        """
+        Builds a leaderboard.
+
+        Args:
+            sort (tuple): (name, expression) of the metric to rank by (see parse_metric()).
+            metrics (list): (name, expression) tuples to show for each player.
+            limit (int, optional): How many players to return.
+            ascending (bool, optional): Lowest first. Defaults to what makes sense for the sort metric.
+            min_pa (float, optional): Minimum plate appearances. None means "qualified" when the
+                sort metric is a rate, and no minimum for counting stats. 0 disables it.
+            min_ip (float, optional): Minimum innings pitched, like min_pa.
+            league_id (int, optional): Only rank players in this league.
+
+        Returns:
+            list: One dict per player with "rank", "player_id", "name", "team" and each metric.
+        """
+        sort_name, sort_expression = sort
+        sort_values = self.values(sort_name, sort_expression)
+        if ascending is None:
+            ascending = self.is_ascending(sort_name)
+
+        if self.needs_qualifying(sort_name, sort_expression):
+            default_pa, default_ip = self.default_minimums()
+            min_pa = default_pa if min_pa is None else min_pa
+            min_ip = default_ip if min_ip is None else min_ip
+
+        mask = self.qualified_mask(min_pa, min_ip)
+        if league_id is not None:
+            mask &= self.table.column("league_id") == league_id
+
+        columns = [(name, expression, self.values(name, expression)) for name, expression in metrics]
+        rows = []
+        previous = None
+        for position, row in enumerate(self.top(sort_values, mask, limit, ascending), start=1):
+            value = float(sort_values[row])
+            rank = rows[-1]["rank"] if previous == value else position
+            previous = value
+            entry = {
+                "rank": rank,
+                "player_id": int(self.table.column("player_id")[row]),
+                "name": str(self.table.column("name")[row]),
+                "team": str(self.table.column("team")[row]) or "-",
+            }
+            for name, expression, values in columns:
+                entry[name] = self.format_value(name, float(values[row]), expression)
+            rows.append(entry)
+        return rows
@@ -0,0 +1,274 @@
+import copy
+import time
+from collections import namedtuple
+
+from src import api
+
+# How long to wait between polls of a game, in seconds
+MIN_INTERVAL = 5         # Never poll a game faster than this
+DEFAULT_INTERVAL = 10    # When the feed doesn't suggest a wait ("metaData.wait")
+MAX_LIVE_INTERVAL = 60   # Back-off ceiling for a live game that's quiet (pitching change, rain)
+PREVIEW_INTERVAL = 300   # Games that haven't started
+BACKOFF_FACTOR = 1.5
+
+# What we print about a game; a new line is printed only when one of these changes
+GameSummary = namedtuple(
+    "GameSummary", ["game_pk", "away", "home", "away_runs", "home_runs", "state", "inning", "outs", "last_play"]
+)
+
+
+class PatchError(Exception):
+    """Raised when a JSON Patch doesn't fit the document (our copy is out of sync)."""
+
+
+def _parse_path(path):
+    """Splits a JSON Pointer ("/liveData/plays/allPlays/3") into keys, undoing ~1 and ~0 escapes."""
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise PatchError(f"Bad JSON Pointer: {path}")
+    return [part.replace("~1", "/").replace("~0", "~") for part in path[1:].split("/")]
+
+
+def _resolve(document, keys):
+    """Walks to the container holding the last key."""
+    target = document
+    for key in keys[:-1]:
+        try:
+            target = target[int(key)] if isinstance(target, list) else target[key]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise PatchError(f"Path not found: /{'/'.join(keys)}")
+    return target
+
+
+def _get(document, keys):
+    if not keys:
+        return document
+    container = _resolve(document, keys)
+    try:
+        return container[int(keys[-1])] if isinstance(container, list) else container[keys[-1]]
+    except (KeyError, IndexError, ValueError, TypeError):
+        raise PatchError(f"Path not found: /{'/'.join(keys)}")
+
+
+def _add(document, keys, value):
+    container = _resolve(document, keys)
+    key = keys[-1]
+    if isinstance(container, list):
+        index = len(container) if key == "-" else int(key)
+        if index > len(container):
+            raise PatchError(f"Index out of range: {index}")
+        container.insert(index, value)
+    elif isinstance(container, dict):
+        container[key] = value
+    else:
+        raise PatchError(f"Can't add to a {type(container).__name__}")
+
+
+def _remove(document, keys):
+    container = _resolve(document, keys)
+    try:
+        if isinstance(container, list):
+            return container.pop(int(keys[-1]))
+        return container.pop(keys[-1])
+    except (KeyError, IndexError, ValueError, AttributeError):
+        raise PatchError(f"Path not found: /{'/'.join(keys)}")
+
+
+def apply_patch(document, operations):
+    """
+    Applies JSON Patch operations (RFC 6902) to a document, in place.
+
+    Args:
+        document (dict): The document to change.
+        operations (list): Operations such as {"op": "replace", "path": "/a/b", "value": 1}.
+
+    Returns:
+        The patched document (a new object only if the whole document was replaced).
+
+    Raises:
+        PatchError: If an operation doesn't fit the document.
+    """
+    for operation in operations:
+        op = operation.get("op")
+        keys = _parse_path(operation.get("path", ""))
+
+        if not keys and op in ("add", "replace"):
+            document = operation["value"]
+        elif op == "add":
+            _add(document, keys, operation["value"])
+        elif op == "remove":
+            _remove(document, keys)
+        elif op == "replace":
+            _remove(document, keys)
+            _add(document, keys, operation["value"])
+        elif op == "move":
+            value = _remove(document, _parse_path(operation["from"]))
+            _add(document, keys, value)
+        elif op == "copy":
+            _add(document, keys, copy.deepcopy(_get(document, _parse_path(operation["from"]))))
+        elif op == "test":
+            if _get(document, keys) != operation.get("value"):
+                raise PatchError(f"Test failed at {operation.get('path')}")
+        else:
+            raise PatchError(f"Unknown patch operation: {op}")
+    return document
+
+
+def summarize(game_pk, feed):
+    """Pulls the few fields we print out of a live feed."""
+    game_data = feed.get("gameData", {})
+    live_data = feed.get("liveData", {})
+    linescore = live_data.get("linescore", {})
+    teams = game_data.get("teams", {})
+    inning = linescore.get("currentInningOrdinal")
+    current_play = (live_data.get("plays") or {}).get("currentPlay") or {}
+
+    return GameSummary(
+        game_pk=game_pk,
+        away=(teams.get("away") or {}).get("abbreviation") or (teams.get("away") or {}).get("name", "Away"),
+        home=(teams.get("home") or {}).get("abbreviation") or (teams.get("home") or {}).get("name", "Home"),
+        away_runs=((linescore.get("teams") or {}).get("away") or {}).get("runs", 0),
+        home_runs=((linescore.get("teams") or {}).get("home") or {}).get("runs", 0),
+        state=(game_data.get("status") or {}).get("detailedState", "Unknown"),
+        inning=f"{linescore.get('inningState', '')} {inning}".strip() if inning else "",
+        outs=linescore.get("outs"),
+        last_play=(current_play.get("result") or {}).get("description", ""),
+    )
+
+
+def describe(summary):
+    """Formats a game summary as one line of text."""
+    line = f"[{summary.away} {summary.away_runs} @ {summary.home} {summary.home_runs}] "
+    if summary.inning and summary.state == "In Progress":
+        outs = "" if summary.outs is None else f", {summary.outs} out"
+        line += f"{summary.inning}{outs}"
+    else:
+        line += summary.state
+    if summary.last_play:
+        line += f" - {summary.last_play}"
+    return line
+
+
+def schedule_games(schedule_data):
+    """Lists the games in a get_schedule() response."""
+    return [game for date in (schedule_data or {}).get("dates", []) for game in date.get("games", [])]
+
+
+class GameTracker:
+    """
+    Keeps one game's live feed up to date with as little data as possible.
+
+    The first poll downloads the whole feed. After that we only ask for the
+    JSON patches since our last timecode and apply them to the copy in memory.
+    If a patch doesn't apply (we missed something), we fetch the full feed again.
+
+    Polling adapts to the game: the feed's suggested wait while things are
+    happening, a growing back-off while nothing changes, a slow poll before
+    the first pitch, and no polling at all once the game is final.
+    """
+
+    def __init__(self, game_pk, clock=time.monotonic):
+        self.game_pk = game_pk
+        self.feed = None
+        self.interval = DEFAULT_INTERVAL
+        self.due_at = 0.0
+        self.full_fetches = 0
+        self.patch_updates = 0
+        self._clock = clock
+
+    @property
+    def timecode(self):
+        return (self.feed or {}).get("metaData", {}).get("timeStamp")
+
+    @property
+    def abstract_state(self):
+        """"Preview", "Live" or "Final"."""
+        return ((self.feed or {}).get("gameData", {}).get("status") or {}).get("abstractGameState", "Preview")
+
+    @property
+    def finished(self):
+        return self.feed is not None and self.abstract_state == "Final"
+
+    def poll(self):
+        """
+        Brings the feed up to date and schedules the next poll.
+
+        Returns:
+            bool: True if the game state changed.
+        """
+        changed = self._update()
+        self._schedule(changed)
+        return changed
+
+    def _update(self):
+        if self.feed is not None and self.timecode:
+            patches = api.get_live_diff(self.game_pk, self.timecode)
+            if patches is None:
+                return False
+            if isinstance(patches, dict):
+                # The API sent the whole feed instead of patches
+                self.feed = patches
+                self.full_fetches += 1
+                return True
+            if not patches:
+                return False
+            try:
+                for patch_set in patches:
+                    self.feed = apply_patch(self.feed, patch_set.get("diff", []))
+                self.patch_updates += 1
+                return True
+            except PatchError:
+                pass  # Out of sync: start over from a full fetch below
+
+        feed = api.get_live_feed(self.game_pk)
+        if feed is None:
+            return False
+        self.feed = feed
+        self.full_fetches += 1
+        return True
+
+    def _schedule(self, changed):
+        """Decides when to poll this game next."""
+        suggested = (self.feed or {}).get("metaData", {}).get("wait") or DEFAULT_INTERVAL
+        state = self.abstract_state
+        if state == "Preview":
+            self.interval = PREVIEW_INTERVAL
+        elif changed:
+            self.interval = max(MIN_INTERVAL, suggested)
+        else:
+            # Nothing happened: wait longer each time, up to the ceiling
+            self.interval = min(MAX_LIVE_INTERVAL, max(MIN_INTERVAL, self.interval * BACKOFF_FACTOR))
+        self.due_at = self._clock() + self.interval
+
+    def summary(self):
+        return summarize(self.game_pk, self.feed or {})
+
+
+def follow(trackers, on_update, poll_many, sleep=time.sleep, clock=time.monotonic, max_rounds=None):
+    """
+    Polls games as they come due until every game is final.
+
+    Args:
+        trackers (list): GameTracker objects.
+        on_update (callable): Called with a tracker whenever its game changed.
+        poll_many (callable): Takes a list of due trackers, polls them (e.g., in parallel)
+            and yields (tracker, changed) pairs.
+        sleep (callable, optional): Waits a number of seconds (injected in tests).
+        clock (callable, optional): Returns the current time in seconds.
+        max_rounds (int, optional): Stop after this many polling rounds.
+    """
+    rounds = 0
+    while True:
+        active = [tracker for tracker in trackers if not tracker.finished]
+        if not active or (max_rounds is not None and rounds >= max_rounds):
+            return
+        now = clock()
+        due = [tracker for tracker in active if tracker.due_at <= now]
+        if due:
+            rounds += 1
+            for tracker, changed in poll_many(due):
+                if changed:
+                    on_update(tracker)
+            continue
+        sleep(max(0.0, min(tracker.due_at for tracker in active) - now))
@@ -1,6 +1,31 @@
 import argparse
+import dataclasses
 import datetime
-from src.api import get_roster, get_league_leaders, search_for_player, get_player_stats
+import sys
+import time
+from contextlib import ExitStack, redirect_stdout
+from src import client, metrics
+from src.api import (
+    get_roster, get_league_leaders, search_for_player, get_player_stats, get_people_stats, get_players,
+    get_player_stat_history, get_schedule, get_schedule_range, get_standings, get_boxscore, get_team_roster_stats,
+    stream_players, stream_roster, configure_cache, configure_projection, configure_server, StreamError
+)
+from src.cache import DEFAULT_MAX_CACHE_MB, default_cache_dir
+from src.categories import CATEGORIES, LEAGUES, by_group, resolve
+from src.export import FORMATS, ExportError, open_writer
+from src.games import GAME_FIELDS, STANDINGS_FIELDS, boxscore_notes, describe as describe_result, game_rows, is_final, standings_rows
+from src.leaderboard import DEFAULT_METRICS, DEFAULT_SORT, METRICS, ExpressionError, Leaderboard, parse_metric
+from src.live import GameSummary, GameTracker, describe as describe_game, follow, schedule_games
+from src.models import HITTING_FIELDS, PITCHING_FIELDS, STAT_FIELDS, LeaderEntry, RosterEntry, parse_stat_groups
+from src.player_index import Match, PlayerIndex, index_path
+from src.ratelimit import lock_path
+from src.roster_diff import EVENT_FIELDS, RosterState, describe, state_path
+from src.server import DEFAULT_HOST, DEFAULT_PORT, read_state
+from src.streaming import available as streaming_available
+from src.snapshot import GROUPS, Snapshot, available_seasons, collapse_splits, download_splits, write_group
+from src.table import StatTable, format_stat, line_to_numbers
+from src.team_stats import TeamStats, roster_people
+from src.warm import Schedule, ScheduleError, WarmState, run_schedule, state_path as warm_state_path
 
 # A complete dictionary mapping all 30 MLB team codes to their API team IDs.
 TEAM_MAP = {
@@ -36,158 +61,1507 @@ TEAM_MAP = {
     "MIL": 158, # Milwaukee Brewers
 }
 
+# The other way around, for turning the API's team IDs back into our codes
+TEAM_CODES = {team_id: code for code, team_id in TEAM_MAP.items()}
+
 # Map for user-friendly stat codes to the API's required "leaderCategories"
-STAT_MAP = {
-    "HR": "homeRuns",
-    "AVG": "battingAverage",
-    "RBI": "runsBattedIn",
-    "H": "hits",
-    "SB": "stolenBases",
-    "SO": "strikeOuts",      # For pitchers
-    "ERA": "earnedRunAverage" # For pitchers
+# (built from the category registry in src/categories.py)
+STAT_MAP = {code: category.api_name for code, category in CATEGORIES.items()}
+
+# How many rosters to fetch at once for 'roster --all' (or a list of teams)
+DEFAULT_WORKERS = 8
+
+# Columns of the rows each command exports with --format json/ndjson/csv/parquet
+EXPORT_FIELDS = {
+    "roster": ["team", "team_id", "player_id", "name", "jersey_number", "position", "status"],
+    "leaders": ["category", "group", "season", "league", "rank", "player_id", "name", "team", "value"],
+    "stats": ["player", "player_id", "season", "group", "team"]
+             + list(HITTING_FIELDS) + [field for field in PITCHING_FIELDS if field not in HITTING_FIELDS],
+    "live": list(GameSummary._fields),
+    "team-stats": ["team", "season", "group", "player_id", "name", "position"]
+                  + list(HITTING_FIELDS) + [field for field in PITCHING_FIELDS if field not in HITTING_FIELDS],
+    "games": GAME_FIELDS + ["highlights"],
+    "standings": ["season"] + STANDINGS_FIELDS,
 }
 
+def print_roster(roster_data, title="--- 40-Man Roster ---", writer=None, team=None, team_id=None):
+    """
+    Prints one team's roster, one line per player.
+
+    Args:
+        roster_data (dict): The JSON returned by get_roster() (or fetch_roster_stream(), whose
+            "roster" is an iterator that is read as the lines are printed).
+        title (str, optional): The header line printed above the players.
+        writer (RowWriter, optional): Export rows to this writer instead of printing.
+        team (str, optional): The team code, added to exported rows.
+        team_id (int, optional): The team ID, added to exported rows.
+    """
+    try:
+        if writer is not None:
+            for entry in map(RosterEntry.from_json, roster_data.get("roster", [])):
+                writer.write({"team": team, "team_id": team_id, **entry.as_row()})
+            return
+
+        print(title, flush=True)
+        for entry in map(RosterEntry.from_json, roster_data.get("roster", [])):
+            print(
+                f"  #{entry.jersey_number:<3} - "
+                f"{entry.player.full_name:<25} "
+                f"({entry.position})",
+                flush=True
+            )
+    except StreamError:
+        # A streamed roster broke off partway; the API layer already printed the error
+        return
+
+def fetch_concurrently(func, items, workers=DEFAULT_WORKERS):
+    """
+    Calls func(item) for every item on a thread pool and yields results as they finish.
+
+    Results come back in completion order (not input order), so callers can start
+    printing the first answer while slower requests are still running.
+
+    Args:
+        func (callable): The API function to call, e.g. get_roster.
+        items (iterable): One argument per call.
+        workers (int, optional): How many calls may run at the same time.
+
+    Yields:
+        tuple: (item, result) for each call, as soon as it completes.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    items = list(items)
+    # Let the shared session keep one connection open per worker
+    client.grow_pool(workers)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items) or 1))) as executor:
+        futures = {executor.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def parse_team_codes(args):
+    """
+    Turns --all or a comma-separated team_code argument into a list of team codes.
+
+    Every code is validated before any API call is made, and duplicates are
+    dropped (keeping the order the user typed).
+
+    Returns:
+        list: Upper-case team codes, or None if any code is unknown (an error is printed).
+    """
+    if args.all:
+        team_codes = list(TEAM_MAP.keys())
+    else:
+        team_codes = [code.strip().upper() for code in args.team_code.split(",") if code.strip()]
+
+    unknown = [code for code in team_codes if code not in TEAM_MAP]
+    if unknown:
+        print(f"Error: Team code(s) {', '.join(unknown)} not found in our map.")
+        print(f"Known codes: {list(TEAM_MAP.keys())}")
+        return None
+
+    return list(dict.fromkeys(team_codes))
+
+def fetch_roster_stream(team_id):
+    """
+    Starts streaming a roster (see stream_roster), in the shape print_roster() takes.
+
+    Returns:
+        dict: {"roster": iterator of entries}, or None if the request failed.
+    """
+    entries = stream_roster(team_id)
+    return {"roster": entries} if entries is not None else None
+
+def run_multi_roster(args, writer=None):
+    """
+    Handles 'roster --all' and 'roster CIN,NYY,LAD': fetches the rosters in parallel
+    and prints (or exports) each team as soon as its request finishes.
+    """
+    team_codes = parse_team_codes(args)
+    if not team_codes:
+        return
+    print(f"Fetching rosters for {len(team_codes)} teams ({args.workers} at a time)...", flush=True)
+
+    by_team_id = {TEAM_MAP[code]: code for code in team_codes}
+    fetch = fetch_roster_stream if args.stream else get_roster
+    for team_id, roster_data in fetch_concurrently(fetch, by_team_id, workers=args.workers):
+        code = by_team_id[team_id]
+        if roster_data:
+            print_roster(
+                roster_data, title=f"--- 40-Man Roster: {code} (ID: {team_id}) ---", writer=writer, team=code, team_id=team_id
+            )
+        else:
+            print(f"--- 40-Man Roster: {code} (ID: {team_id}) --- unavailable", flush=True)
+
+def print_player_stats(player_name, season, stat_groups, writer=None, player_id=None):
+    """
+    Prints a player's hitting and/or pitching line for one season.
+
+    Args:
+        player_name (str): The name shown in the header.
+        season (int): The season the stats are for.
+        stat_groups (list): The "stats" list from get_player_stats() or get_people_stats().
+        writer (RowWriter, optional): Export one row per stat group instead of printing.
+        player_id (int, optional): The player's ID, added to exported rows.
+    """
+    if writer is None:
+        print(f"--- Stats for {player_name} ({season}) ---")
+    
+    # Only the first split of each group is the season line (the API may add per-team splits)
+    shown_groups = set()
+    for s in parse_stat_groups(stat_groups):
+        if s.group in shown_groups:
+            continue
+        shown_groups.add(s.group)
+
+        if writer is not None:
+            writer.write({"player": player_name, "player_id": player_id, **s.as_row(), "season": s.season or str(season)})
+            continue
+
+        print(f"--- {s.group} ---")
+        
+        if s.group == "hitting":
+            print(f"  AVG: {s.get('avg', 'N/A')} | HR: {s.get('homeRuns', 'N/A')} | RBI: {s.get('rbi', 'N/A')}")
+            print(f"  Games: {s.get('gamesPlayed', 'N/A')} | Hits: {s.get('hits', 'N/A')} | SB: {s.get('stolenBases', 'N/A')}")
+        elif s.group == "pitching":
+            print(f"  W-L: {s.get('wins', 'N/A')}-{s.get('losses', 'N/A')} | ERA: {s.get('era', 'N/A')} | SO: {s.get('strikeOuts', 'N/A')}")
+            print(f"  Games: {s.get('gamesPitched', 'N/A')} | IP: {s.get('inningsPitched', 'N/A')} | WHIP: {s.get('whip', 'N/A')}")
+
+    if not shown_groups and writer is None:
+        print(f"No hitting or pitching stats found for {player_name} in {season}.")
+
+def find_player(player_name, index=None):
+    """
+    Resolves a player name to an ID, using the local player index when there is one.
+
+    The index answers without any network call. If it has no clear answer
+    (or hasn't been built yet), we fall back to the API's people search.
+
+    Args:
+        player_name (str): The name to look up.
+        index (PlayerIndex, optional): The index loaded from the cache folder.
+
+    Returns:
+        Match: The chosen player ID (or None) and the candidates the index found.
+    """
+    candidates = []
+    if index is not None:
+        match = index.lookup(player_name)
+        if match.player_id:
+            return match
+        candidates = match.candidates
+
+    return Match(search_for_player(player_name), candidates)
+
+def print_other_matches(player_name, match):
+    """Lists the other players a name could refer to (or suggestions if nothing was found)."""
+    others = [f"{name} ({player_id})" for player_id, name in match.candidates if player_id != match.player_id]
+    if not others:
+        return
+    if match.player_id:
+        print(f"Note: '{player_name}' also matches: {', '.join(others)}")
+    else:
+        print(f"Did you mean: {', '.join(others)}?")
+
+def run_index(args, cache_dir):
+    """
+    Handles 'index build' and 'index refresh': downloads the season player list(s)
+    and saves the local name index used by the stats command.
+    """
+    path = index_path(cache_dir)
+
+    if args.action == "refresh":
+        # Rebuild the same seasons as the existing index (or the current one if there's none)
+        existing = PlayerIndex.load(path)
+        seasons = args.season or (existing.seasons if existing and existing.seasons else None)
+    else:
+        seasons = args.season
+    seasons = sorted(set(seasons or [datetime.datetime.now().year]))
+
+    print(f"Downloading player lists for {', '.join(str(season) for season in seasons)}...")
+    people_by_season = {}
+    for season in seasons:
+        if args.stream:
+            # The index only keeps id/name/active, so the full person objects never need to pile up
+            people = stream_players(season)
+            data = {"people": people} if people is not None else None
+        else:
+            data = get_players(season)
+        if not data:
+            print(f"Error: Could not download the player list for {season}.")
+            return
+        people_by_season[season] = data
+
+    try:
+        index = PlayerIndex.from_api(people_by_season)
+    except StreamError:
+        # A streamed list broke off partway (already reported); don't save a partial index
+        print("Error: The player list download was cut off; the index was not saved.")
+        return
+    index.save(path)
+    print(f"Indexed {len(index)} players -> {path}")
+
+def collect_player_names(args):
+    """
+    Gathers player names from the command line and from --file (or stdin).
+
+    Blank lines and repeated names (ignoring case and extra spaces) are skipped.
+
+    Returns:
+        list: The unique player names, in the order they were given.
+    """
+    names = list(args.player_name)
+
+    if args.file:
+        if args.file == "-":
+            names.extend(sys.stdin.read().splitlines())
+        else:
+            with open(args.file, encoding="utf-8") as f:
+                names.extend(f.read().splitlines())
+
+    unique = {}
+    for name in names:
+        name = " ".join(name.split())
+        if name:
+            unique.setdefault(name.lower(), name)
+    return list(unique.values())
+
+def run_multi_stats(player_names, season, workers=DEFAULT_WORKERS, index=None, writer=None):
+    """
+    Handles 'stats' for several players: names are resolved with the local index
+    (searches for the rest run in parallel), then all the stats come back from a
+    few chunked /people requests instead of one per player.
+    """
+    player_ids = {}
+    candidates = {}
+    if index is not None:
+        for name in player_names:
+            match = index.lookup(name)
+            candidates[name] = match.candidates
+            if match.player_id:
+                player_ids[name] = match.player_id
+
+    to_search = [name for name in player_names if name not in player_ids]
+    if to_search:
+        print(f"Searching for {len(to_search)} active players...", flush=True)
+        player_ids.update(fetch_concurrently(search_for_player, to_search, workers=workers))
+
+    # Like the single-player path: say who else a name could mean
+    for name in player_names:
+        print_other_matches(name, Match(player_ids.get(name), candidates.get(name, [])))
+
+    missing = [name for name in player_names if not player_ids.get(name)]
+    for name in missing:
+        print(f"Error: Could not find an active player named '{name}'.")
+
+    found_ids = {player_ids[name] for name in player_names if player_ids.get(name)}
+    if not found_ids:
+        return
+
+    print(f"Fetching {season} stats for {len(found_ids)} players...", flush=True)
+    people_data = get_people_stats(found_ids, season)
+    if not people_data:
+        return
+
+    stats_by_id = {person.get("id"): person.get("stats", []) for person in people_data.get("people", [])}
+    for name in player_names:
+        if name in missing:
+            continue
+        print_player_stats(name, season, stats_by_id.get(player_ids[name], []), writer=writer, player_id=player_ids[name])
+
+# The columns shown by 'stats --seasons' / '--career': (header, API field)
+HISTORY_COLUMNS = {
+    "hitting": [
+        ("G", "gamesPlayed"), ("AB", "atBats"), ("H", "hits"), ("HR", "homeRuns"), ("RBI", "rbi"),
+        ("SB", "stolenBases"), ("AVG", "avg"), ("OBP", "obp"), ("SLG", "slg"), ("OPS", "ops"),
+    ],
+    "pitching": [
+        ("G", "gamesPitched"), ("GS", "gamesStarted"), ("W", "wins"), ("L", "losses"), ("SV", "saves"),
+        ("IP", "inningsPitched"), ("SO", "strikeOuts"), ("ERA", "era"), ("WHIP", "whip"),
+    ],
+}
+
+def parse_seasons(text):
+    """
+    Reads a --seasons value: a range ("2015-2025"), a list ("2019,2021") or a single year.
+
+    Returns:
+        list: The seasons as sorted ints.
+
+    Raises:
+        argparse.ArgumentTypeError: If the text isn't a valid season list.
+    """
+    seasons = set()
+    try:
+        for part in text.split(","):
+            start, _, end = part.strip().partition("-")
+            start = int(start)
+            end = int(end) if end else start
+            if end < start:
+                raise ValueError
+            seasons.update(range(start, end + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid season list '{text}' (use e.g. 2015-2025 or 2019,2021)")
+    return sorted(seasons)
+
+def print_stat_table(table, totals, title):
+    """
+    Prints a multi-season table with a totals line at the bottom.
+
+    Args:
+        table (StatTable): One row per season.
+        totals (dict): {field: value} for the bottom line.
+        title (str): The header line.
+    """
+    columns = HISTORY_COLUMNS[table.group]
+    print(title)
+    print(f"  {'Season':<7} {'Team':<24}" + "".join(f"{header:>7}" for header, _ in columns))
+    for row in range(len(table)):
+        cells = "".join(f"{format_stat(field, table.column(field)[row]):>7}" for _, field in columns)
+        print(f"  {table.column('season')[row]:<7} {table.column('team')[row][:24]:<24}{cells}")
+    cells = "".join(f"{format_stat(field, totals.get(field)):>7}" for _, field in columns)
+    print(f"  {'Total':<7} {'':<24}{cells}")
+
+def season_lines(stat_groups, stat_type=None):
+    """
+    Like parse_stat_groups, but with one line per season: a player traded mid-season
+    has a split per team plus a season total, and only the total is kept.
+    """
+    collapsed = []
+    for stat_group in stat_groups or []:
+        if (stat_group.get("type") or {}).get("displayName") in ("yearByYear", "season"):
+            splits = collapse_splits(stat_group.get("splits", []), key=lambda split: split.get("season"))
+            stat_group = dict(stat_group, splits=splits)
+        collapsed.append(stat_group)
+    return parse_stat_groups(collapsed, stat_type=stat_type)
+
+def run_stat_history(player_names, seasons=None, sort=None, workers=DEFAULT_WORKERS, index=None, writer=None):
+    """
+    Handles 'stats --seasons' and 'stats --career'.
+
+    Each player's whole history comes from one yearByYear + career request. If
+    that request fails and specific seasons were asked for, we fall back to
+    fetching those seasons one by one, in parallel.
+
+    Args:
+        player_names (list): The players to show.
+        seasons (list, optional): Only show these seasons. None means the whole career.
+        sort (str, optional): An API stat field to sort the rows by (biggest first).
+        workers (int, optional): How many requests to run at the same time.
+        index (PlayerIndex, optional): The local player index.
+        writer (RowWriter, optional): Export one row per season instead of printing tables.
+    """
+    matches = dict(fetch_concurrently(lambda name: find_player(name, index), player_names, workers=workers))
+    player_ids = {name: matches[name].player_id for name in player_names if matches[name].player_id}
+    for name in player_names:
+        if name not in player_ids:
+            print(f"Error: Could not find an active player named '{name}'.")
+
+    histories = dict(fetch_concurrently(get_player_stat_history, set(player_ids.values()), workers=workers))
+    label = f"{seasons[0]}-{seasons[-1]}" if seasons else "career"
+
+    for name, player_id in player_ids.items():
+        history = histories.get(player_id)
+        if history:
+            lines = season_lines(history.get("stats"), stat_type="yearByYear")
+            career_lines = {line.group: line for line in parse_stat_groups(history.get("stats"), stat_type="career")}
+        elif seasons:
+            # Fall back to one request per season, all in flight at once
+            per_season = fetch_concurrently(lambda season: get_player_stats(player_id, season), seasons, workers=workers)
+            lines = []
+            for season, data in sorted(per_season, key=lambda item: item[0]):
+                for line in season_lines((data or {}).get("stats")):
+                    lines.append(dataclasses.replace(line, season=str(season)))
+            career_lines = {}
+        else:
+            print(f"No stats found for {name}.")
+            continue
+
+        if seasons:
+            wanted = {str(season) for season in seasons}
+            lines = [line for line in lines if line.season in wanted]
+
+        printed = False
+        for group in ("hitting", "pitching"):
+            table = StatTable.from_lines(group, lines)
+            if not len(table):
+                continue
+            printed = True
+
+            if sort and sort in table.columns:
+                table = table.sort_by(sort)
+
+            if writer is not None:
+                for row in table.rows():
+                    writer.write({"player": name, "player_id": player_id, "group": group, **row})
+                continue
+
+            # The API's own career line is exact; otherwise add up the table
+            if not seasons and group in career_lines:
+                totals = line_to_numbers(career_lines[group])
+            else:
+                totals = table.totals()
+
+            print_stat_table(table, totals, f"--- {group} for {name} ({label}) ---")
+
+        if not printed and writer is None:
+            print(f"No hitting or pitching stats found for {name} ({label}).")
+
+def load_snapshot(cache_dir, season=None):
+    """
+    Opens a season snapshot for --offline, printing a hint if there isn't one.
+
+    Args:
+        cache_dir (str): The cache folder the snapshots live in.
+        season (int, optional): The season. Defaults to the newest snapshot.
+
+    Returns:
+        Snapshot: The snapshot, or None if it hasn't been downloaded.
+    """
+    if season is None:
+        seasons = available_seasons(cache_dir)
+        season = seasons[-1] if seasons else datetime.datetime.now().year
+
+    snapshot = Snapshot.load(cache_dir, season)
+    if snapshot is None:
+        print(f"Error: No offline snapshot for {season}. Run 'snapshot {season}' first.")
+    return snapshot
+
+def run_offline_roster(args, cache_dir, writer=None):
+    """Handles 'roster --offline': lists who played for each team, from the season snapshot."""
+    team_codes = parse_team_codes(args)
+    if not team_codes:
+        return
+
+    snapshot = load_snapshot(cache_dir, args.season)
+    if snapshot is None:
+        return
+
+    for code in team_codes:
+        team_id = TEAM_MAP[code]
+        print_roster(
+            snapshot.roster(team_id),
+            title=f"--- {snapshot.season} Players: {code} (ID: {team_id}, offline) ---",
+            writer=writer,
+            team=code,
+            team_id=team_id
+        )
+
+def check_rosters(team_codes, state, workers=DEFAULT_WORKERS, writer=None):
+    """
+    Fetches rosters, compares each one with the saved state and reports only what changed.
+
+    Rosters are always revalidated with the API (ttl=0), which costs a cheap
+    304 when nothing changed; a team whose roster hash matches is skipped.
+
+    Args:
+        team_codes (list): The teams to check.
+        state (RosterState): The last-seen rosters; updated in place.
+        workers (int, optional): How many rosters to fetch at the same time.
+        writer (RowWriter, optional): Export events instead of printing them.
+
+    Returns:
+        int: How many events were reported.
+    """
+    by_team_id = {TEAM_MAP[code]: code for code in team_codes}
+    reported = 0
+    for team_id, roster_data in fetch_concurrently(lambda team_id: get_roster(team_id, ttl=0), by_team_id, workers=workers):
+        code = by_team_id[team_id]
+        if not roster_data:
+            print(f"[{code}] Roster unavailable; will try again.", flush=True)
+            continue
+
+        first_time = not state.has_team(team_id)
+        events = state.update(code, team_id, roster_data)
+        if first_time:
+            print(f"[{code}] Baseline saved ({len(roster_data.get('roster', []))} players).", flush=True)
+
+        for event in events:
+            if writer is not None:
+                writer.write(event._asdict())
+            else:
+                print(describe(event), flush=True)
+        reported += len(events)
+    return reported
+
+def run_roster_diff(args, cache_dir, writer=None):
+    """Handles 'roster --diff': prints only what changed since the last run."""
+    team_codes = parse_team_codes(args)
+    if not team_codes:
+        return
+
+    path = state_path(cache_dir)
+    state = RosterState.load(path)
+    reported = check_rosters(team_codes, state, workers=args.workers, writer=writer)
+    state.save(path)
+
+    if not reported:
+        print("No roster changes.")
+
+def run_watch(args, cache_dir, writer=None):
+    """Handles the 'watch' command: checks rosters every --interval seconds and reports changes."""
+    team_codes = parse_team_codes(args)
+    if not team_codes:
+        return
+
+    path = state_path(cache_dir)
+    state = RosterState.load(path)
+    print(f"Watching {len(team_codes)} team(s) every {args.interval:g}s (Ctrl+C to stop)...", flush=True)
+
+    cycle = 0
+    try:
+        while True:
+            cycle += 1
+            check_rosters(team_codes, state, workers=args.workers, writer=writer)
+            # Save after every check, so a restart picks up where this one left off
+            state.save(path)
+            if writer is not None:
+                writer.flush()
+            if args.count and cycle >= args.count:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+def run_live(args, writer=None):
+    """
+    Handles the 'live' command: follows the day's games and prints every score or play change.
+
+    Each game's full live feed is downloaded once; after that only JSON patches
+    since the last update are requested, and each game is polled as often as
+    its state calls for (see GameTracker).
+    """
+    date = args.date or datetime.date.today().isoformat()
+
+    team_ids = None
+    if args.team_code:
+        team_codes = parse_team_codes(args)
+        if not team_codes:
+            return
+        team_ids = {TEAM_MAP[code] for code in team_codes}
+
+    if args.game:
+        game_pks = [args.game]
+    else:
+        schedule_data = get_schedule(date)
+        if schedule_data is None:
+            return
+        game_pks = [
+            game["gamePk"] for game in schedule_games(schedule_data)
+            if team_ids is None
+            or {side.get("team", {}).get("id") for side in game.get("teams", {}).values()} & team_ids
+        ]
+
+    if not game_pks:
+        print(f"No games found on {date}.")
+        return
+
+    print(f"Following {len(game_pks)} game(s) (Ctrl+C to stop)...", flush=True)
+    trackers = [GameTracker(game_pk) for game_pk in game_pks]
+    last_printed = {}
+
+    def on_update(tracker):
+        summary = tracker.summary()
+        # Patches also touch things we don't show (pitch data, timestamps), so only print real changes
+        if last_printed.get(tracker.game_pk) == summary:
+            return
+        last_printed[tracker.game_pk] = summary
+        if writer is not None:
+            writer.write(summary._asdict())
+            writer.flush()
+        else:
+            print(describe_game(summary), flush=True)
+
+    def poll_many(due):
+        return fetch_concurrently(lambda tracker: tracker.poll(), due, workers=args.workers)
+
+    try:
+        follow(trackers, on_update, poll_many, max_rounds=args.count or None)
+    except KeyboardInterrupt:
+        pass
+
+    full_fetches = sum(tracker.full_fetches for tracker in trackers)
+    patch_updates = sum(tracker.patch_updates for tracker in trackers)
+    print(f"Done: {full_fetches} full feed download(s), {patch_updates} patch update(s).")
+
+def parse_date(text):
+    """Checks a YYYY-MM-DD date argument (used as an argparse type)."""
+    try:
+        return datetime.date.fromisoformat(text).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not a date like 2024-06-01")
+
+def run_games(args, writer=None):
+    """
+    Handles the 'games' command: results and schedules between two dates.
+
+    The whole range comes back in one schedule request, hydrated with line
+    scores and decisions. With --boxscores each game's box score is fetched
+    too, several at a time; box scores of finished games never change, so
+    they are cached for good and a second run of the same range is free.
+    """
+    start = args.from_date or datetime.date.today().isoformat()
+    end = args.to_date or start
+
+    team_codes = None
+    if args.team_code:
+        team_codes = parse_team_codes(args)
+        if not team_codes:
+            return
+    # One team can be filtered by the API; for several we filter the full schedule ourselves
+    team_id = TEAM_MAP[team_codes[0]] if team_codes and len(team_codes) == 1 else None
+
+    schedule_data = get_schedule_range(start, end, team_id=team_id)
+    if schedule_data is None:
+        return
+
+    games = {game["gamePk"]: game for game in schedule_games(schedule_data)}
+    rows = [
+        row for row in game_rows(schedule_data, TEAM_CODES)
+        if team_codes is None or row["away"] in team_codes or row["home"] in team_codes
+    ]
+    if not rows:
+        if writer is None:
+            print(f"No games found from {start} to {end}.")
+        return
+
+    notes = {}
+    if args.boxscores:
+        # Games that haven't started have no box score yet
+        started = [row["game_pk"] for row in rows if row["away_score"] is not None]
+        fetched = fetch_concurrently(
+            lambda game_pk: get_boxscore(game_pk, final=is_final(games[game_pk])), started, workers=args.workers
+        )
+        notes = {game_pk: boxscore_notes(boxscore, TEAM_CODES) for game_pk, boxscore in fetched if boxscore}
+
+    if writer is not None:
+        for row in rows:
+            writer.write({**row, "highlights": "; ".join(notes.get(row["game_pk"], [])) or None})
+        return
+
+    print(f"--- Games from {start} to {end} ({len(rows)}) ---")
+    for row in rows:
+        print(describe_result(row))
+        for note in notes.get(row["game_pk"], []):
+            print(f"      {note}")
+
+def run_standings(args, writer=None):
+    """Handles the 'standings' command: every division's table for a season."""
+    season = args.season or datetime.date.today().year
+    league_ids = [LEAGUES[args.league]] if args.league else list(LEAGUES.values())
+
+    standings_data = get_standings(season, league_ids=league_ids)
+    if standings_data is None:
+        return
+
+    rows = standings_rows(standings_data, TEAM_CODES)
+    if not rows:
+        if writer is None:
+            print(f"No standings found for {season}.")
+        return
+
+    if writer is not None:
+        for row in rows:
+            writer.write({"season": season, **row})
+        return
+
+    division = None
+    for row in rows:
+        if row["division"] != division:
+            division = row["division"]
+            print(f"\n--- {season} {division} ---")
+            print(f"  {'Team':<5} {'W':>4} {'L':>4} {'Pct':>6} {'GB':>5}  Strk")
+        print(
+            f"  {row['team']:<5} {row['wins']:>4} {row['losses']:>4} {row['pct'] or '-':>6} "
+            f"{row['games_back'] or '-':>5}  {row['streak']}"
+        )
+
+def run_roster(args, writer=None, cache_dir=None):
+    """Handles the 'roster' command."""
+    if args.offline:
+        run_offline_roster(args, cache_dir or default_cache_dir(), writer)
+        return
+
+    if args.diff:
+        run_roster_diff(args, cache_dir or default_cache_dir(), writer)
+        return
+
+    # More than one team: fetch them in parallel and stream the results
+    if args.all or "," in args.team_code:
+        run_multi_roster(args, writer)
+        return
+
+    # Look up the team ID from our map
+    team_id = TEAM_MAP.get(args.team_code.upper())
+    
+    if not team_id:
+        print(f"Error: Team code '{args.team_code}' not found in our map.")
+        print(f"Known codes: {list(TEAM_MAP.keys())}")
+        return
+
+    # Call our API function from api.py
+    print(f"Fetching roster for {args.team_code.upper()} (ID: {team_id})...")
+    roster_data = fetch_roster_stream(team_id) if args.stream else get_roster(team_id)
+    
+    if roster_data:
+        print_roster(roster_data, writer=writer, team=args.team_code.upper(), team_id=team_id)
+
+def fetch_leaders(categories, season, limit, league_id=None):
+    """
+    Fetches leaders for several categories with one request per stat group.
+
+    Args:
+        categories (list): Category tuples from src/categories.py.
+        season (int): The 4-digit season year.
+        limit (int): How many players per category.
+        league_id (int, optional): Only rank players in this league.
+
+    Returns:
+        dict: {category code: list of leader dicts}. Categories whose request failed are missing.
+    """
+    # One request per stat group (all hitting stats together, all pitching stats together)
+    groups = by_group(categories)
+    for group, members in groups.items():
+        print(f"Fetching {group} leaders for {','.join(c.code for c in members)} in {season}...")
+
+    def fetch_group(group):
+        return get_league_leaders(
+            [c.api_name for c in groups[group]], season, group=group, limit=limit, league_id=league_id
+        )
+
+    # Match each returned list to its category (by name, or by position if the name is missing)
+    leaders_by_code = {}
+    for group, leaders_data in fetch_concurrently(fetch_group, groups, workers=len(groups)):
+        if not leaders_data:
+            continue
+        returned = leaders_data.get("leagueLeaders", [])
+        by_name = {entry.get("leaderCategory", "").lower(): entry for entry in returned}
+        for position, category in enumerate(groups[group]):
+            entry = by_name.get(category.api_name.lower())
+            if entry is None and position < len(returned) and not returned[position].get("leaderCategory"):
+                entry = returned[position]
+            leaders_by_code[category.code] = (entry or {}).get("leaders", [])
+    return leaders_by_code
+
+def run_leaders(args, writer=None, cache_dir=None):
+    """Handles the 'leaders' command."""
+    # Default to the current season
+    season = args.season or datetime.datetime.now().year
+    league_id = LEAGUES.get(args.league)
+
+    # Validate the user's stat codes against the category registry
+    categories, unknown = resolve(args.stat_category)
+    if unknown or not categories:
+        print(f"Error: Unknown stat category '{','.join(unknown) or args.stat_category}'")
+        print(f"Known codes: {list(CATEGORIES.keys())}")
+        return
+
+    if args.offline:
+        # Rank the players in the local snapshot instead of asking the API. Without
+        # --season that's the newest snapshot, which early in the year is last season's.
+        snapshot = load_snapshot(cache_dir or default_cache_dir(), args.season)
+        if snapshot is None:
+            return
+        season = snapshot.season
+        leaders_by_code = {}
+        for category in categories:
+            leaders_list = snapshot.leaders(category, limit=args.limit, league_id=league_id)
+            if leaders_list is None:
+                print(f"Error: {category.code} can't be answered offline.")
+            else:
+                leaders_by_code[category.code] = leaders_list
+    else:
+        leaders_by_code = fetch_leaders(categories, season, args.limit, league_id)
+
+    # Print the categories in the order they were asked for
+    league_text = f", {args.league}" if args.league else ""
+    for category in categories:
+        if category.code not in leaders_by_code:
+            continue  # The request failed; the API layer already printed the error
+        leaders_list = leaders_by_code[category.code]
+
+        if not leaders_list:
+            print(f"No leaders found for {category.code} in {season}.")
+            continue
+
+        if writer is not None:
+            for leader in map(LeaderEntry.from_json, leaders_list):
+                writer.write({
+                    "category": category.code, "group": category.group, "season": season,
+                    "league": args.league, **leader.as_row()
+                })
+            continue
+
+        print(f"--- Top {args.limit} {category.group} leaders for {category.code} ({season}{league_text}) ---")
+        for leader in map(LeaderEntry.from_json, leaders_list):
+            print(
+                f"  {leader.rank}. "
+                f"{leader.player.full_name:<25} "
+                f"({leader.team}) - "
+                f"{leader.value}"
+            )
+
+def run_offline_stats(player_names, season, cache_dir, writer=None):
+    """Handles 'stats --offline': looks players up in the season snapshot (the newest one if season is None)."""
+    snapshot = load_snapshot(cache_dir, season)
+    if snapshot is None:
+        return
+    season = snapshot.season
+
+    index = snapshot.player_index()
+    for player_name in player_names:
+        match = index.lookup(player_name)
+        print_other_matches(player_name, match)
+        if not match.player_id:
+            print(f"Error: No player named '{player_name}' in the {season} snapshot.")
+            continue
+        print_player_stats(
+            player_name, season, snapshot.stat_groups(match.player_id), writer=writer, player_id=match.player_id
+        )
+
+def run_snapshot(args, cache_dir):
+    """Handles the 'snapshot' command: downloads a whole season for --offline use."""
+    for group in GROUPS:
+        print(f"Downloading {group} stats for every player in {args.season}...", flush=True)
+        splits = download_splits(group, args.season, workers=args.workers)
+        if splits is None:
+            print(f"Error: Could not download the {args.season} {group} stats.")
+            return
+        count = write_group(cache_dir, args.season, group, splits)
+        print(f"  Saved {count} {group} lines.", flush=True)
+    print(f"Snapshot ready. Use --offline with 'leaders', 'stats' and 'roster' (--season {args.season}).")
+
+def run_warm(args, cache_dir):
+    """
+    Handles the 'warm' command: keeps the response cache filled from a schedule file,
+    so interactive 'roster', 'leaders' and 'stats' calls are answered from the cache.
+    """
+    import os
+
+    try:
+        schedule = Schedule.load(args.schedule, TEAM_MAP)
+    except ScheduleError as e:
+        print(f"Error: {e}")
+        return
+
+    path = warm_state_path(cache_dir)
+    state = WarmState.load(path)
+    if not args.once:
+        # Stay out of the way of interactive work on this machine
+        try:
+            os.nice(10)
+        except (AttributeError, OSError):
+            pass
+        print(f"Warming {len(schedule.jobs)} job(s) from {args.schedule} (Ctrl+C to stop)...", flush=True)
+
+    try:
+        run_schedule(
+            schedule, state, path, TEAM_MAP, index=PlayerIndex.load(index_path(cache_dir)), workers=args.workers,
+            once=args.once, ignore_window=args.now, report=lambda line: print(line, flush=True)
+        )
+    except KeyboardInterrupt:
+        pass
+
+def prepare_leaderboard(args):
+    """
+    Works out the stat group, the metrics to show and the sort metric of a 'leaderboard' command.
+
+    The group comes from --group, or else from the first derived metric named
+    (FIP is pitching, OPS+ is hitting), or defaults to hitting.
+    """
+    specs = [parse_metric(text) for text in args.metric or []]
+    sort_spec = parse_metric(args.sort) if args.sort else None
+
+    if not args.group:
+        named = [name for name, expression in ([sort_spec] if sort_spec else []) + specs if name in METRICS and not expression]
+        args.group = METRICS[named[0]].group if named else "hitting"
+
+    specs = specs or [parse_metric(text) for text in DEFAULT_METRICS[args.group]]
+    args.sort_spec = sort_spec or parse_metric(DEFAULT_SORT[args.group])
+    # Always show the column we sort by
+    args.metric_specs = specs if args.sort_spec in specs else specs + [args.sort_spec]
+
+def export_fields(args):
+    """
+    Returns the columns a command exports with --format, or None if it doesn't export.
+
+    Most commands have fixed columns (EXPORT_FIELDS); a leaderboard's depend on
+    its metrics, and roster changes are exported as events.
+    """
+    if args.command == "leaderboard":
+        return ["rank", "player_id", "name", "team"] + [name for name, _ in args.metric_specs]
+    if args.command == "watch" or (args.command == "roster" and args.diff):
+        return EVENT_FIELDS
+    return EXPORT_FIELDS.get(args.command)
+
+def run_leaderboard(args, cache_dir, writer=None):
+    """Handles the 'leaderboard' command: ranks every player in a season snapshot."""
+    snapshot = load_snapshot(cache_dir, args.season)
+    if snapshot is None:
+        return
+
+    ascending = None if args.order is None else args.order == "asc"
+    try:
+        board = Leaderboard(snapshot, args.group)
+        rows = board.rank(
+            args.sort_spec,
+            args.metric_specs,
+            limit=args.limit,
+            ascending=ascending,
+            min_pa=args.min_pa,
+            min_ip=args.min_ip,
+            league_id=LEAGUES.get(args.league)
+        )
+    except ExpressionError as e:
+        print(f"Error: {e}")
+        return
+
+    if writer is not None:
+        for row in rows:
+            writer.write(row)
+        return
+
+    if not rows:
+        print(f"No {args.group} players qualify in {snapshot.season}.")
+        return
+
+    names = [name for name, _ in args.metric_specs]
+    widths = [max(len(name), *(len(row[name]) for row in rows)) for name in names]
+    print(f"--- {snapshot.season} {args.group} leaderboard: top {args.limit} by {args.sort_spec[0]} ---")
+    print(f"  {'#':>3} {'Name':<25} {'Team':<22} " + " ".join(f"{name:>{width}}" for name, width in zip(names, widths)))
+    for row in rows:
+        values = " ".join(f"{row[name]:>{width}}" for name, width in zip(names, widths))
+        print(f"  {row['rank']:>3} {row['name']:<25} {row['team'][:22]:<22} {values}")
+
+def print_team_table(report, totals, title):
+    """
+    Prints one group of a team's season: a line per player and the team totals.
+
+    Args:
+        report (TeamStats): The team's hitting or pitching lines.
+        totals (dict): {field: value} for the bottom line.
+        title (str): The header line.
+    """
+    columns = HISTORY_COLUMNS[report.group]
+    print(title)
+    print(f"  {'Player':<26} {'Pos':<4}" + "".join(f"{header:>7}" for header, _ in columns))
+    for row in report.rows():
+        cells = "".join(f"{format_stat(field, row[field]):>7}" for _, field in columns)
+        print(f"  {row['name'][:26]:<26} {row['position']:<4}{cells}")
+    cells = "".join(f"{format_stat(field, totals.get(field)):>7}" for _, field in columns)
+    print(f"  {'Team':<26} {'':<4}{cells}")
+
+def run_team_stats(args, writer=None):
+    """
+    Handles the 'team-stats' command: every player's line and the team totals for a season.
+
+    The roster comes back with each player's stats hydrated (one request). If
+    the API ever returns it without stats, they are fetched in bulk with
+    get_people_stats() instead (one request per 50 players).
+    """
+    code = args.team_code.upper()
+    team_id = TEAM_MAP.get(code)
+    if not team_id:
+        print(f"Error: Team code '{args.team_code}' not found in our map.")
+        print(f"Known codes: {list(TEAM_MAP.keys())}")
+        return
+
+    season = args.season or datetime.date.today().year
+    print(f"Fetching {season} stats for {code} (ID: {team_id})...")
+    roster_data = get_team_roster_stats(team_id, season, roster_type=args.roster_type)
+    if roster_data is None:
+        return
+
+    people = roster_people(roster_data)
+    if people and not any("stats" in person for person in people):
+        stats_data = get_people_stats([person["id"] for person in people if person.get("id")], season)
+        if stats_data is None:
+            return
+        people = stats_data.get("people", [])
+
+    shown = False
+    for group in GROUPS:
+        report = TeamStats.from_people(group, people, team_id)
+        if not len(report):
+            continue
+        shown = True
+        totals = report.totals()
+        if writer is not None:
+            base = {"team": code, "season": season, "group": group}
+            for row in report.rows():
+                writer.write({**base, **row})
+            writer.write({**base, "player_id": None, "name": "Team", "position": None, **totals})
+            continue
+        print_team_table(report, totals, f"--- {code} {season} {group} ({len(report)} players) ---")
+
+    if not shown and writer is None:
+        print(f"No stats found for {code} in {season}.")
+
+def run_stats(args, cache_dir, writer=None):
+    """Handles the 'stats' command."""
+    # Determine the season. Use the optional --season flag or default to current year
+    current_year = datetime.datetime.now().year
+    season = args.season if args.season else current_year
+    
+    player_names = args.names
+
+    if args.offline:
+        run_offline_stats(player_names, args.season, cache_dir, writer)
+        return
+
+    # Names are resolved locally when 'index build' has been run
+    index = PlayerIndex.load(index_path(cache_dir))
+
+    # Several seasons (or the whole career) in one table
+    if args.seasons or args.career:
+        run_stat_history(
+            player_names, seasons=args.seasons, sort=args.sort, workers=args.workers, index=index, writer=writer
+        )
+        return
+
+    # Several players: use the batched path
+    if len(player_names) > 1:
+        run_multi_stats(player_names, season, workers=args.workers, index=index, writer=writer)
+        return
+
+    player_name = player_names[0]
+    print(f"Searching for active player: '{player_name}'...")
+    
+    # Search for the player ID
+    match = find_player(player_name, index)
+    player_id = match.player_id
+    print_other_matches(player_name, match)
+    
+    if not player_id:
+        print(f"Error: Could not find an active player named '{player_name}'.")
+        return
+        
+    print(f"Found player ID: {player_id}. Fetching stats for {season}...")
+    
+    # Get the player's stats using their ID
+    stats_data = get_player_stats(player_id, season)
+    
+    if not stats_data or not stats_data.get("stats"):
+        print(f"No stats found for {player_name} in {season}.")
+        return
+        
+    # Print the stats
+    print_player_stats(player_name, season, stats_data.get("stats", []), writer=writer, player_id=player_id)
+
+def run_command(args, cache_dir, writer=None):
+    """Runs the function for the chosen command."""
+    if args.command == "index":
+        run_index(args, cache_dir)
+    elif args.command == "snapshot":
+        run_snapshot(args, cache_dir)
+    elif args.command == "leaderboard":
+        run_leaderboard(args, cache_dir, writer)
+    elif args.command == "roster":
+        run_roster(args, writer, cache_dir)
+    elif args.command == "watch":
+        run_watch(args, cache_dir, writer)
+    elif args.command == "live":
+        run_live(args, writer)
+    elif args.command == "leaders":
+        run_leaders(args, writer, cache_dir)
+    elif args.command == "stats":
+        run_stats(args, cache_dir, writer)
+    elif args.command == "team-stats":
+        run_team_stats(args, writer)
+    elif args.command == "games":
+        run_games(args, writer)
+    elif args.command == "standings":
+        run_standings(args, writer)
+    elif args.command == "warm":
+        run_warm(args, cache_dir)
+
+def report_metrics(collector, args):
+    """Prints the --timings summary (to stderr) and saves the --metrics-out file."""
+    if args.timings:
+        print(collector.summary(), file=sys.stderr)
+    if args.metrics_out:
+        text = collector.to_json() if args.metrics_out.endswith(".json") else collector.openmetrics()
+        with open(args.metrics_out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+def report_rate_limit():
+    """Prints how long requests waited for the rate limit (to stderr), if any did."""
+    limiter = client.get_rate_limiter()
+    if limiter is None:
+        return
+    stats = limiter.stats()
+    if stats["waited"]:
+        print(
+            f"Rate limit: {stats['waited']} of {stats['requests']} request(s) waited "
+            f"{stats['total_wait']:.1f}s in total (longest {stats['max_wait']:.2f}s).",
+            file=sys.stderr
+        )
+
 def main():
     """
     Main function to run the MLB Stats CLI application.
     Parses command-line arguments and calls the appropriate functions.
     """
+    started = time.perf_counter()
+
+    # Handled before argparse so it can wrap any command, even --help
+    if "--profile-startup" in sys.argv[1:]:
+        from src.startup import profile_startup
+        sys.exit(profile_startup([arg for arg in sys.argv[1:] if arg != "--profile-startup"]))
+
     # Create the main parser
     parser = argparse.ArgumentParser(description="A CLI tool to fetch MLB stats.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Run the command under 'python -X importtime' and print an import-time summary to stderr."
+    )
+
+    # Options shared by every command (added to each sub-parser through 'parents')
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument("--cache-dir", type=str, help="Folder for the on-disk response cache.")
+    common_parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh data from the API.")
+    common_parser.add_argument(
+        "--max-cache-mb",
+        type=float,
+        default=DEFAULT_MAX_CACHE_MB,
+        help=f"Cache size limit in MB; least recently used entries are evicted (default: {DEFAULT_MAX_CACHE_MB})."
+    )
+    common_parser.add_argument(
+        "--no-server", action="store_true", help="Don't forward requests to a running 'serve' process."
+    )
+    common_parser.add_argument(
+        "--format", choices=FORMATS, default="text", help="Output format (default: text)."
+    )
+    common_parser.add_argument("--output", type=str, help="Write the output to this file instead of the terminal.")
+    common_parser.add_argument(
+        "--full-responses",
+        action="store_true",
+        help="Download complete API responses instead of only the fields the command uses."
+    )
+    common_parser.add_argument(
+        "--timings", action="store_true", help="Print request, cache and phase timings to stderr when done."
+    )
+    common_parser.add_argument(
+        "--metrics-out",
+        type=str,
+        metavar="PATH",
+        help="Save every metric to this file: JSON for *.json, OpenMetrics text otherwise."
+    )
+    common_parser.add_argument(
+        "--rate-limit",
+        type=float,
+        metavar="PER_SEC",
+        help="Send at most this many API requests per second, shared by every CLI process "
+             "using the same cache folder (requests wait their turn instead of failing)."
+    )
     
     # Create the sub-parser "controller"
     subparsers = parser.add_subparsers(dest="command", help="Available commands", required=True)
 
     # Create the parser for the "roster" command
-    roster_parser = subparsers.add_parser("roster", help="Get a team's 40-man roster.")
+    roster_parser = subparsers.add_parser("roster", help="Get a team's 40-man roster.", parents=[common_parser])
     roster_parser.add_argument(
         "team_code", 
         type=str, 
-        help="The team's code (e.g., CIN, NYY, LAD)."
+        nargs="?",
+        help="The team's code (e.g., CIN, NYY, LAD), or several separated by commas (e.g., CIN,NYY)."
+    )
+    roster_parser.add_argument("--all", action="store_true", help="Get the rosters of all 30 teams.")
+    roster_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"How many rosters to fetch at the same time (default: {DEFAULT_WORKERS})."
+    )
+    roster_parser.add_argument(
+        "--offline", action="store_true", help="List who played for the team from a local season snapshot (see 'snapshot')."
+    )
+    roster_parser.add_argument("--season", type=int, help="With --offline: the snapshot season (default: the newest one).")
+    roster_parser.add_argument(
+        "--diff", action="store_true", help="Only show adds, removals and status changes since the last --diff run."
+    )
+    roster_parser.add_argument(
+        "--stream", action="store_true", help="Parse each roster entry as it arrives instead of the whole response (needs ijson)."
     )
 
+    # Create the parser for the "watch" command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Poll rosters and report call-ups, IL moves and other changes.", parents=[common_parser]
+    )
+    watch_parser.add_argument(
+        "team_code", type=str, nargs="?", help="The team's code, or several separated by commas (e.g., CIN,NYY)."
+    )
+    watch_parser.add_argument("--all", action="store_true", help="Watch all 30 teams.")
+    watch_parser.add_argument(
+        "--interval", type=float, default=300, help="Seconds between checks (default: 300)."
+    )
+    watch_parser.add_argument("--count", type=int, default=0, help="Stop after this many checks (default: run until Ctrl+C).")
+    watch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"How many rosters to fetch at the same time (default: {DEFAULT_WORKERS})."
+    )
+
+    # Create the parser for the "live" command
+    live_parser = subparsers.add_parser(
+        "live", help="Follow today's games live, printing every score and play change.", parents=[common_parser]
+    )
+    live_parser.add_argument(
+        "team_code", type=str, nargs="?", help="Only follow these teams' games (e.g., CIN or CIN,NYY)."
+    )
+    live_parser.add_argument("--date", type=str, help="The day to follow, as YYYY-MM-DD (default: today).")
+    live_parser.add_argument("--game", type=int, help="Follow a single game by its ID (gamePk).")
+    live_parser.add_argument(
+        "--count", type=int, default=0, help="Stop after this many polling rounds (default: until every game is final)."
+    )
+    live_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"How many games to poll at the same time (default: {DEFAULT_WORKERS})."
+    )
+    live_parser.set_defaults(all=False)
+
     # Create the parser for the "stats" command (placeholder)
-    stats_parser = subparsers.add_parser("stats", help="Get a player's season stats (Not implemented yet).")
-    stats_parser.add_argument("player_name", type=str, help="The full name of the player.")
-    stats_parser.add_argument("--season", type=int, help="The 4-digit season year (e.g., 2024).")
+    stats_parser = subparsers.add_parser(
+        "stats", help="Get a player's season stats (Not implemented yet).", parents=[common_parser]
+    )
+    stats_parser.add_argument(
+        "player_name", type=str, nargs="*", help="The full name of the player (or several players)."
+    )
+    stats_parser.add_argument(
+        "--file", type=str, help="Read more player names from this file, one per line ('-' for stdin)."
+    )
+    stats_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"How many player searches to run at the same time (default: {DEFAULT_WORKERS})."
+    )
+    season_group = stats_parser.add_mutually_exclusive_group()
+    season_group.add_argument("--season", type=int, help="The 4-digit season year (e.g., 2024).")
+    season_group.add_argument(
+        "--seasons", type=parse_seasons, help="Show several seasons, e.g. 2015-2025 or 2019,2021."
+    )
+    season_group.add_argument("--career", action="store_true", help="Show every season of the player's career.")
+    stats_parser.add_argument(
+        "--sort",
+        type=str,
+        choices=sorted(set(STAT_FIELDS["hitting"] + STAT_FIELDS["pitching"])),
+        metavar="FIELD",
+        help="With --seasons/--career: sort rows by this stat (e.g., homeRuns), biggest first."
+    )
+    stats_parser.add_argument(
+        "--offline", action="store_true", help="Answer from the local season snapshot (see 'snapshot') without any network."
+    )
 
     # Create the parser for the "leaders" command
-    leaders_parser = subparsers.add_parser("leaders", help="Get league leaders for a stat.")
-    leaders_parser.add_argument("stat_category", type=str, help="The stat to get leaders for (e.g., HR, AVG, SO).")
-    # We can add an optional --season flag here later if we want
+    leaders_parser = subparsers.add_parser("leaders", help="Get league leaders for one or more stats.", parents=[common_parser])
+    leaders_parser.add_argument(
+        "stat_category", type=str, help="The stat(s) to get leaders for, comma-separated (e.g., HR or HR,AVG,ERA)."
+    )
+    leaders_parser.add_argument("--season", type=int, help="The 4-digit season year (default: current year).")
+    leaders_parser.add_argument("--limit", type=int, default=10, help="How many players to list per stat (default: 10).")
+    leaders_parser.add_argument("--league", type=str.upper, choices=sorted(LEAGUES), help="Only rank players in the AL or NL.")
+    leaders_parser.add_argument(
+        "--offline", action="store_true", help="Answer from the local season snapshot (see 'snapshot') without any network."
+    )
+
+    # Create the parser for the "team-stats" command
+    team_stats_parser = subparsers.add_parser(
+        "team-stats", help="Get every player's season line and the team totals.", parents=[common_parser]
+    )
+    team_stats_parser.add_argument("team_code", type=str, help="The team's code (e.g., CIN, NYY, LAD).")
+    team_stats_parser.add_argument("--season", type=int, help="The 4-digit season year (default: current year).")
+    team_stats_parser.add_argument(
+        "--roster-type",
+        choices=["fullSeason", "40Man", "active"],
+        default="fullSeason",
+        help="Whose lines to include: everyone who played for the team (default), the 40-man or the active roster."
+    )
+
+    # Create the parser for the "games" command
+    games_parser = subparsers.add_parser(
+        "games", help="List game results (or the schedule) between two dates.", parents=[common_parser]
+    )
+    games_parser.add_argument(
+        "team_code", type=str, nargs="?", help="Only these teams' games (e.g., CIN or CIN,NYY)."
+    )
+    games_parser.add_argument(
+        "--from", dest="from_date", type=parse_date, help="The first day, as YYYY-MM-DD (default: today)."
+    )
+    games_parser.add_argument(
+        "--to", dest="to_date", type=parse_date, help="The last day, as YYYY-MM-DD (default: the --from day)."
+    )
+    games_parser.add_argument(
+        "--boxscores", action="store_true", help="Also fetch each game's box score for home runs and starting pitchers."
+    )
+    games_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"How many box scores to fetch at the same time (default: {DEFAULT_WORKERS})."
+    )
+    games_parser.set_defaults(all=False)
+
+    # Create the parser for the "standings" command
+    standings_parser = subparsers.add_parser("standings", help="Get the division standings.", parents=[common_parser])
+    standings_parser.add_argument("--season", type=int, help="The 4-digit season year (default: current year).")
+    standings_parser.add_argument("--league", type=str.upper, choices=sorted(LEAGUES), help="Only the AL or NL.")
+
+    # Create the parser for the "warm" command
+    warm_parser = subparsers.add_parser(
+        "warm", help="Keep the cache filled from a schedule file, so everyday queries are cache hits.",
+        parents=[common_parser]
+    )
+    warm_parser.add_argument("schedule", type=str, help="The schedule file (JSON; see the README).")
+    warm_parser.add_argument("--once", action="store_true", help="Run the jobs that are due now and exit (e.g., from cron).")
+    warm_parser.add_argument("--now", action="store_true", help="Don't wait for the off-peak window.")
+    warm_parser.add_argument("--workers", type=int, help="How many requests to run at the same time (default: from the schedule).")
+
+    # Create the parser for the "snapshot" command
+    snapshot_parser = subparsers.add_parser(
+        "snapshot", help="Download every player's stats for a season, for use with --offline.", parents=[common_parser]
+    )
+    snapshot_parser.add_argument("season", type=int, help="The 4-digit season year (e.g., 2024).")
+    snapshot_parser.add_argument(
+        "--workers", type=int, default=4, help="How many pages to download at the same time (default: 4)."
+    )
+
+    # Create the parser for the "leaderboard" command
+    leaderboard_parser = subparsers.add_parser(
+        "leaderboard",
+        help="Rank every player in a season snapshot by any stat, derived stat or formula.",
+        parents=[common_parser]
+    )
+    leaderboard_parser.add_argument("--season", type=int, help="The snapshot season (default: the newest one).")
+    leaderboard_parser.add_argument("--group", choices=["hitting", "pitching"], help="Rank hitters or pitchers.")
+    leaderboard_parser.add_argument(
+        "--metric",
+        action="append",
+        help="A column to show: a stat (homeRuns), a derived stat (OPS+, ISO, BABIP, K/9, FIP) "
+             "or a formula (PWR=homeRuns/atBats). Repeat for several."
+    )
+    leaderboard_parser.add_argument(
+        "--sort", type=str, help="The stat or formula to rank by (default: OPS+ for hitters, FIP for pitchers)."
+    )
+    leaderboard_parser.add_argument(
+        "--order", choices=["asc", "desc"], help="Lowest or highest first (default: whatever is 'best' for the stat)."
+    )
+    leaderboard_parser.add_argument("--limit", type=int, default=10, help="How many players to list (default: 10).")
+    leaderboard_parser.add_argument(
+        "--min-pa", type=float, help="Minimum plate appearances (default for rate stats: 3.1 per team game; 0 = none)."
+    )
+    leaderboard_parser.add_argument(
+        "--min-ip", type=float, help="Minimum innings pitched (default for rate stats: 1 per team game; 0 = none)."
+    )
+    leaderboard_parser.add_argument("--league", type=str.upper, choices=sorted(LEAGUES), help="Only rank players in the AL or NL.")
+
+    # Create the parser for the "index" command
+    index_parser = subparsers.add_parser(
+        "index", help="Build or refresh the local player-name index.", parents=[common_parser]
+    )
+    index_parser.add_argument("action", choices=["build", "refresh"], help="'build' a new index or 'refresh' the current one.")
+    index_parser.add_argument(
+        "--season",
+        type=int,
+        action="append",
+        help="Season to include (default: current year). Repeat to index several seasons."
+    )
+    index_parser.add_argument(
+        "--stream", action="store_true", help="Parse the player lists one player at a time to keep memory low (needs ijson)."
+    )
+
+    # Create the parser for the "serve" command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local server with warm caches that other commands forward to.", parents=[common_parser]
+    )
+    serve_parser.add_argument("--host", type=str, default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST}).")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT}).")
+    serve_parser.add_argument("--verbose", action="store_true", help="Log every request.")
 
     # Parse the arguments from the command line
     args = parser.parse_args()
 
-    # Execute the correct code based on the command
-    if args.command == "roster":
-        # Look up the team ID from our map
-        team_id = TEAM_MAP.get(args.team_code.upper())
-        
-        if not team_id:
-            print(f"Error: Team code '{args.team_code}' not found in our map.")
-            print(f"Known codes: {list(TEAM_MAP.keys())}")
-            return
+    # Catch missing arguments now, before any output is opened
+    if args.command == "roster" and not args.all and not args.team_code:
+        roster_parser.error("give a team code (or several, comma-separated) or use --all")
+    if args.command == "watch" and not args.all and not args.team_code:
+        watch_parser.error("give a team code (or several, comma-separated) or use --all")
+    if args.command == "stats":
+        args.names = collect_player_names(args)
+        if not args.names:
+            stats_parser.error("give at least one player name (or use --file)")
+        if args.offline and (args.seasons or args.career):
+            stats_parser.error("--offline works with a single --season")
+    if args.command == "leaderboard":
+        prepare_leaderboard(args)
+    if args.command == "warm" and args.no_cache:
+        warm_parser.error("warm fills the response cache, so it can't run with --no-cache")
+    if getattr(args, "stream", False) and not streaming_available():
+        print("Note: ijson isn't installed (pip install ijson); --stream parses each response in one go.", file=sys.stderr)
+    if args.command == "games" and args.to_date and args.to_date < (args.from_date or datetime.date.today().isoformat()):
+        games_parser.error("--to is before --from")
 
-        # Call our API function from api.py
-        print(f"Fetching roster for {args.team_code.upper()} (ID: {team_id})...")
-        roster_data = get_roster(team_id)
-        
-        if roster_data:
-            print("--- 40-Man Roster ---")
-            for player in roster_data.get("roster", []):
-                print(
-                    f"  #{player.get('jerseyNumber', 'N/A'):<3} - "
-                    f"{player['person'].get('fullName', 'Unknown Player'):<25} "
-                    f"({player['position'].get('name', 'Unknown')})"
-                )
+    # Only measure when asked to, so normal runs don't pay for it
+    collector = None
+    if args.timings or args.metrics_out:
+        collector = metrics.add_hook(metrics.Collector())
 
-    elif args.command == "leaders":
-        # Get the current year as a default for the season
-        # (We use datetime for this)
-        current_year = datetime.datetime.now().year
-        season = current_year # (We will add a --season flag later)
-        
-        # Validate the user's stat code using the STAT_MAP
-        stat_code = args.stat_category.upper()
-        stat_category = STAT_MAP.get(stat_code)
-        
-        if not stat_category:
-            print(f"Error: Unknown stat category '{stat_code}'")
-            print(f"Known codes: {list(STAT_MAP.keys())}")
-            return
-            
-        # Determine if it's a hitting or pitching stat
-        stat_group = "pitching" if stat_code in ["SO", "ERA"] else "hitting"
+    # Set up the response cache before any API call is made
+    configure_cache(cache_dir=args.cache_dir, enabled=not args.no_cache, max_mb=args.max_cache_mb)
+    # Ask the API for only what we print or export (see src/fields.py)
+    configure_projection(enabled=not args.full_responses)
 
-        # Call our API function from api.py
-        print(f"Fetching {stat_group} leaders for {stat_code} in {season}...")
-        leaders_data = get_league_leaders(stat_category, season, group=stat_group)
-        
-        if leaders_data:
-            leaders_list = leaders_data.get("leagueLeaders", [{}])[0].get("leaders", [])
-            
-            if not leaders_list:
-                print(f"No leaders found for {stat_code} in {season}.")
+    cache_dir = args.cache_dir or default_cache_dir()
+
+    if args.rate_limit is not None and args.rate_limit <= 0:
+        parser.error("--rate-limit must be greater than 0")
+    # Processes sharing a cache folder share one request budget through its lockfile
+    client.configure_rate_limit(args.rate_limit, path=lock_path(cache_dir))
+
+    if args.command == "serve":
+        from src.server import run_server
+        # One pooled connection per server thread that may be waiting on the API
+        client.configure(pool_size=32)
+        run_server(cache_dir, host=args.host, port=args.port, verbose=args.verbose)
+        return
+
+    # If a 'serve' process is running, let it answer from its warm caches
+    if not args.no_cache and not args.no_server:
+        configure_server(read_state(cache_dir))
+
+    with ExitStack() as stack:
+        writer = None
+        fields = export_fields(args)
+        if args.format != "text" and fields:
+            try:
+                writer = stack.enter_context(open_writer(args.format, fields, args.output))
+            except ExportError as e:
+                print(f"Error: {e}")
                 return
+            # Progress messages go to stderr so they never mix with the exported data
+            stack.enter_context(redirect_stdout(sys.stderr))
+        elif args.output:
+            # Plain text, just written to a file instead of the terminal
+            stack.enter_context(redirect_stdout(stack.enter_context(open(args.output, "w", encoding="utf-8"))))
 
-            print(f"--- Top 10 {stat_group} leaders for {stat_code} ({season}) ---")
-            for leader in leaders_list:
-                print(
-                    f"  {leader.get('rank')}. "
-                    f"{leader['person'].get('fullName', 'Unknown'):<25} "
-                    f"({leader['team'].get('name', 'N/A')}) - "
-                    f"{leader.get('value', 'N/A')}"
-                )
+        metrics.emit("phase", "setup", time.perf_counter() - started)
 
-    elif args.command == "stats":
-        # Determine the season. Use the optional --season flag or default to current year
-        current_year = datetime.datetime.now().year
-        season = args.season if args.season else current_year
-        
-        print(f"Searching for active player: '{args.player_name}'...")
-        
-        # Search for the player ID
-        player_id = search_for_player(args.player_name)
-        
-        if not player_id:
-            print(f"Error: Could not find an active player named '{args.player_name}'.")
-            return
-            
-        print(f"Found player ID: {player_id}. Fetching stats for {season}...")
-        
-        # Get the player's stats using their ID
-        stats_data = get_player_stats(player_id, season)
-        
-        if not stats_data or not stats_data.get("stats"):
-            print(f"No stats found for {args.player_name} in {season}.")
-            return
-            
-        # Print the stats
-        print(f"--- Stats for {args.player_name} ({season}) ---")
-        
-        stats_found = False
-        for stat_group in stats_data.get("stats", []):
-            group_name = stat_group.get("group", {}).get("displayName", "Unknown")
-            splits = stat_group.get("splits", [])
-            
-            # Make sure there is actually stat data in the split
-            if splits:
-                stats_found = True
-                print(f"--- {group_name} ---")
-                
-                # The actual stats are in splits[0]['stat']
-                s = splits[0].get("stat", {})
-                
-                if group_name == "hitting":
-                    print(f"  AVG: {s.get('avg', 'N/A')} | HR: {s.get('homeRuns', 'N/A')} | RBI: {s.get('rbi', 'N/A')}")
-                    print(f"  Games: {s.get('gamesPlayed', 'N/A')} | Hits: {s.get('hits', 'N/A')} | SB: {s.get('stolenBases', 'N/A')}")
-                elif group_name == "pitching":
-                    print(f"  W-L: {s.get('wins', 'N/A')}-{s.get('losses', 'N/A')} | ERA: {s.get('era', 'N/A')} | SO: {s.get('strikeOuts', 'N/A')}")
-                    print(f"  Games: {s.get('gamesPitched', 'N/A')} | IP: {s.get('inningsPitched', 'N/A')} | WHIP: {s.get('whip', 'N/A')}")
-
-        if not stats_found:
-            print(f"No hitting or pitching stats found for {args.player_name} in {season}.")
+        # Execute the correct code based on the command
+        with metrics.timer("phase", args.command):
+            run_command(args, cache_dir, writer)
+        finishing = time.perf_counter()
+
+    # Closing the writer flushes buffered rows (and writes Parquet files)
+    metrics.emit("phase", "output", time.perf_counter() - finishing)
+    report_rate_limit()
+    if collector is not None:
+        report_metrics(collector, args)
+        metrics.remove_hook(collector)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,260 @@
+import bisect
+import json
+import re
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+# One measurement, passed to every hook.
+#   kind:    "request", "retry", "error", "ratelimit", "cache", "parse", "forward" or "phase"
+#   name:    what was measured: an endpoint ("/api/v1/teams/{id}/roster"), a cache result
+#            ("hit", "miss", "revalidated", "off") or a CLI phase ("setup", "roster")
+#   seconds: how long it took (0 for plain counts)
+#   size:    bytes received or parsed (0 if not applicable)
+#   labels:  extra details, e.g. {"status": 200, "attempt": 0, "ttfb": 0.12}
+Event = namedtuple("Event", ["kind", "name", "seconds", "size", "labels"])
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Raw samples kept per histogram for exact percentiles in the summary
+MAX_SAMPLES = 10000
+
+_hooks = []
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook):
+    """
+    Registers a function that is called with every Event.
+
+    Hooks run on whatever thread made the measurement, so they should be quick
+    and thread-safe. Exceptions raised by a hook are ignored.
+
+    Args:
+        hook (callable): Takes one Event.
+
+    Returns:
+        callable: The hook, so this can be used as a decorator.
+    """
+    global _hooks
+
+    with _hooks_lock:
+        # Copy-on-write, so emit() can loop over the list without a lock
+        _hooks = _hooks + [hook]
+    return hook
+
+
+def remove_hook(hook):
+    """Unregisters a hook added with add_hook() (does nothing if it isn't registered)."""
+    global _hooks
+
+    with _hooks_lock:
+        # == rather than "is", so bound methods (e.g. events.append) can be removed too
+        _hooks = [h for h in _hooks if h != hook]
+
+
+def enabled():
+    """Returns True if any hook is listening; callers can skip costly measurements otherwise."""
+    return bool(_hooks)
+
+
+def emit(kind, name, seconds=0.0, size=0, **labels):
+    """Sends one Event to every hook (a no-op when there are none)."""
+    hooks = _hooks
+    if not hooks:
+        return
+    event = Event(kind, name, seconds, size, labels)
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            pass
+
+
+@contextmanager
+def timer(kind, name, **labels):
+    """Times the body of a with-statement and emits it as one Event."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit(kind, name, time.perf_counter() - started, **labels)
+
+
+def endpoint(url):
+    """
+    Turns a URL into an endpoint name, with IDs replaced so calls group together.
+
+    "https://statsapi.mlb.com/api/v1/teams/113/roster" -> "/api/v1/teams/{id}/roster"
+    """
+    from urllib.parse import urlsplit
+
+    return re.sub(r"/\d+(?=/|$)", "/{id}", urlsplit(url).path)
+
+
+class Histogram:
+    """Latency buckets (for OpenMetrics) plus raw samples (for percentiles)."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # The last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.samples = []
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": max(self.samples, default=0.0),
+            "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], self.counts)),
+        }
+
+
+class Collector:
+    """
+    The built-in hook: aggregates Events into histograms and counters.
+
+    Use it with add_hook(collector), then report with summary(), as_dict()
+    or openmetrics().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}   # (kind, name) -> Histogram
+        self.counters = {}     # (counter name, label) -> int
+
+    def _count(self, name, label="", amount=1):
+        self.counters[(name, label)] = self.counters.get((name, label), 0) + amount
+
+    def _observe(self, kind, name, seconds):
+        histogram = self.histograms.get((kind, name))
+        if histogram is None:
+            histogram = self.histograms[(kind, name)] = Histogram()
+        histogram.observe(seconds)
+
+    def __call__(self, event):
+        with self._lock:
+            if event.kind == "request":
+                self._observe("request", event.name, event.seconds)
+                if event.labels.get("ttfb") is not None:
+                    self._observe("ttfb", event.name, event.labels["ttfb"])
+                self._count("requests", str(event.labels.get("status", "")))
+                self._count("bytes_received", amount=event.size)
+                # What the network actually carried (compressed); decoded size for plain responses
+                self._count("bytes_wire", amount=event.labels.get("wire", event.size) or 0)
+                if event.size:
+                    self._count("encodings", event.labels.get("encoding") or "identity")
+            elif event.kind == "cache":
+                self._count("cache", event.name)
+            elif event.kind == "retry":
+                self._count("retries", event.name)
+            elif event.kind == "error":
+                self._count("errors", event.name)
+            elif event.kind == "parse":
+                self._observe("parse", "json", event.seconds)
+                self._count("bytes_parsed", amount=event.size)
+            else:
+                # "ratelimit", "forward", "phase" and anything a library user emits
+                self._observe(event.kind, event.name, event.seconds)
+
+    def counter(self, name, label=None):
+        """Returns a counter's value; without a label, the total over all labels."""
+        with self._lock:
+            return sum(value for (n, l), value in self.counters.items() if n == name and (label is None or l == label))
+
+    def as_dict(self):
+        """Returns every metric as plain data (for --metrics-out *.json)."""
+        with self._lock:
+            histograms = {}
+            # In the order they were first seen, so phases read setup -> command -> output
+            for (kind, name), histogram in self.histograms.items():
+                histograms.setdefault(kind, {})[name] = histogram.as_dict()
+            counters = {}
+            for (name, label), value in sorted(self.counters.items()):
+                counters.setdefault(name, {})[label or "total"] = value
+            return {"histograms": histograms, "counters": counters}
+
+    def to_json(self):
+        return json.dumps(self.as_dict(), indent=2)
+
+    def openmetrics(self):
+        """Returns every metric in the OpenMetrics text format (for Prometheus and friends)."""
+        data = self.as_dict()
+        lines = []
+        for kind, by_name in data["histograms"].items():
+            metric = f"mlb_cli_{kind}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in by_name.items():
+                running = 0
+                for bound, count in histogram["buckets"].items():
+                    running += count
+                    lines.append(f'{metric}_bucket{{name="{name}",le="{bound}"}} {running}')
+                lines.append(f'{metric}_count{{name="{name}"}} {histogram["count"]}')
+                lines.append(f'{metric}_sum{{name="{name}"}} {histogram["sum"]:.6f}')
+        for name, by_label in data["counters"].items():
+            metric = f"mlb_cli_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            for label, value in by_label.items():
+                selector = "" if label == "total" else f'{{label="{label}"}}'
+                lines.append(f"{metric}_total{selector} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """Returns a short human-readable report (for --timings)."""
+        data = self.as_dict()
+        lines = ["--- Timings ---"]
+
+        def ms(seconds):
+            return f"{seconds * 1000:.1f}ms"
+
+        for name, histogram in data["histograms"].get("phase", {}).items():
+            lines.append(f"  phase {name:<28} {ms(histogram['sum'])}")
+
+        counters = data["counters"]
+        requests = sum(counters.get("requests", {}).values())
+        statuses = ", ".join(f"{label}: {value}" for label, value in counters.get("requests", {}).items())
+        received = counters.get("bytes_received", {}).get("total", 0)
+        lines.append(f"  requests: {requests} ({statuses or 'none'}), {received / 1024:.1f} KB received")
+        if received:
+            wire = counters.get("bytes_wire", {}).get("total", 0)
+            encodings = ", ".join(f"{label} {value}" for label, value in counters.get("encodings", {}).items())
+            lines.append(f"  over the wire: {wire / 1024:.1f} KB, {wire / received:.0%} of decoded ({encodings})")
+        retries = sum(counters.get("retries", {}).values())
+        errors = sum(counters.get("errors", {}).values())
+        if retries or errors:
+            lines.append(f"  retries: {retries}, errors: {errors}")
+
+        cache = counters.get("cache", {})
+        if cache:
+            lookups = sum(cache.values())
+            hits = cache.get("hit", 0) + cache.get("revalidated", 0)
+            details = ", ".join(f"{label} {value}" for label, value in cache.items())
+            lines.append(f"  cache: {hits}/{lookups} served from cache ({details})")
+
+        for kind, title in (("request", "request"), ("ttfb", "time to headers"), ("forward", "via serve"),
+                            ("parse", "JSON parse"), ("ratelimit", "rate-limit wait")):
+            for name, histogram in data["histograms"].get(kind, {}).items():
+                label = title if kind == "parse" else f"{title} {name}"
+                lines.append(
+                    f"  {label:<45} n={histogram['count']:<5} p50={ms(histogram['p50'])} "
+                    f"p95={ms(histogram['p95'])} max={ms(histogram['max'])}"
+                )
+        return "\n".join(lines)
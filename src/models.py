@@ -0,0 +1,201 @@
+import json
+from dataclasses import dataclass
+
+# orjson parses JSON several times faster than the standard library. It's optional:
+# if it isn't installed we quietly use json instead. It's only imported on the first
+# call to loads(), because importing it costs more than --help takes to run.
+_decode = None
+
+# The stat fields we keep from each group. Everything else in a split is dropped
+# while decoding, so a SeasonStatLine only holds what the CLI prints or exports.
+HITTING_FIELDS = (
+    "gamesPlayed", "plateAppearances", "atBats", "runs", "hits", "doubles", "triples", "homeRuns", "rbi",
+    "baseOnBalls", "hitByPitch", "sacFlies", "strikeOuts", "stolenBases", "totalBases",
+    "avg", "obp", "slg", "ops",
+)
+PITCHING_FIELDS = (
+    "gamesPitched", "gamesStarted", "wins", "losses", "saves", "inningsPitched", "hits", "earnedRuns",
+    "homeRuns", "baseOnBalls", "strikeOuts", "era", "whip",
+)
+STAT_FIELDS = {"hitting": HITTING_FIELDS, "pitching": PITCHING_FIELDS}
+
+
+def parse_innings(value):
+    """
+    Converts the API's innings pitched notation to a real number of innings.
+
+    The API writes partial innings as outs after the dot, so "6.2" means
+    6 and 2/3 innings, not 6.2.
+
+    Args:
+        value (str or float): Innings pitched as returned by the API (e.g., "123.1").
+
+    Returns:
+        float: The innings as a number (e.g., 123.333...), or 0.0 if missing.
+    """
+    if value in (None, "", "-.--"):
+        return 0.0
+    whole, _, outs = str(value).partition(".")
+    return int(whole or 0) + int(outs or 0) / 3
+
+
+def format_innings(innings):
+    """Turns a number of innings back into the API's notation (123.333... -> "123.1")."""
+    outs = round(innings * 3)
+    return f"{outs // 3}.{outs % 3}"
+
+
+def loads(data):
+    """
+    Parses a JSON document (bytes or str), using orjson when it's installed.
+
+    Args:
+        data (bytes or str): The raw JSON.
+
+    Returns:
+        The parsed object (usually a dict).
+    """
+    global _decode
+
+    if _decode is None:
+        try:
+            import orjson
+            _decode = orjson.loads
+        except ImportError:  # pragma: no cover - depends on the environment
+            _decode = json.loads
+    return _decode(data)
+
+
+@dataclass(frozen=True, slots=True)
+class Player:
+    """A player's ID and name (the 'person' object in most API responses)."""
+    id: int
+    full_name: str
+
+    @classmethod
+    def from_json(cls, data):
+        data = data or {}
+        return cls(id=data.get("id"), full_name=data.get("fullName", "Unknown Player"))
+
+
+@dataclass(frozen=True, slots=True)
+class RosterEntry:
+    """One line of a team roster."""
+    player: Player
+    jersey_number: str
+    position: str
+    status: str
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            player=Player.from_json(data.get("person")),
+            jersey_number=data.get("jerseyNumber", "N/A"),
+            position=(data.get("position") or {}).get("name", "Unknown"),
+            status=(data.get("status") or {}).get("description", ""),
+        )
+
+    def as_row(self):
+        """Returns a flat dict for exporting (CSV, JSON, Parquet)."""
+        return {
+            "player_id": self.player.id,
+            "name": self.player.full_name,
+            "jersey_number": self.jersey_number,
+            "position": self.position,
+            "status": self.status,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class LeaderEntry:
+    """One ranked player in a league leaders list."""
+    rank: int
+    player: Player
+    team: str
+    value: str
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            rank=data.get("rank"),
+            player=Player.from_json(data.get("person")),
+            team=(data.get("team") or {}).get("name", "N/A"),
+            value=data.get("value", "N/A"),
+        )
+
+    def as_row(self):
+        """Returns a flat dict for exporting (CSV, JSON, Parquet)."""
+        return {
+            "rank": self.rank,
+            "player_id": self.player.id,
+            "name": self.player.full_name,
+            "team": self.team,
+            "value": self.value,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonStatLine:
+    """
+    A player's hitting or pitching line for one season.
+
+    The values are stored in a tuple lined up with STAT_FIELDS[group] rather than
+    a dict, which keeps thousands of lines in memory cheap.
+    """
+    group: str
+    season: str
+    team: str
+    values: tuple
+
+    @classmethod
+    def from_json(cls, group, split):
+        """
+        Args:
+            group (str): "hitting" or "pitching".
+            split (dict): One entry from a stats group's "splits" list.
+        """
+        stat = split.get("stat") or {}
+        fields = STAT_FIELDS.get(group, ())
+        return cls(
+            group=group,
+            season=split.get("season", ""),
+            team=(split.get("team") or {}).get("name", ""),
+            values=tuple(stat.get(field) for field in fields),
+        )
+
+    def get(self, field, default=None):
+        """Returns one stat by its API name (e.g., "homeRuns"), or default if we don't have it."""
+        try:
+            value = self.values[STAT_FIELDS[self.group].index(field)]
+        except (KeyError, ValueError):
+            return default
+        return default if value is None else value
+
+    def as_dict(self):
+        """Returns the stats as a plain {field: value} dict."""
+        return dict(zip(STAT_FIELDS.get(self.group, ()), self.values))
+
+    def as_row(self):
+        """Returns a flat dict for exporting (CSV, JSON, Parquet)."""
+        return {"season": self.season, "group": self.group, "team": self.team, **self.as_dict()}
+
+
+def parse_stat_groups(stat_groups, stat_type=None):
+    """
+    Turns a "stats" list (from get_player_stats or a hydrated person) into stat lines.
+
+    Args:
+        stat_groups (list): Stat groups, each with "group" and "splits".
+        stat_type (str, optional): Only keep groups of this type (e.g., "yearByYear" or "career").
+
+    Returns:
+        list: One SeasonStatLine per split, in the order the API returned them.
+    """
+    lines = []
+    for stat_group in stat_groups or []:
+        if stat_type and (stat_group.get("type") or {}).get("displayName") != stat_type:
+            continue
+        group = (stat_group.get("group") or {}).get("displayName", "Unknown")
+        for split in stat_group.get("splits", []):
+            lines.append(SeasonStatLine.from_json(group, split))
+    return lines
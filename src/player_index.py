@@ -0,0 +1,183 @@
+import bisect
+import difflib
+import gzip
+import itertools
+import json
+import os
+import time
+import unicodedata
+from collections import namedtuple
+
+INDEX_FILENAME = "player_index.json.gz"
+
+# Name suffixes that people often leave out ("Ronald Acuna" for "Ronald Acuña Jr.")
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+
+# How close a misspelled name must be (0-1) to count as a fuzzy match
+FUZZY_CUTOFF = 0.8
+
+# The result of a lookup: the chosen player ID (None if we can't pick one) and
+# every (id, fullName) that matched, best first. More than one candidate means the name is ambiguous.
+Match = namedtuple("Match", ["player_id", "candidates"])
+
+
+def normalize_name(name):
+    """
+    Turns a name into a lookup key: no accents, no punctuation, lowercase, single spaces.
+
+    Example:
+        "Ronald Acuña Jr." -> "ronald acuna jr"
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    cleaned = "".join(c if c.isalnum() else " " for c in without_accents.lower())
+    return " ".join(cleaned.split())
+
+
+def _strip_suffix(key):
+    """Drops a trailing Jr/Sr/II/III from a normalized name."""
+    parts = key.split()
+    if len(parts) > 1 and parts[-1] in NAME_SUFFIXES:
+        return " ".join(parts[:-1])
+    return key
+
+
+def index_path(cache_dir):
+    """Returns where the index file lives inside the cache folder."""
+    return os.path.join(cache_dir, INDEX_FILENAME)
+
+
+class PlayerIndex:
+    """
+    An in-memory name -> player ID index built from /sports/1/players.
+
+    Lookups never touch the network: exact names are a dict lookup, and there
+    are fallbacks for accents/punctuation, name prefixes and small typos.
+    """
+
+    def __init__(self, players, seasons=(), built_at=None):
+        """
+        Args:
+            players (list): [id, fullName, active] rows.
+            seasons (iterable, optional): The seasons the players were downloaded for.
+            built_at (float, optional): When the index was built (Unix time).
+        """
+        self.players = players
+        self.seasons = sorted(set(seasons))
+        self.built_at = built_at or time.time()
+
+        self._names = {}
+        self._exact = {}
+        self._normalized = {}
+        for player_id, full_name, active in players:
+            self._names[player_id] = full_name
+            self._exact.setdefault(full_name.lower(), []).append(player_id)
+            key = normalize_name(full_name)
+            self._normalized.setdefault(key, []).append(player_id)
+            short_key = _strip_suffix(key)
+            if short_key != key:
+                self._normalized.setdefault(short_key, []).append(player_id)
+
+        # Active players first, so an ambiguous name prefers someone who's still playing
+        active_ids = {player_id for player_id, _, active in players if active}
+        for ids in list(self._exact.values()) + list(self._normalized.values()):
+            ids.sort(key=lambda player_id: player_id not in active_ids)
+
+        # A sorted list of keys lets us find every name starting with a prefix with bisect
+        self._sorted_keys = sorted(self._normalized)
+
+    def __len__(self):
+        return len(self.players)
+
+    @classmethod
+    def from_api(cls, people_by_season):
+        """
+        Builds an index from get_players() responses.
+
+        Args:
+            people_by_season (dict): {season: response from get_players(season)}.
+
+        Returns:
+            PlayerIndex: The new index. A player listed in several seasons appears once.
+        """
+        players = {}
+        for season in sorted(people_by_season):
+            for person in people_by_season[season].get("people", []):
+                if person.get("id") and person.get("fullName"):
+                    # Later seasons win, so the name and active flag are the most recent ones
+                    players[person["id"]] = [person["id"], person["fullName"], bool(person.get("active"))]
+        return cls(list(players.values()), seasons=people_by_season.keys())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads an index saved by save().
+
+        Returns:
+            PlayerIndex: The index.
+            None: If there is no index file (or it can't be read).
+        """
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cls(data["players"], seasons=data.get("seasons", ()), built_at=data.get("built_at"))
+
+    def save(self, path):
+        """Writes the index as compact gzipped JSON (about 30 KB for a full season)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {"seasons": self.seasons, "built_at": self.built_at, "players": self.players}
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+        # Replace the old file in one step so readers never see a half-written index
+        os.replace(tmp_path, path)
+
+    def _candidates(self, ids):
+        return [(player_id, self._names[player_id]) for player_id in ids]
+
+    def lookup(self, name):
+        """
+        Finds a player by name without any network call.
+
+        Tries, in order: exact name (ignoring case), the normalized name
+        (accents/punctuation/Jr. ignored), a unique name prefix, then close
+        spellings.
+
+        Args:
+            name (str): The name to look up (e.g., "Ronald Acuna").
+
+        Returns:
+            Match: player_id is None if nothing (or nothing unambiguous enough) matched.
+        """
+        ids = self._exact.get(name.strip().lower())
+        if ids:
+            return Match(ids[0], self._candidates(ids))
+
+        key = normalize_name(name)
+        if not key:
+            return Match(None, [])
+
+        ids = self._normalized.get(key) or self._normalized.get(_strip_suffix(key))
+        if ids:
+            return Match(ids[0], self._candidates(ids))
+
+        # Prefix match: "mike trou" -> "mike trout"
+        start = bisect.bisect_left(self._sorted_keys, key)
+        prefix_ids = []
+        for candidate in itertools.islice(self._sorted_keys, start, None):
+            if not candidate.startswith(key):
+                break
+            prefix_ids.extend(player_id for player_id in self._normalized[candidate] if player_id not in prefix_ids)
+        if prefix_ids:
+            player_id = prefix_ids[0] if len(prefix_ids) == 1 else None
+            return Match(player_id, self._candidates(prefix_ids))
+
+        # Typos: "shohei otani" -> "shohei ohtani". Only pick one if it's the only close name.
+        close = difflib.get_close_matches(key, self._sorted_keys, n=5, cutoff=FUZZY_CUTOFF)
+        fuzzy_ids = []
+        for candidate in close:
+            fuzzy_ids.extend(player_id for player_id in self._normalized[candidate] if player_id not in fuzzy_ids)
+        player_id = fuzzy_ids[0] if len(fuzzy_ids) == 1 else None
+        return Match(player_id, self._candidates(fuzzy_ids))
@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, so the limit is only shared inside one process
+    fcntl = None
+
+LOCK_FILENAME = "ratelimit.lock"
+
+
+def lock_path(cache_dir):
+    """Returns the file every CLI process using this cache folder shares its request budget through."""
+    return os.path.join(cache_dir, LOCK_FILENAME)
+
+
+class RateLimiter:
+    """
+    A token bucket that makes callers wait for their turn instead of failing.
+
+    The bucket refills at 'rate' tokens per second and holds up to 'burst'
+    tokens. It is kept as a single number, the time the next request is
+    allowed to go out at a steady rate (the "generic cell rate algorithm").
+    A caller reserves the next slot while holding a lock, then sleeps
+    outside the lock until its slot comes up, so waiting callers line up
+    in order without spinning.
+
+    With a path, that number lives in a file locked with flock, so several
+    CLI processes (and a 'serve' process) share one budget. Threads share it
+    through the lock, and async tasks too since AsyncAPI runs every call on a
+    thread. If the file can't be used, the limit falls back to this process only.
+    """
+
+    def __init__(self, rate, burst=None, path=None, clock=None, sleep=time.sleep):
+        """
+        Args:
+            rate (float): Requests per second allowed over time.
+            burst (int, optional): How many requests may go out back to back after a quiet
+                period (default: one second's worth, at least 1).
+            path (str, optional): A lockfile to share the budget across processes.
+            clock (callable, optional): Returns the time in seconds (default: time.time
+                with a file, so processes agree; time.monotonic without).
+            sleep (callable, optional): Waits a number of seconds (injected in tests).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self.path = path if fcntl is not None else None
+        self._interval = 1.0 / rate
+        self._clock = clock or (time.time if self.path else time.monotonic)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_at = 0.0  # Used when there is no shared file
+
+        # Wait-time metrics for this process
+        self.requests = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve_slot(self, next_at, now):
+        """Takes the next slot; returns (seconds to wait, new next_at)."""
+        next_at = max(next_at, now)
+        # Up to 'burst' requests may run ahead of the steady rate
+        wait = max(0.0, next_at - (self.burst - 1) * self._interval - now)
+        return wait, next_at + self._interval
+
+    def _reserve_shared(self, now):
+        """Reserves a slot in the shared lockfile; returns None if the file can't be used."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            return None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                next_at = float(os.pread(fd, 64, 0) or 0)
+            except ValueError:
+                next_at = 0.0
+            wait, next_at = self._reserve_slot(next_at, now)
+            data = f"{next_at:.6f}".encode()
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+            return wait
+        except OSError:
+            return None
+        finally:
+            os.close(fd)  # Also releases the flock
+
+    def reserve(self):
+        """
+        Reserves the next request slot without waiting for it.
+
+        Returns:
+            float: How many seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = self._clock()
+            wait = self._reserve_shared(now) if self.path else None
+            if wait is None:
+                if self.path:
+                    # The lockfile is unusable: keep limiting, just within this process
+                    self.path = None
+                    self._clock = time.monotonic
+                    now = self._clock()
+                wait, self._next_at = self._reserve_slot(self._next_at, now)
+
+            self.requests += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self):
+        """
+        Blocks until the caller may send one request.
+
+        Returns:
+            float: How long the caller waited, in seconds.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def stats(self):
+        """Returns this process's wait-time metrics as a dict."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "waited": self.waited,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+            }
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+
+from src.models import RosterEntry
+
+STATE_FILENAME = "roster_state.json"
+
+# One change to a team's roster. kind is "added", "removed", "status", "position" or "jersey";
+# before/after hold the old and new value for the last three (empty for adds and removes).
+RosterEvent = namedtuple("RosterEvent", ["team", "team_id", "kind", "player_id", "name", "before", "after"])
+
+EVENT_FIELDS = list(RosterEvent._fields)
+
+# The roster fields we compare, and the event kind a change in each produces
+TRACKED_FIELDS = (("status", "status"), ("position", "position"), ("jersey_number", "jersey"))
+
+
+def state_path(cache_dir):
+    """Returns the file where the last-seen rosters are kept."""
+    return os.path.join(cache_dir, STATE_FILENAME)
+
+
+def roster_players(roster_data):
+    """
+    Reduces a get_roster() response to what we track.
+
+    Returns:
+        dict: {player_id (str): {"name", "status", "position", "jersey_number"}}.
+    """
+    players = {}
+    for entry in map(RosterEntry.from_json, roster_data.get("roster", [])):
+        players[str(entry.player.id)] = {
+            "name": entry.player.full_name,
+            "status": entry.status,
+            "position": entry.position,
+            "jersey_number": entry.jersey_number,
+        }
+    return players
+
+
+def fingerprint(players):
+    """A short hash of a roster; equal hashes mean nothing we track has changed."""
+    canonical = json.dumps(players, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def diff_players(team, team_id, old, new):
+    """
+    Compares two rosters from roster_players().
+
+    Returns:
+        list: RosterEvents for every add, removal and changed field.
+    """
+    events = []
+    for player_id, player in new.items():
+        before = old.get(player_id)
+        if before is None:
+            events.append(RosterEvent(team, team_id, "added", int(player_id), player["name"], "", player["status"]))
+            continue
+        for field, kind in TRACKED_FIELDS:
+            if before.get(field) != player.get(field):
+                events.append(
+                    RosterEvent(team, team_id, kind, int(player_id), player["name"], before.get(field), player.get(field))
+                )
+    for player_id, player in old.items():
+        if player_id not in new:
+            events.append(RosterEvent(team, team_id, "removed", int(player_id), player["name"], player["status"], ""))
+    return events
+
+
+class RosterState:
+    """
+    The last roster seen for each team, saved between runs so only changes are reported.
+
+    Each team's entry keeps a hash of its roster, so an unchanged team costs
+    one hash comparison instead of a player-by-player diff.
+    """
+
+    def __init__(self, teams=None):
+        """
+        Args:
+            teams (dict, optional): {team_id (str): {"hash", "players", "seen_at"}}.
+        """
+        self.teams = teams or {}
+
+    @classmethod
+    def load(cls, path):
+        """Reads saved state, or starts empty if there is none (or it can't be read)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f).get("teams", {}))
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path):
+        """Writes the state atomically, so an interrupted run never leaves a broken file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"teams": self.teams}, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def has_team(self, team_id):
+        return str(team_id) in self.teams
+
+    def update(self, team, team_id, roster_data):
+        """
+        Records a freshly fetched roster and returns what changed since the last one.
+
+        The first roster seen for a team is just stored (there's nothing to compare with).
+
+        Args:
+            team (str): The team code, used in the events.
+            team_id (int): The team ID.
+            roster_data (dict): The response from get_roster().
+
+        Returns:
+            list: RosterEvents (empty if the roster is unchanged or is the first one seen).
+        """
+        players = roster_players(roster_data)
+        digest = fingerprint(players)
+        saved = self.teams.get(str(team_id))
+
+        if saved is not None and saved["hash"] == digest:
+            saved["seen_at"] = time.time()
+            return []
+
+        events = diff_players(team, team_id, saved["players"], players) if saved is not None else []
+        self.teams[str(team_id)] = {"hash": digest, "players": players, "seen_at": time.time()}
+        return events
+
+
+def describe(event):
+    """Formats an event as one line of text."""
+    if event.kind == "added":
+        return f"[{event.team}] + Added: {event.name} ({event.after or 'no status'})"
+    if event.kind == "removed":
+        return f"[{event.team}] - Removed: {event.name}"
+    return f"[{event.team}] ~ {event.kind.capitalize()}: {event.name}: {event.before} -> {event.after}"
@@ -0,0 +1,196 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from src.singleflight import SingleFlight
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+STATE_FILENAME = "server.json"
+
+# The server only fetches MLB API URLs (under api.BASE_URL), so it can't be used as an open proxy
+
+# How many responses the server keeps in memory (least recently used are dropped first)
+MEMORY_CACHE_ENTRIES = 4096
+
+# Many clients asking for the same thing at once still cause only one upstream request
+_flights = SingleFlight()
+
+
+def state_path(cache_dir):
+    """Returns the file where a running server records its address."""
+    return os.path.join(cache_dir, STATE_FILENAME)
+
+
+def read_state(cache_dir):
+    """
+    Reads the address of a running 'serve' process.
+
+    Returns:
+        str: The server's base URL (e.g., "http://127.0.0.1:8787").
+        None: If no server has registered itself.
+    """
+    try:
+        with open(state_path(cache_dir), encoding="utf-8") as f:
+            state = json.load(f)
+        return f"http://{state['host']}:{state['port']}"
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class MemoryCache:
+    """A thread-safe in-memory LRU of response bodies, each with its own expiry time."""
+
+    def __init__(self, max_entries=MEMORY_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, max_age=None):
+        """
+        Returns the cached body, or None if it's missing or expired.
+
+        Args:
+            key (str): The cache key.
+            max_age (float, optional): Also treat the body as missing if it was stored
+                                       this many seconds ago or more (0 always misses).
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is None or (entry[1] is not None and now >= entry[1])
+                    or (max_age is not None and now - entry[2] >= max_age)):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, body, ttl=None):
+        """Stores a body for ttl seconds (None means until it's evicted)."""
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._entries[key] = (body, expires_at, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def handle_fetch(memory, query):
+    """
+    Answers one /fetch request.
+
+    Args:
+        memory (MemoryCache): The server's in-memory cache.
+        query (dict): The parsed query string: url, params (JSON) and ttl ("none" or seconds).
+
+    Returns:
+        tuple: (HTTP status, response body bytes).
+    """
+    from src import api, cache, client
+
+    url = query.get("url", [""])[0]
+    if not url.startswith(f"{api.BASE_URL}/"):
+        return 403, f"Only {api.BASE_URL} URLs can be fetched.".encode()
+
+    try:
+        params = json.loads(query.get("params", ["{}"])[0]) or None
+        ttl_text = query.get("ttl", ["none"])[0]
+        ttl = None if ttl_text == "none" else float(ttl_text)
+    except ValueError:
+        return 400, b"Bad params or ttl."
+
+    key = cache.make_key(url, params)
+    # The entry may have been stored by a caller with a longer ttl (a roster read keeps
+    # it for hours); a poll asking for something newer (ttl=0) must not get it
+    body = memory.get(key, max_age=ttl)
+    if body is not None:
+        return 200, body
+
+    try:
+        body = _flights.do(key, lambda: api.fetch_body(url, params=params, ttl=ttl))
+    except client.RequestException as e:
+        return 502, str(e).encode("utf-8")
+
+    memory.put(key, body, ttl)
+    return 200, body
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False):
+    """
+    Creates (but doesn't start) the HTTP server.
+
+    Endpoints:
+        GET /health - {"status": "ok", ...} with cache statistics.
+        GET /fetch?url=...&params=...&ttl=... - the raw API response body.
+
+    Returns:
+        ThreadingHTTPServer: The server, with its MemoryCache as server.memory.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    memory = MemoryCache()
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "MLBStatsCLI"
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            if parsed.path == "/health":
+                health = {"status": "ok", "entries": len(memory), "hits": memory.hits, "misses": memory.misses}
+                self._send(200, json.dumps(health).encode("utf-8"))
+            elif parsed.path == "/fetch":
+                self._send(*handle_fetch(memory, parse_qs(parsed.query)))
+            else:
+                self._send(404, b"Not found.")
+
+        def _send(self, status, body):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json" if status == 200 else "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.memory = memory
+    return server
+
+
+def run_server(cache_dir, host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False):
+    """
+    Runs the server until it's interrupted (Ctrl+C), registering its address in the cache folder
+    so normal CLI commands can find it.
+    """
+    server = make_server(host, port, verbose=verbose)
+    host, port = server.server_address[:2]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(state_path(cache_dir), "w", encoding="utf-8") as f:
+        json.dump({"host": host, "port": port, "pid": os.getpid()}, f)
+
+    print(f"Serving on http://{host}:{port} (Ctrl+C to stop)...", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.remove(state_path(cache_dir))
+        except OSError:
+            pass
+        print("Server stopped.")
@@ -0,0 +1,112 @@
+import threading
+
+
+class _Call:
+    """One in-flight call that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Makes concurrent identical calls share one execution (for threaded callers).
+
+    The first caller for a key runs the function; callers that arrive with the
+    same key while it's still running wait and get the same result (or the same
+    exception). Once the call finishes the key is forgotten, so later calls run
+    again - this is not a cache.
+
+    Example:
+        flights = SingleFlight()
+        body = flights.do(url, lambda: download(url))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0  # How many callers got a result without running the function
+
+    def do(self, key, func):
+        """
+        Runs func() unless an identical call (same key) is already running.
+
+        Args:
+            key (hashable): Identifies identical calls (e.g., URL + params).
+            func (callable): Takes no arguments and returns the result.
+
+        Returns:
+            The result of func(), possibly from another thread's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio version of SingleFlight: concurrent identical awaits share one task.
+
+    Example:
+        flights = AsyncSingleFlight()
+        roster = await flights.do(("roster", 113), lambda: fetch_roster(113))
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.shared = 0
+
+    async def do(self, key, coro_func):
+        """
+        Awaits coro_func() unless an identical call (same key) is already running.
+
+        Args:
+            key (hashable): Identifies identical calls.
+            coro_func (callable): Takes no arguments and returns a coroutine.
+
+        Returns:
+            The coroutine's result, possibly from another task's call.
+        """
+        # Imported here: src.api imports this module for SingleFlight, and asyncio
+        # would add ~30ms to every command's startup
+        import asyncio
+
+        task = self._tasks.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(coro_func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+
+        # shield() so one waiter being cancelled doesn't cancel the call for everyone else
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
@@ -0,0 +1,407 @@
+import json
+import os
+import shutil
+import time
+
+from src.models import format_innings, parse_innings
+from src.player_index import PlayerIndex
+from src.table import RATE_FIELDS, format_stat, to_number
+
+SNAPSHOT_DIRNAME = "snapshots"
+GROUPS = ("hitting", "pitching")
+
+# A qualified hitter needs 3.1 plate appearances per team game, a qualified pitcher 1 inning
+QUALIFYING_PA_PER_GAME = 3.1
+QUALIFYING_IP_PER_GAME = 1.0
+FULL_SEASON_GAMES = 162
+
+
+def snapshot_path(cache_dir, season, group=None):
+    """Returns the folder of a season snapshot (or of one stat group inside it)."""
+    path = os.path.join(cache_dir, SNAPSHOT_DIRNAME, str(season))
+    return os.path.join(path, group) if group else path
+
+
+def available_seasons(cache_dir):
+    """Returns the seasons that have a snapshot, oldest first."""
+    try:
+        names = os.listdir(os.path.join(cache_dir, SNAPSHOT_DIRNAME))
+    except OSError:
+        return []
+    return sorted(int(name) for name in names if name.isdigit())
+
+
+def download_splits(group, season, workers=4, page_size=None):
+    """
+    Downloads every player's season line for one stat group, page by page.
+
+    The first page tells us how many splits there are; the remaining pages are
+    then fetched in parallel.
+
+    Args:
+        group (str): "hitting" or "pitching".
+        season (int): The 4-digit season year.
+        workers (int, optional): How many pages to fetch at the same time.
+        page_size (int, optional): Splits per request. Defaults to api.STATS_PAGE_SIZE.
+
+    Returns:
+        list: The raw splits, in API order.
+        None: If any page failed (the API layer already printed the error).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src import api, client
+
+    page_size = page_size or api.STATS_PAGE_SIZE
+
+    def fetch_page(offset):
+        return api.get_season_stats_page(group, season, offset=offset, limit=page_size)
+
+    first = fetch_page(0)
+    if first is None:
+        return None
+    block = (first.get("stats") or [{}])[0]
+    splits = list(block.get("splits", []))
+    total = block.get("totalSplits", len(splits))
+
+    offsets = range(page_size, total, page_size)
+    if offsets:
+        client.grow_pool(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() keeps the pages in order
+            for page in executor.map(fetch_page, offsets):
+                if page is None:
+                    return None
+                splits.extend((page.get("stats") or [{}])[0].get("splits", []))
+    return splits
+
+
+def collapse_splits(splits, key=None):
+    """
+    Keeps one season line per player.
+
+    A player who changed teams can have one split per team plus a season total
+    (a split without a team). The total wins; otherwise the last split listed does.
+
+    Args:
+        splits (list): The splits.
+        key (callable, optional): What makes two splits lines of the same season. Defaults to
+                                  the player ID; one player's yearByYear splits use the season.
+
+    Returns:
+        list: One split per key, sorted by it.
+    """
+    if key is None:
+        key = lambda split: (split.get("player") or {}).get("id")
+    by_key = {}
+    for split in splits:
+        split_key = key(split)
+        if split_key is None:
+            continue
+        current = by_key.get(split_key)
+        if current is None or current.get("team") or not split.get("team"):
+            by_key[split_key] = split
+    return [by_key[split_key] for split_key in sorted(by_key)]
+
+
+def _numeric_columns(rows):
+    """Turns the "stat" dicts of the rows into {field: list of floats (nan when missing)}."""
+    fields = []
+    for split in rows:
+        for field in split.get("stat", {}):
+            if field not in fields:
+                fields.append(field)
+
+    columns = {}
+    for field in fields:
+        values = []
+        for split in rows:
+            value = split.get("stat", {}).get(field)
+            if field == "inningsPitched" and value is not None:
+                value = parse_innings(value)
+            number = to_number(value)
+            values.append(float("nan") if number is None or isinstance(number, bool) else float(number))
+        # Skip text-only fields (e.g., "-.--" everywhere)
+        if any(value == value for value in values):
+            columns[field] = values
+    return columns
+
+
+def write_group(cache_dir, season, group, splits):
+    """
+    Saves one stat group as a folder of NumPy columns (one .npy file per field).
+
+    Rows are sorted by player ID so a player is found with a binary search.
+    The folder is written under a temporary name and swapped in at the end,
+    so readers never see a half-written snapshot.
+
+    Returns:
+        int: The number of players saved.
+    """
+    import numpy as np
+
+    rows = collapse_splits(splits)
+    path = snapshot_path(cache_dir, season, group)
+    tmp_path = f"{path}.tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    numeric = _numeric_columns(rows)
+    columns = {
+        "player_id": np.array([split["player"]["id"] for split in rows], dtype=np.int64),
+        "team_id": np.array([(split.get("team") or {}).get("id", 0) for split in rows], dtype=np.int64),
+        "league_id": np.array([(split.get("league") or {}).get("id", 0) for split in rows], dtype=np.int64),
+        "name": np.array([split["player"].get("fullName", "") for split in rows], dtype=str),
+        "team": np.array([(split.get("team") or {}).get("name", "") for split in rows], dtype=str),
+        "position": np.array([(split.get("position") or {}).get("name", "") for split in rows], dtype=str),
+    }
+    for field, values in numeric.items():
+        columns[field] = np.array(values, dtype=np.float64)
+
+    # Every (player, team) pair, including the per-team splits of traded players, for rosters
+    memberships = sorted({
+        (split["player"]["id"], split["team"]["id"])
+        for split in splits
+        if (split.get("player") or {}).get("id") is not None and (split.get("team") or {}).get("id") is not None
+    })
+    columns["member_player_id"] = np.array([player_id for player_id, _ in memberships], dtype=np.int64)
+    columns["member_team_id"] = np.array([team_id for _, team_id in memberships], dtype=np.int64)
+
+    for name, array in columns.items():
+        np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+
+    meta = {"season": int(season), "group": group, "rows": len(rows), "fields": list(numeric), "built_at": time.time()}
+    with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    # Swap the new folder in (a directory can't be replaced in one step if it exists)
+    old_path = f"{path}.old"
+    shutil.rmtree(old_path, ignore_errors=True)
+    if os.path.exists(path):
+        os.rename(path, old_path)
+    os.rename(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+    return len(rows)
+
+
+def stat_text(field, value):
+    """Formats a stored number the way the API would have sent it (.300, 2.45, "123.1", 42)."""
+    if value != value:
+        return None
+    if field == "inningsPitched":
+        return format_innings(value)
+    if field in RATE_FIELDS:
+        return format_stat(field, value)
+    if float(value).is_integer():
+        return int(value)
+    return f"{value:.3f}".rstrip("0")
+
+
+class SnapshotGroup:
+    """
+    One stat group of a season snapshot, read through memory-mapped NumPy columns.
+
+    Nothing is read until a column is used, and then only the pages that are
+    actually touched come off disk.
+    """
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        self.group = meta["group"]
+        self.fields = meta["fields"]
+        self._columns = {}
+
+    @classmethod
+    def load(cls, path):
+        """Opens a group folder written by write_group(), or returns None if there isn't one."""
+        try:
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+                return cls(path, json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def column(self, name):
+        """Returns a column as a read-only memory-mapped array (None if the field isn't stored)."""
+        if name not in self._columns:
+            import numpy as np
+
+            file_path = os.path.join(self.path, f"{name}.npy")
+            self._columns[name] = np.load(file_path, mmap_mode="r") if os.path.exists(file_path) else None
+        return self._columns[name]
+
+    def find(self, player_id):
+        """Returns the row number of a player (binary search on the sorted IDs), or None."""
+        import numpy as np
+
+        ids = self.column("player_id")
+        row = int(np.searchsorted(ids, player_id))
+        if row < len(ids) and ids[row] == player_id:
+            return row
+        return None
+
+    def split(self, row, season):
+        """Rebuilds an API-style split for one row, so existing printing code can use it."""
+        stat = {}
+        for field in self.fields:
+            text = stat_text(field, float(self.column(field)[row]))
+            if text is not None:
+                stat[field] = text
+        return {
+            "season": str(season),
+            "stat": stat,
+            "team": {"id": int(self.column("team_id")[row]), "name": str(self.column("team")[row])},
+            "player": {"id": int(self.column("player_id")[row]), "fullName": str(self.column("name")[row])},
+            "position": {"name": str(self.column("position")[row])},
+        }
+
+
+class Snapshot:
+    """
+    Every player's hitting and pitching line for one season, stored locally.
+
+    Built with the 'snapshot SEASON' command; 'leaders', 'stats' and 'roster'
+    read it with --offline and never touch the network.
+    """
+
+    def __init__(self, season, groups):
+        """
+        Args:
+            season (int): The season.
+            groups (dict): {"hitting": SnapshotGroup, "pitching": SnapshotGroup}.
+        """
+        self.season = season
+        self.groups = groups
+        self._index = None
+
+    @classmethod
+    def load(cls, cache_dir, season):
+        """
+        Opens the snapshot of a season.
+
+        Returns:
+            Snapshot: The snapshot.
+            None: If 'snapshot SEASON' hasn't been run for this season.
+        """
+        groups = {}
+        for group in GROUPS:
+            loaded = SnapshotGroup.load(snapshot_path(cache_dir, season, group))
+            if loaded is not None:
+                groups[group] = loaded
+        return cls(season, groups) if groups else None
+
+    @property
+    def team_games(self):
+        """Roughly how many games each team has played (the most games any hitter played)."""
+        hitting = self.groups.get("hitting")
+        games = hitting.column("gamesPlayed") if hitting is not None else None
+        if games is None or not len(games):
+            return FULL_SEASON_GAMES
+        import numpy as np
+
+        return int(np.nanmax(games))
+
+    def player_index(self):
+        """Returns a PlayerIndex of everyone in the snapshot, for name lookups."""
+        if self._index is None:
+            players = {}
+            for group in self.groups.values():
+                for player_id, name in zip(group.column("player_id"), group.column("name")):
+                    players[int(player_id)] = [int(player_id), str(name), True]
+            self._index = PlayerIndex(list(players.values()), seasons=[self.season])
+        return self._index
+
+    def stat_groups(self, player_id):
+        """
+        Returns a player's season lines shaped like the "stats" list of get_player_stats().
+
+        Returns:
+            list: One entry per group the player has a line in (may be empty).
+        """
+        stat_groups = []
+        for name, group in self.groups.items():
+            row = group.find(player_id)
+            if row is not None:
+                stat_groups.append({"group": {"displayName": name}, "splits": [group.split(row, self.season)]})
+        return stat_groups
+
+    def roster(self, team_id):
+        """
+        Returns everyone who played for a team this season, shaped like get_roster().
+
+        Traded players are listed under every team they played for. Jersey
+        numbers aren't part of season stats, so they show as "-".
+        """
+        people = {}
+        for group in self.groups.values():
+            members = group.column("member_player_id")[group.column("member_team_id") == team_id]
+            for player_id in members:
+                player_id = int(player_id)
+                row = group.find(player_id)
+                # Prefer the hitting line's position; pitchers only have a pitching line
+                if row is None or player_id in people:
+                    continue
+                people[player_id] = {
+                    "person": {"id": player_id, "fullName": str(group.column("name")[row])},
+                    "jerseyNumber": "-",
+                    "position": {"name": str(group.column("position")[row]) or "Unknown"},
+                    "status": {"description": ""},
+                }
+        return {"roster": sorted(people.values(), key=lambda entry: entry["person"]["fullName"])}
+
+    def leaders(self, category, limit=10, league_id=None):
+        """
+        Ranks players for a category, shaped like the "leaders" list of get_league_leaders().
+
+        Rate stats (AVG, ERA, ...) only rank qualified players: 3.1 plate
+        appearances or 1 inning pitched per team game.
+
+        Args:
+            category (Category): From src/categories.py. Needs a snapshot field.
+            limit (int, optional): How many players to return.
+            league_id (int, optional): Only rank players in this league.
+
+        Returns:
+            list: Leader dicts with "rank", "person", "team" and "value".
+            None: If the category can't be answered from a snapshot.
+        """
+        import numpy as np
+
+        group = self.groups.get(category.group)
+        values = group.column(category.field) if group is not None and category.field else None
+        if values is None:
+            return None
+
+        mask = ~np.isnan(values)
+        if league_id is not None:
+            mask &= group.column("league_id") == league_id
+        if category.rate:
+            if category.group == "hitting":
+                volume, minimum = group.column("plateAppearances"), QUALIFYING_PA_PER_GAME * self.team_games
+            else:
+                volume, minimum = group.column("inningsPitched"), QUALIFYING_IP_PER_GAME * self.team_games
+            if volume is not None:
+                mask &= volume >= minimum
+
+        rows = np.flatnonzero(mask)
+        keys = values[rows] if category.ascending else -values[rows]
+        # A stable sort keeps tied players in player ID order
+        rows = rows[np.argsort(keys, kind="stable")][:limit]
+
+        leaders = []
+        previous = None
+        for position, row in enumerate(rows, start=1):
+            value = float(values[row])
+            # Tied players share a rank, like the API shows them
+            rank = leaders[-1]["rank"] if previous == value else position
+            previous = value
+            leaders.append({
+                "rank": rank,
+                "person": {"id": int(group.column("player_id")[row]), "fullName": str(group.column("name")[row])},
+                "team": {"name": str(group.column("team")[row]) or "N/A"},
+                "value": str(stat_text(category.field, value)),
+            })
+        return leaders
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+# Modules whose presence means the HTTP stack was loaded
+HTTP_MODULES = ("requests", "urllib3")
+
+# One line of 'python -X importtime' output
+ImportTiming = namedtuple("ImportTiming", ["module", "self_us", "cumulative_us", "depth"])
+
+
+def parse_importtime(lines):
+    """
+    Parses the lines written by 'python -X importtime'.
+
+    Each line looks like "import time:       137 |        836 |   module.name",
+    where the extra spaces before the name show how deeply it was nested.
+
+    Args:
+        lines (iterable): Lines of stderr output. Lines that aren't import timings are skipped.
+
+    Returns:
+        list: ImportTiming tuples in the order they were printed.
+    """
+    timings = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            # The header line ("self [us] | cumulative | imported package")
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append(ImportTiming(name.strip(), self_us, cumulative_us, depth))
+    return timings
+
+
+def profile_startup(argv, top=15):
+    """
+    Runs the CLI again under 'python -X importtime' and prints an import summary to stderr.
+
+    The command's own output goes through unchanged, so this can wrap any
+    invocation, e.g. 'python -m src.main --profile-startup roster CIN'.
+
+    Args:
+        argv (list): The command-line arguments to run (without --profile-startup).
+        top (int, optional): How many of the slowest top-level imports to list.
+
+    Returns:
+        int: The exit code of the profiled command.
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "src.main", *argv]
+
+    started = time.perf_counter()
+    result = subprocess.run(command, stderr=subprocess.PIPE, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    stderr_lines = result.stderr.splitlines()
+    timings = parse_importtime(stderr_lines)
+
+    # Pass through anything the command itself wrote to stderr
+    for line in stderr_lines:
+        if not line.startswith("import time:"):
+            print(line, file=sys.stderr)
+
+    total_ms = sum(timing.self_us for timing in timings) / 1000
+    http_loaded = any(timing.module.split(".")[0] in HTTP_MODULES for timing in timings)
+    slowest = sorted((timing for timing in timings if timing.depth == 0), key=lambda t: t.cumulative_us, reverse=True)
+
+    print(f"--- Startup profile: src.main {' '.join(argv)} ---", file=sys.stderr)
+    print(f"  Wall time: {wall_ms:.1f} ms | Imports: {total_ms:.1f} ms across {len(timings)} modules", file=sys.stderr)
+    print(f"  HTTP stack loaded: {'yes' if http_loaded else 'no'}", file=sys.stderr)
+    print("  Slowest top-level imports (cumulative):", file=sys.stderr)
+    for timing in slowest[:top]:
+        print(f"    {timing.cumulative_us / 1000:>7.1f} ms  {timing.module}", file=sys.stderr)
+
+    return result.returncode
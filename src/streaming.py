@@ -0,0 +1,66 @@
+import io
+
+from src.models import loads
+
+# ijson parses a JSON document incrementally and hands back one record at a time,
+# so the full object graph of a big response never has to exist at once. It's
+# optional: without it the document is parsed in one go and walked the same way.
+_ijson = None
+
+
+def available():
+    """Returns True if ijson is installed (streaming really is incremental)."""
+    global _ijson
+
+    if _ijson is None:
+        try:
+            import ijson
+            _ijson = ijson
+        except ImportError:  # pragma: no cover - depends on the environment
+            _ijson = False
+    return _ijson is not False
+
+
+def parse_errors():
+    """The exceptions a malformed (or cut off) document raises while its records are read."""
+    if available():
+        return (ValueError, _ijson.JSONError)
+    return (ValueError,)
+
+
+def walk(data, prefix):
+    """
+    Yields the values under a dotted ijson-style prefix of an already parsed document.
+
+    "item" stands for every element of a list, so "stats.item.splits.item"
+    yields each split of each stats block.
+    """
+    if not prefix:
+        yield data
+        return
+    part, _, rest = prefix.partition(".")
+    if part == "item":
+        for element in data if isinstance(data, list) else ():
+            yield from walk(element, rest)
+    elif isinstance(data, dict) and part in data:
+        yield from walk(data[part], rest)
+
+
+def iter_items(source, prefix):
+    """
+    Yields the records under a prefix of a JSON document, one at a time.
+
+    Args:
+        source (bytes or file): The raw JSON, or a binary file-like object to read it from
+                                (e.g., an HTTP response body that hasn't been downloaded yet).
+        prefix (str): Where the records are, e.g. "roster.item" or "people.item".
+
+    Yields:
+        The parsed records (dicts), with numbers as int/float like json.loads gives them.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if not available():
+        yield from walk(loads(source.read()), prefix)
+        return
+    yield from _ijson.items(source, prefix, use_float=True)
@@ -0,0 +1,162 @@
+from src.models import STAT_FIELDS, format_innings, parse_innings
+
+# Ratio stats can't be added up across seasons; totals() recomputes them from counting stats
+RATE_FIELDS = {"avg", "obp", "slg", "ops", "era", "whip"}
+
+
+def to_number(value):
+    """
+    Converts an API stat value to a number.
+
+    The API sends counting stats as ints and rate stats as strings (".300", "2.45").
+    Placeholders such as "-.--" or ".---" become None.
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def format_stat(field, value):
+    """Formats a number the way baseball people expect to read it (.300, 2.45, 123.1)."""
+    if value is None:
+        return "-"
+    if field == "inningsPitched":
+        return format_innings(value)
+    if field in ("avg", "obp", "slg", "ops"):
+        text = f"{value:.3f}"
+        # Batting averages drop the leading zero: 0.300 -> .300
+        return text[1:] if text.startswith("0") else text
+    if field in RATE_FIELDS:
+        return f"{value:.2f}"
+    return str(int(value))
+
+
+def line_to_numbers(line):
+    """
+    Converts a SeasonStatLine's values to numbers.
+
+    Returns:
+        dict: {field: number or None}. Innings pitched become real innings (6.2 -> 6.667).
+    """
+    numbers = {}
+    for field, value in zip(STAT_FIELDS[line.group], line.values):
+        if field == "inningsPitched" and value is not None:
+            value = parse_innings(value)
+        numbers[field] = to_number(value)
+    return numbers
+
+
+def _ratio(numerator, denominator):
+    return numerator / denominator if denominator else None
+
+
+def add_rate_stats(group, totals):
+    """
+    Computes the rate stats (AVG, OBP, SLG, OPS or ERA, WHIP) from summed counting stats.
+
+    Args:
+        group (str): "hitting" or "pitching".
+        totals (dict): {field: total} for the group's counting stats; updated in place.
+
+    Returns:
+        dict: The same totals. Rate stats are None when they can't be computed.
+    """
+    if group == "hitting":
+        ab, h = totals["atBats"], totals["hits"]
+        on_base_chances = ab + totals["baseOnBalls"] + totals["hitByPitch"] + totals["sacFlies"]
+        totals["avg"] = _ratio(h, ab)
+        totals["obp"] = _ratio(h + totals["baseOnBalls"] + totals["hitByPitch"], on_base_chances)
+        totals["slg"] = _ratio(totals["totalBases"], ab)
+        if totals["obp"] is not None and totals["slg"] is not None:
+            totals["ops"] = totals["obp"] + totals["slg"]
+        else:
+            totals["ops"] = None
+    else:
+        ip = totals["inningsPitched"]
+        totals["era"] = _ratio(9 * totals["earnedRuns"], ip)
+        totals["whip"] = _ratio(totals["baseOnBalls"] + totals["hits"], ip)
+
+    return totals
+
+
+class StatTable:
+    """
+    A column-oriented table of stat lines: one list per field instead of one dict per row.
+
+    Sorting computes the row order once and reorders each column, and totals are
+    plain sums over a column, so nothing builds or copies per-row dicts.
+    """
+
+    def __init__(self, group, columns=None):
+        """
+        Args:
+            group (str): "hitting" or "pitching" (decides which stat columns exist).
+            columns (dict, optional): Existing {name: list} columns to wrap.
+        """
+        self.group = group
+        self.fields = STAT_FIELDS[group]
+        self.columns = columns or {name: [] for name in ("season", "team") + self.fields}
+
+    @classmethod
+    def from_lines(cls, group, lines):
+        """Builds a table from the SeasonStatLines of one group (lines of other groups are skipped)."""
+        table = cls(group)
+        for line in lines:
+            if line.group == group:
+                table.append(line)
+        return table
+
+    def append(self, line):
+        """Adds one SeasonStatLine, converting its values to numbers."""
+        self.columns["season"].append(line.season)
+        self.columns["team"].append(line.team)
+        for field, value in line_to_numbers(line).items():
+            self.columns[field].append(value)
+
+    def __len__(self):
+        return len(self.columns["season"])
+
+    def column(self, name):
+        """Returns one column as a list."""
+        return self.columns[name]
+
+    def rows(self):
+        """Yields each row as a {column: value} dict (for exporting)."""
+        names = list(self.columns)
+        for values in zip(*(self.columns[name] for name in names)):
+            yield dict(zip(names, values))
+
+    def take(self, order):
+        """Returns a new table with the rows in the given order (a list of row numbers)."""
+        return StatTable(self.group, {name: [values[i] for i in order] for name, values in self.columns.items()})
+
+    def sort_by(self, name, descending=True):
+        """
+        Returns a new table sorted by one column. Missing values always sort last.
+
+        Args:
+            name (str): The column to sort by (e.g., "homeRuns" or "season").
+            descending (bool, optional): Biggest first. Defaults to True.
+        """
+        values = self.columns[name]
+        present = [i for i in range(len(self)) if values[i] is not None]
+        missing = [i for i in range(len(self)) if values[i] is None]
+        present.sort(key=values.__getitem__, reverse=descending)
+        return self.take(present + missing)
+
+    def totals(self):
+        """
+        Adds up every counting stat and recomputes the rate stats from those totals.
+
+        Returns:
+            dict: {field: total}. Rate stats are None when they can't be computed.
+        """
+        totals = {}
+        for field in self.fields:
+            if field not in RATE_FIELDS:
+                totals[field] = sum(value for value in self.columns[field] if value is not None)
+
+        return add_rate_stats(self.group, totals)
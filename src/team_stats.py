@@ -0,0 +1,151 @@
+from src.models import STAT_FIELDS, parse_innings
+from src.table import RATE_FIELDS, add_rate_stats, to_number
+
+# Which column decides the order players are listed in (most playing time first)
+PLAYING_TIME_FIELD = {"hitting": "plateAppearances", "pitching": "inningsPitched"}
+
+
+def roster_people(roster_data):
+    """
+    Returns the person objects of a roster response (with "stats" if they were hydrated).
+
+    The roster entry's position is copied onto the person as "primaryPosition"
+    when the person doesn't already have one.
+    """
+    people = []
+    for entry in roster_data.get("roster", []):
+        person = dict(entry.get("person") or {})
+        if entry.get("position"):
+            person.setdefault("primaryPosition", entry["position"])
+        people.append(person)
+    return people
+
+
+def team_split(splits, team_id):
+    """
+    Picks a player's line for one team out of their season splits.
+
+    A player traded mid-season has one split per team (and sometimes a total
+    without a team); only the split for this team counts toward its totals.
+
+    Returns:
+        dict: The split, or None if the player has no line for this team.
+    """
+    for split in splits:
+        if (split.get("team") or {}).get("id") == team_id:
+            return split
+    # A lone split without a team is the season line of a player who never changed teams
+    if len(splits) == 1 and not splits[0].get("team"):
+        return splits[0]
+    return None
+
+
+def _counting(field, value):
+    """Turns a summed float back into an int for counting stats (45.0 -> 45)."""
+    if value is None or field in RATE_FIELDS or field == "inningsPitched":
+        return value
+    return int(value)
+
+
+def _stat_value(field, value):
+    if field == "inningsPitched":
+        return parse_innings(value) if value is not None else None
+    return to_number(value)
+
+
+class TeamStats:
+    """
+    One stat group (hitting or pitching) of a team's season.
+
+    Every player's line sits in one NumPy matrix (a row per player, a column
+    per stat), so team totals are a single column sum and the order is a
+    single argsort. Missing values are NaN and simply don't count.
+    """
+
+    def __init__(self, group, players, matrix):
+        """
+        Args:
+            group (str): "hitting" or "pitching".
+            players (list): (player_id, name, position) for each row of the matrix.
+            matrix (numpy.ndarray): Shape (players, len(STAT_FIELDS[group])).
+        """
+        self.group = group
+        self.fields = STAT_FIELDS[group]
+        self.players = players
+        self.matrix = matrix
+
+    @classmethod
+    def from_people(cls, group, people, team_id):
+        """
+        Builds the table from hydrated people (from a roster or get_people_stats()).
+
+        Args:
+            group (str): "hitting" or "pitching".
+            people (list): Person dicts with "id", "fullName" and a "stats" list.
+            team_id (int): Only lines for this team are used.
+        """
+        import numpy as np
+
+        fields = STAT_FIELDS[group]
+        players, rows = [], []
+        for person in people:
+            for stat_group in person.get("stats") or []:
+                if (stat_group.get("group") or {}).get("displayName") != group:
+                    continue
+                split = team_split(stat_group.get("splits", []), team_id)
+                if split is None:
+                    continue
+                stat = split.get("stat") or {}
+                position = (person.get("primaryPosition") or split.get("position") or {}).get("abbreviation", "")
+                players.append((person.get("id"), person.get("fullName", "Unknown Player"), position))
+                rows.append([_stat_value(field, stat.get(field)) for field in fields])
+
+        matrix = np.array(rows, dtype=float).reshape(len(rows), len(fields))
+        return cls(group, players, matrix)
+
+    def __len__(self):
+        return len(self.players)
+
+    def column(self, field):
+        return self.matrix[:, self.fields.index(field)]
+
+    def totals(self):
+        """
+        Sums every counting stat over the roster and recomputes the rate stats from the sums.
+
+        Returns:
+            dict: {field: total}. Rate stats are None when they can't be computed.
+        """
+        import numpy as np
+
+        sums = np.nansum(self.matrix, axis=0)
+        totals = {field: _counting(field, float(total)) for field, total in zip(self.fields, sums) if field not in RATE_FIELDS}
+        return add_rate_stats(self.group, totals)
+
+    def order(self):
+        """Row numbers with the most playing time first (players without any last)."""
+        import numpy as np
+
+        playing_time = np.nan_to_num(self.column(PLAYING_TIME_FIELD[self.group]), nan=-1.0)
+        return np.argsort(-playing_time, kind="stable")
+
+    def rows(self):
+        """
+        Yields one dict per player, most playing time first.
+
+        Returns:
+            dict: {"player_id", "name", "position", field: number or None, ...}; innings
+                  pitched are real innings (6.2 -> 6.667).
+        """
+        import numpy as np
+
+        for row in self.order():
+            player_id, name, position = self.players[row]
+            values = self.matrix[row]
+            yield {
+                "player_id": player_id,
+                "name": name,
+                "position": position,
+                **{field: None if np.isnan(value) else _counting(field, float(value))
+                   for field, value in zip(self.fields, values)},
+            }
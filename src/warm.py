@@ -0,0 +1,378 @@
+import datetime
+import json
+import os
+import time
+from collections import namedtuple
+
+from src import api
+from src.categories import CATEGORIES, LEAGUES, by_group, resolve
+
+STATE_FILENAME = "warm_state.json"
+
+QUERIES = ("roster", "leaders", "stats")
+DEFAULT_WORKERS = 4
+DEFAULT_PRIORITY = 5
+MAX_SLEEP = 15 * 60  # Check the schedule at least this often while waiting
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+# One entry of the schedule file. every/deadline are in seconds; deadline None means
+# the job may wait for the off-peak window for as long as it takes.
+Job = namedtuple("Job", ["name", "query", "every", "priority", "deadline", "options"])
+
+
+class ScheduleError(Exception):
+    """Raised when a schedule file can't be read or doesn't make sense."""
+
+
+def state_path(cache_dir):
+    """Returns the file where the last run of each job is recorded."""
+    return os.path.join(cache_dir, STATE_FILENAME)
+
+
+def parse_duration(value):
+    """
+    Reads a duration: seconds as a number, or a number with a unit ("90s", "15m", "6h", "1d").
+
+    Raises:
+        ScheduleError: If the value isn't a positive duration.
+    """
+    text = str(value).strip().lower()
+    unit = DURATION_UNITS.get(text[-1:])
+    try:
+        seconds = float(text[:-1]) * unit if unit else float(text)
+    except ValueError:
+        seconds = 0
+    if seconds <= 0:
+        raise ScheduleError(f"'{value}' is not a duration like 90, 15m, 6h or 1d")
+    return seconds
+
+
+def parse_window(text):
+    """
+    Reads an off-peak window like "01:00-06:30" (it may wrap past midnight, e.g. "22:00-05:00").
+
+    Returns:
+        tuple: (start, end) in minutes after midnight, local time.
+    """
+    try:
+        start, end = (datetime.time.fromisoformat(part.strip()) for part in text.split("-"))
+    except ValueError:
+        raise ScheduleError(f"'{text}' is not a window like 01:00-06:00")
+    return start.hour * 60 + start.minute, end.hour * 60 + end.minute
+
+
+def in_window(window, now):
+    """Checks whether a timestamp falls inside an off-peak window."""
+    start, end = window
+    local = datetime.datetime.fromtimestamp(now)
+    minute = local.hour * 60 + local.minute
+    if start <= end:
+        return start <= minute < end
+    return minute >= start or minute < end
+
+
+def seconds_until_window(window, now):
+    """How long until the window next opens (0 if it's open now)."""
+    if in_window(window, now):
+        return 0
+    local = datetime.datetime.fromtimestamp(now)
+    opens = local.replace(hour=window[0] // 60, minute=window[0] % 60, second=0, microsecond=0)
+    if opens <= local:
+        opens += datetime.timedelta(days=1)
+    return (opens - local).total_seconds()
+
+
+class Schedule:
+    """
+    The jobs of a schedule file, e.g.:
+
+        {
+          "workers": 4,
+          "off_peak": "01:00-06:00",
+          "jobs": [
+            {"name": "rosters", "query": "roster", "teams": "all", "every": "1d", "priority": 1, "deadline": "6h"},
+            {"name": "leaders", "query": "leaders", "categories": "all", "every": "1h", "priority": 2, "deadline": "30m"},
+            {"name": "watchlist", "query": "stats", "players": ["Elly De La Cruz", 592450], "every": "6h"}
+          ]
+        }
+
+    A job is due once its interval has passed since it last ran. Due jobs only
+    run inside the off-peak window, unless they are past their deadline (or
+    there is no window). Lower priority numbers run first.
+    """
+
+    def __init__(self, jobs, workers=DEFAULT_WORKERS, window=None):
+        self.jobs = jobs
+        self.workers = workers
+        self.window = window
+
+    @classmethod
+    def from_dict(cls, data, team_codes):
+        """
+        Builds a schedule from parsed JSON, checking every job.
+
+        Args:
+            data (dict): The schedule.
+            team_codes (iterable): The team codes a roster job may use.
+
+        Raises:
+            ScheduleError: If anything in it is invalid.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("jobs"), list) or not data["jobs"]:
+            raise ScheduleError('the schedule needs a "jobs" list')
+
+        jobs, names = [], set()
+        for number, spec in enumerate(data["jobs"], start=1):
+            query = spec.get("query")
+            if query not in QUERIES:
+                raise ScheduleError(f"job {number}: \"query\" must be one of {', '.join(QUERIES)}")
+            name = str(spec.get("name") or f"{query}-{number}")
+            if name in names:
+                raise ScheduleError(f"job {number}: the name '{name}' is used twice")
+            names.add(name)
+            if "every" not in spec:
+                raise ScheduleError(f"job '{name}': \"every\" (the refresh interval) is required")
+
+            options = {key: value for key, value in spec.items()
+                       if key not in ("name", "query", "every", "priority", "deadline")}
+            _check_options(name, query, options, team_codes)
+            jobs.append(Job(
+                name=name,
+                query=query,
+                every=parse_duration(spec["every"]),
+                priority=int(spec.get("priority", DEFAULT_PRIORITY)),
+                deadline=parse_duration(spec["deadline"]) if spec.get("deadline") is not None else None,
+                options=options,
+            ))
+
+        window = parse_window(data["off_peak"]) if data.get("off_peak") else None
+        return cls(jobs, workers=int(data.get("workers", DEFAULT_WORKERS)), window=window)
+
+    @classmethod
+    def load(cls, path, team_codes):
+        """Reads a schedule file (JSON)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except OSError as e:
+            raise ScheduleError(f"can't read {path}: {e.strerror}")
+        except ValueError as e:
+            raise ScheduleError(f"{path} is not valid JSON: {e}")
+        return cls.from_dict(data, team_codes)
+
+    def due(self, last_runs, now, ignore_window=False):
+        """
+        Picks the jobs to run now, most urgent first.
+
+        Args:
+            last_runs (dict): {job name: timestamp of its last run}.
+            now (float): The current time.
+            ignore_window (bool, optional): Run every due job, even outside the off-peak window.
+
+        Returns:
+            list: Jobs past their deadline first, then by priority, then the longest-waiting first.
+        """
+        picked = []
+        open_now = ignore_window or self.window is None or in_window(self.window, now)
+        for job in self.jobs:
+            due_at = last_runs.get(job.name, 0) + job.every
+            if now < due_at:
+                continue
+            overdue = job.deadline is not None and now >= due_at + job.deadline
+            if open_now or overdue:
+                picked.append((not overdue, job.priority, due_at, job))
+        return [job for *_, job in sorted(picked, key=lambda item: item[:3])]
+
+    def next_check(self, last_runs, now):
+        """Seconds until something may become runnable (at most MAX_SLEEP)."""
+        times = []
+        for job in self.jobs:
+            due_at = last_runs.get(job.name, 0) + job.every
+            times.append(due_at)
+            if job.deadline is not None:
+                times.append(due_at + job.deadline)
+        if self.window is not None:
+            times.append(now + seconds_until_window(self.window, now))
+        upcoming = [when - now for when in times if when > now]
+        return max(1.0, min(upcoming + [MAX_SLEEP]))
+
+
+def _check_options(name, query, options, team_codes):
+    """Checks a job's query options, so mistakes show up when the schedule is loaded."""
+    if query == "roster":
+        teams = options.get("teams", "all")
+        if teams != "all":
+            unknown = [code for code in teams if str(code).upper() not in team_codes]
+            if not isinstance(teams, list) or unknown:
+                raise ScheduleError(f"job '{name}': \"teams\" must be \"all\" or a list of team codes (unknown: {unknown})")
+    elif query == "leaders":
+        categories = options.get("categories", "all")
+        if categories != "all":
+            for entry in categories if isinstance(categories, list) else [None]:
+                known, unknown = resolve(entry) if isinstance(entry, str) else ([], [entry])
+                if unknown or not known:
+                    raise ScheduleError(f"job '{name}': unknown stat categories {entry!r}")
+        if options.get("league") and str(options["league"]).upper() not in LEAGUES:
+            raise ScheduleError(f"job '{name}': \"league\" must be one of {', '.join(LEAGUES)}")
+    elif query == "stats":
+        players = options.get("players")
+        if not isinstance(players, list) or not players:
+            raise ScheduleError(f"job '{name}': \"players\" must be a list of names or player IDs")
+
+
+def job_tasks(job, team_map, index=None):
+    """
+    Turns a job into the exact API calls the interactive commands make, so
+    the entries they refresh are the ones those commands read.
+
+    Args:
+        job (Job): The job.
+        team_map (dict): {team code: team ID}.
+        index (PlayerIndex, optional): Resolves player names without a search request.
+
+    Returns:
+        list: (label, func) pairs; func() returns the API result (None if it failed).
+    """
+    options = job.options
+    season = options.get("season") or datetime.datetime.now().year
+
+    if job.query == "roster":
+        # Same as 'roster CIN'
+        teams = team_map if options.get("teams", "all") == "all" else [code.upper() for code in options["teams"]]
+        return [(code, lambda team_id=team_map[code]: api.get_roster(team_id)) for code in teams]
+
+    if job.query == "leaders":
+        # Same as 'leaders HR' or 'leaders HR,AVG': one request per stat group of each entry
+        entries = CATEGORIES if options.get("categories", "all") == "all" else options["categories"]
+        limit = int(options.get("limit", 10))
+        league_id = LEAGUES.get(str(options.get("league") or "").upper())
+        tasks = []
+        for entry in entries:
+            for group, members in by_group(resolve(entry)[0]).items():
+                api_names = [category.api_name for category in members]
+                tasks.append((f"{entry} ({group})", lambda api_names=api_names, group=group: api.get_league_leaders(
+                    api_names, season, group=group, limit=limit, league_id=league_id
+                )))
+        return tasks
+
+    # Same as 'stats "Name"' (or with an ID): resolve the name like the CLI does, then fetch the season
+    def player_stats(player):
+        player_id = player if isinstance(player, int) else None
+        if player_id is None and index is not None:
+            player_id = index.lookup(player).player_id
+        if player_id is None:
+            player_id = api.search_for_player(player)
+        return api.get_player_stats(player_id, season) if player_id else None
+
+    return [(str(player), lambda player=player: player_stats(player)) for player in options["players"]]
+
+
+class WarmState:
+    """When each job last ran, saved in the cache folder between runs."""
+
+    def __init__(self, jobs=None):
+        """
+        Args:
+            jobs (dict, optional): {job name: {"last_run", "ok", "failed"}}.
+        """
+        self.jobs = jobs or {}
+
+    @classmethod
+    def load(cls, path):
+        """Reads saved state, or starts empty if there is none (or it can't be read)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f).get("jobs", {}))
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path):
+        """Writes the state atomically, so an interrupted run never leaves a broken file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"jobs": self.jobs}, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def last_runs(self):
+        return {name: job["last_run"] for name, job in self.jobs.items()}
+
+    def record(self, name, when, ok, failed):
+        """Records a run. A run where every call failed doesn't count, so the job is retried."""
+        if ok:
+            self.jobs[name] = {"last_run": when, "ok": ok, "failed": failed}
+
+
+def run_jobs(schedule, jobs, team_map, index=None, workers=None):
+    """
+    Runs jobs' API calls on a bounded thread pool, refreshing the cache as they go.
+
+    Calls are queued in the order of the jobs (most urgent first), so with more
+    calls than workers the important ones finish first.
+
+    Returns:
+        dict: {job name: (calls that worked, calls that failed)}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src import client
+
+    workers = max(1, workers or schedule.workers)
+    client.grow_pool(workers)
+
+    def run(job, func):
+        with api.warming():
+            return func()
+
+    results = {job.name: [0, 0] for job in jobs}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(job, executor.submit(run, job, func)) for job in jobs for _, func in job_tasks(job, team_map, index)]
+        for job, future in futures:
+            try:
+                worked = bool(future.result())
+            except Exception:  # A daemon shouldn't die on one bad response; it's counted as failed
+                worked = False
+            results[job.name][0 if worked else 1] += 1
+    return {name: tuple(counts) for name, counts in results.items()}
+
+
+def run_schedule(schedule, state, path, team_map, index=None, workers=None, once=False, ignore_window=False,
+                 report=print, clock=time.time, sleep=time.sleep, max_rounds=None):
+    """
+    Runs due jobs, saves when each ran, then waits for the next one; again and again.
+
+    Args:
+        schedule (Schedule): The jobs.
+        state (WarmState): When each job last ran (saved to path after every round).
+        path (str): The state file.
+        team_map (dict): {team code: team ID}.
+        index (PlayerIndex, optional): Resolves player names without a search request.
+        workers (int, optional): Overrides the schedule's concurrency.
+        once (bool, optional): Run what's due now and return (e.g., from cron).
+        ignore_window (bool, optional): Don't wait for the off-peak window.
+        report (callable, optional): Receives each progress line.
+        clock, sleep (callable, optional): For tests.
+        max_rounds (int, optional): Stop after this many rounds (for tests).
+    """
+    rounds = 0
+    while True:
+        rounds += 1
+        started = clock()
+        jobs = schedule.due(state.last_runs(), started, ignore_window=ignore_window)
+        if jobs:
+            report(f"Refreshing {', '.join(job.name for job in jobs)}...")
+            results = run_jobs(schedule, jobs, team_map, index=index, workers=workers)
+            for job in jobs:
+                ok, failed = results[job.name]
+                state.record(job.name, started, ok, failed)
+                report(f"  {job.name}: {ok}/{ok + failed} refreshed" + (f", {failed} failed" if failed else ""))
+            state.save(path)
+        elif once:
+            report("Nothing to run now.")
+
+        if once or (max_rounds and rounds >= max_rounds):
+            return
+        wait = schedule.next_check(state.last_runs(), clock())
+        report(f"Next check in {wait / 60:.0f} min.")
+        sleep(wait)
@@ -0,0 +1,16 @@
+import pytest
+from src import api
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """
+    Points the response cache at a temporary folder for every test, and turns
+    it (and forwarding to a 'serve' process and the fields projection) back off
+    afterwards, so tests never read or write the real cache.
+    """
+    monkeypatch.setenv("MLB_STATS_CACHE_DIR", str(tmp_path / "cache"))
+    yield
+    api.configure_cache(enabled=False)
+    api.configure_server(None)
+    api.configure_projection(False)
@@ -1,10 +1,15 @@
+import io
+import json
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
-from src.api import get_roster, get_league_leaders, search_for_player, get_player_stats
+from src.api import (
+    get_roster, get_league_leaders, search_for_player, get_player_stats, get_people_stats, get_live_diff, get_team_roster_stats,
+    get_schedule_range, get_standings, get_boxscore, stream_roster, StreamError
+)
 
-# The string 'src.api.requests.get' is the full path to the 'get' function in the 'requests' module
-@patch('src.api.requests.get')
+# The string 'src.api.client.get' is the full path to the shared-session 'get' that api.py calls
+@patch('src.api.client.get')
 def test_get_roster_success(mock_get):
     """
     Tests that get_roster returns correct data on a successful API call.
@@ -17,9 +22,9 @@ def test_get_roster_success(mock_get):
     }
     
     mock_response = MagicMock()
-    mock_response.json.return_value = fake_json
+    mock_response.content = json.dumps(fake_json).encode()
     mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response # Make requests.get() return our test response
+    mock_get.return_value = mock_response # Make client.get() return our test response
     
     # Call the function we are testing
     team_id = 113
@@ -27,25 +32,23 @@ def test_get_roster_success(mock_get):
     
     # Check that the function behaved as expected
     expected_url = f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
-    mock_get.assert_called_once_with(expected_url) # Was it called with the right URL?
+    mock_get.assert_called_once_with(expected_url, params=None) # Was it called with the right URL?
     assert result == fake_json # Did it return the test data?
 
-@patch('src.api.requests.get')
+@patch('src.api.client.get')
 def test_get_roster_failure(mock_get):
     """
     Tests that get_roster returns None when the API call fails.
     """
     # Configure the mock to simulate an HTTP error
-    mock_response = MagicMock()
-    # Tell the mock to raise an error when .raise_for_status() is called
-    mock_response.raise_for_status.side_effect = requests.exceptions.RequestException("404 Error")
-    mock_get.return_value = mock_response
+    # (client.get raises once it has given up on retries or sees a 404)
+    mock_get.side_effect = requests.exceptions.RequestException("404 Error")
     
     result = get_roster(113)
     
     assert result is None # The function should catch the error and return None
 
-@patch('src.api.requests.get')
+@patch('src.api.client.get')
 def test_get_league_leaders_success(mock_get):
     """
     Tests that get_league_leaders returns correct data on a successful call.
@@ -56,7 +59,7 @@ def test_get_league_leaders_success(mock_get):
         ]
     }
     mock_response = MagicMock()
-    mock_response.json.return_value = fake_json
+    mock_response.content = json.dumps(fake_json).encode()
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
     
@@ -76,14 +79,37 @@ def test_get_league_leaders_success(mock_get):
     mock_get.assert_called_once_with(expected_url, params=expected_params)
     assert result == fake_json
 
-@patch('src.api.requests.get')
+@patch('src.api.client.get')
+def test_get_league_leaders_several_categories_and_league(mock_get):
+    """
+    Tests that a list of categories goes out as one comma-separated request with a leagueId.
+    """
+    mock_response = MagicMock()
+    mock_response.content = b'{"leagueLeaders": []}'
+    mock_get.return_value = mock_response
+
+    get_league_leaders(["homeRuns", "battingAverage"], 2024, limit=50, league_id=103)
+
+    mock_get.assert_called_once_with(
+        "https://statsapi.mlb.com/api/v1/stats/leaders",
+        params={
+            "leaderCategories": "homeRuns,battingAverage",
+            "season": 2024,
+            "statGroup": "hitting",
+            "limit": 50,
+            "sportId": 1,
+            "leagueId": 103
+        }
+    )
+
+@patch('src.api.client.get')
 def test_search_for_player_success(mock_get):
     """
     Tests that search_for_player returns the player ID when a player is found.
     """
     fake_json = {"people": [{"id": 12345, "fullName": "Test Player"}]}
     mock_response = MagicMock()
-    mock_response.json.return_value = fake_json
+    mock_response.content = json.dumps(fake_json).encode()
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
     
@@ -91,14 +117,14 @@ def test_search_for_player_success(mock_get):
     
     assert result == 12345 # Should return the ID
 
-@patch('src.api.requests.get')
+@patch('src.api.client.get')
 def test_search_for_player_not_found(mock_get):
     """
     Tests that search_for_player returns None when no player is found.
     """
     fake_json = {"people": []} # API returns an empty list
     mock_response = MagicMock()
-    mock_response.json.return_value = fake_json
+    mock_response.content = json.dumps(fake_json).encode()
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
     
@@ -106,7 +132,7 @@ def test_search_for_player_not_found(mock_get):
     
     assert result is None # Should return None
 
-@patch('src.api.requests.get')
+@patch('src.api.client.get')
 def test_get_player_stats_success(mock_get):
     """
     Tests that get_player_stats returns data on a successful call.
@@ -117,7 +143,7 @@ def test_get_player_stats_success(mock_get):
         ]
     }
     mock_response = MagicMock()
-    mock_response.json.return_value = fake_json
+    mock_response.content = json.dumps(fake_json).encode()
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
     
@@ -134,4 +160,180 @@ def test_get_player_stats_success(mock_get):
         "sportId": 1
     }
     mock_get.assert_called_once_with(expected_url, params=expected_params)
-    assert result == fake_json
\ No newline at end of file
+    assert result == fake_json
+
+
+@patch('src.api.client.get')
+def test_get_people_stats_chunks_ids(mock_get):
+    """
+    Tests that get_people_stats sends IDs in chunks and merges the people lists.
+    """
+    first = MagicMock()
+    first.content = b'{"people": [{"id": 1}, {"id": 2}]}'
+    second = MagicMock()
+    second.content = b'{"people": [{"id": 3}]}'
+    mock_get.side_effect = [first, second]
+
+    result = get_people_stats([3, 1, 2, 1], 2024, chunk_size=2)
+
+    assert result == {"people": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    assert mock_get.call_count == 2
+    assert mock_get.call_args_list[0].kwargs["params"]["personIds"] == "1,2"
+    assert "season=2024" in mock_get.call_args_list[0].kwargs["params"]["hydrate"]
+
+@patch('src.api.client.get')
+def test_get_live_diff_asks_for_changes_since_a_timecode(mock_get):
+    """
+    Tests that get_live_diff requests the diffPatch feed for a timecode and returns the patches.
+    """
+    patches = [{"diff": [{"op": "replace", "path": "/metaData/timeStamp", "value": "20240601_200100"}]}]
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(patches).encode()
+    mock_get.return_value = mock_response
+
+    result = get_live_diff(745123, "20240601_200000")
+
+    mock_get.assert_called_once_with(
+        "https://statsapi.mlb.com/api/v1.1/game/745123/feed/live/diffPatch",
+        params={"startTimecode": "20240601_200000"}
+    )
+    assert result == patches
+
+@patch('src.api.client.get')
+def test_get_team_roster_stats_hydrates_people(mock_get):
+    """
+    Tests that a team's stats come from one roster request with the people's stats hydrated.
+    """
+    mock_response = MagicMock()
+    mock_response.content = b'{"roster": []}'
+    mock_get.return_value = mock_response
+
+    assert get_team_roster_stats(113, 2024) == {"roster": []}
+
+    url = mock_get.call_args.args[0]
+    params = mock_get.call_args.kwargs["params"]
+    assert url == "https://statsapi.mlb.com/api/v1/teams/113/roster"
+    assert params["rosterType"] == "fullSeason"
+    assert params["hydrate"] == "person(stats(group=[hitting,pitching],type=[season],season=2024))"
+
+
+@patch('src.api.client.get')
+def test_get_schedule_range_hydrates_line_scores(mock_get):
+    """
+    Tests that a date range is one schedule request, hydrated with line scores and decisions.
+    """
+    mock_response = MagicMock()
+    mock_response.content = b'{"dates": []}'
+    mock_get.return_value = mock_response
+
+    assert get_schedule_range("2024-06-01", "2024-06-30", team_id=113) == {"dates": []}
+
+    mock_get.assert_called_once_with(
+        "https://statsapi.mlb.com/api/v1/schedule",
+        params={"sportId": 1, "startDate": "2024-06-01", "endDate": "2024-06-30", "teamId": 113,
+                "hydrate": "linescore,decisions"}
+    )
+
+@patch('src.api.client.get')
+def test_get_standings_asks_for_both_leagues(mock_get):
+    """
+    Tests that get_standings requests both leagues by default, with team and division names.
+    """
+    mock_response = MagicMock()
+    mock_response.content = b'{"records": []}'
+    mock_get.return_value = mock_response
+
+    assert get_standings(2024) == {"records": []}
+
+    params = mock_get.call_args.kwargs["params"]
+    assert mock_get.call_args.args[0] == "https://statsapi.mlb.com/api/v1/standings"
+    assert params["leagueId"] == "103,104"
+    assert params["standingsTypes"] == "regularSeason"
+
+@patch('src.api.client.get')
+def test_get_boxscore_failure(mock_get):
+    """
+    Tests that get_boxscore returns None when the API call fails.
+    """
+    mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
+
+    assert get_boxscore(745123, final=True) is None
+    assert mock_get.call_args.args[0] == "https://statsapi.mlb.com/api/v1/game/745123/boxscore"
+
+@patch('src.api.client.get')
+def test_stream_roster_reads_entries_off_the_response(mock_get):
+    """
+    Tests that with the cache off, stream_roster parses the response body as it
+    is read and closes the response when the entries run out.
+    """
+    import io
+
+    mock_response = MagicMock()
+    mock_response.raw = io.BytesIO(b'{"roster": [{"jerseyNumber": "10"}, {"jerseyNumber": "44"}], "teamId": 113}')
+    mock_get.return_value = mock_response
+
+    entries = stream_roster(113)
+
+    mock_get.assert_called_once_with("https://statsapi.mlb.com/api/v1/teams/113/roster", params=None, stream=True)
+    assert [entry["jerseyNumber"] for entry in entries] == ["10", "44"]
+    mock_response.close.assert_called_once()
+
+class BrokenBody:
+    """A response body that sends the start of a roster and then loses the connection."""
+
+    def __init__(self):
+        self.sent = False
+
+    def read(self, size=-1):
+        from urllib3.exceptions import ProtocolError
+        if self.sent:
+            raise ProtocolError("Connection broken: IncompleteRead(0 bytes read)")
+        self.sent = True
+        return b'{"roster": [{"jerseyNumber": "10"}, {"jerseyNumber": '
+
+
+@pytest.mark.parametrize("body", [BrokenBody, lambda: io.BytesIO(b'{"roster": [{"jerseyNumber": "10"}, {"jersey')])
+@patch('builtins.print')
+@patch('src.api.client.get')
+def test_stream_roster_breaking_off_is_reported(mock_get, mock_print, body):
+    """
+    Tests that a body that breaks off partway (a dropped connection or cut-off JSON)
+    is reported like an API error and raises StreamError instead of a raw traceback.
+    """
+    mock_response = MagicMock()
+    mock_response.raw = body()
+    mock_get.return_value = mock_response
+
+    entries = stream_roster(113)
+    with pytest.raises(StreamError):
+        list(entries)
+
+    assert mock_print.call_args.args[0].startswith("Error fetching roster from API: ")
+    mock_response.close.assert_called_once()
+
+@patch('src.api.client.get')
+def test_stream_roster_failure(mock_get):
+    """
+    Tests that stream_roster returns None when the request fails.
+    """
+    mock_get.side_effect = requests.exceptions.ConnectionError("no route")
+
+    assert stream_roster(113) is None
+
+@patch('src.api.client.get')
+def test_projection_asks_only_for_the_spec_d_fields(mock_get):
+    """
+    Tests that with the projection on, get_roster sends a 'fields' list built from its spec.
+    """
+    from src import api
+
+    mock_response = MagicMock()
+    mock_response.content = b'{"roster": []}'
+    mock_get.return_value = mock_response
+
+    api.configure_projection(True)
+    get_roster(113)
+
+    assert mock_get.call_args.kwargs["params"] == {
+        "fields": "roster,person,id,fullName,jerseyNumber,position,name,status,description"
+    }
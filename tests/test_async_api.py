@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+from src.async_api import AsyncAPI
+
+
+def test_gather_keeps_order_and_limits_concurrency():
+    """
+    Tests that gather() returns results in call order and never runs more
+    calls at once than the concurrency limit.
+    """
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_get_roster(team_id):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {"team": team_id}
+
+    async def run():
+        async with AsyncAPI(concurrency=3) as mlb:
+            return await mlb.gather(mlb.get_roster(team_id) for team_id in range(10))
+
+    with patch('src.async_api.api.get_roster', side_effect=fake_get_roster):
+        results = asyncio.run(run())
+
+    assert results == [{"team": team_id} for team_id in range(10)]
+    assert peak <= 3
+
+
+@patch('src.async_api.api.get_player_stats')
+def test_get_player_stats_passes_arguments(mock_get_stats):
+    """
+    Tests that the coroutine forwards its arguments to the sync function.
+    """
+    mock_get_stats.return_value = {"stats": []}
+
+    async def run():
+        async with AsyncAPI(concurrency=2) as mlb:
+            return await mlb.get_player_stats(12345, 2024)
+
+    assert asyncio.run(run()) == {"stats": []}
+    mock_get_stats.assert_called_once_with(12345, 2024)
+
+
+@patch('src.async_api.api.get_league_leaders')
+def test_list_arguments_share_one_call(mock_get_leaders):
+    """
+    Tests that calls with a list of categories work, and identical ones still share one run.
+    """
+    mock_get_leaders.return_value = {"leagueLeaders": []}
+
+    async def run():
+        async with AsyncAPI(concurrency=2) as mlb:
+            return await mlb.gather(mlb.get_league_leaders(["homeRuns", "battingAverage"], 2024) for _ in range(3))
+
+    assert asyncio.run(run()) == [{"leagueLeaders": []}] * 3
+    mock_get_leaders.assert_called_once_with(["homeRuns", "battingAverage"], 2024, group="hitting", limit=10, league_id=None)
@@ -0,0 +1,94 @@
+import json
+import pytest
+
+from benchmarks.replay_server import ReplayServer
+from benchmarks.run import compare
+from src import api, client, metrics
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    """Points the API functions at a local replay server, with the cache off."""
+    def start(**options):
+        server = ReplayServer(**options).start()
+        monkeypatch.setattr(api, "BASE_URL", server.url)
+        started.append(server)
+        return server
+
+    started = []
+    api.configure_cache(enabled=False)
+    yield start
+    for server in started:
+        server.stop()
+    client.close_session()
+
+
+def test_synthetic_responses_look_like_the_api(replay):
+    """
+    Tests that a request without a recording gets a realistically shaped synthetic response.
+    """
+    server = replay()
+
+    roster = api.get_roster(113)
+    people = api.get_people_stats([roster["roster"][0]["person"]["id"]], 2024)
+
+    assert len(roster["roster"]) == 40
+    assert people["people"][0]["stats"][0]["splits"][0]["season"] == "2024"
+    assert server.stats["requests"] == 2
+
+
+def test_recordings_are_replayed(replay, tmp_path):
+    """
+    Tests that a recorded response wins over the synthetic one.
+    """
+    recording = {"path": "/api/v1/teams/113/roster", "query": {}, "status": 200,
+                 "body": {"roster": [{"person": {"id": 1, "fullName": "Recorded Player"}}]}}
+    (tmp_path / "000.json").write_text(json.dumps(recording))
+    replay(recordings_dir=str(tmp_path))
+
+    assert api.get_roster(113)["roster"][0]["person"]["fullName"] == "Recorded Player"
+
+
+def test_injected_errors_are_retried(replay):
+    """
+    Tests that injected 503s reach the client, which retries and finally gives up.
+    """
+    server = replay(error_rate=1.0)
+    client.configure(backoff=0)
+    try:
+        assert api.get_roster(113) is None
+    finally:
+        client.configure(backoff=client.DEFAULT_BACKOFF)
+
+    assert server.stats["errors"] == client.DEFAULT_RETRIES + 1
+
+
+def test_projected_responses_are_trimmed_and_compressed(replay):
+    """
+    Tests that with the projection on only the spec'd keys come back, gzipped,
+    and the request metric reports the smaller size over the wire.
+    """
+    replay()
+    api.configure_projection(True)
+    collector = metrics.add_hook(metrics.Collector())
+    try:
+        roster = api.get_roster(113)
+    finally:
+        metrics.remove_hook(collector)
+
+    assert set(roster["roster"][0]) == {"person", "jerseyNumber", "position", "status"}
+    assert set(roster["roster"][0]["person"]) == {"id", "fullName"}
+    assert collector.counter("encodings", "gzip") == 1
+    assert 0 < collector.counter("bytes_wire") < collector.counter("bytes_received")
+
+
+def test_compare_flags_regressions():
+    """
+    Tests that only benchmarks slower than the threshold count as regressions.
+    """
+    baseline = {"results": [{"name": "single_call", "p50": 0.10}, {"name": "cli_help", "p50": 0.20}]}
+    results = [{"name": "single_call", "p50": 0.13}, {"name": "cli_help", "p50": 0.19}, {"name": "new", "p50": 1.0}]
+
+    rows = compare(results, baseline, threshold=10)
+
+    assert [(name, regressed) for name, _, _, _, regressed in rows] == [("single_call", True), ("cli_help", False)]
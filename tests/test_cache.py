@@ -0,0 +1,174 @@
+import datetime
+import pytest
+from unittest.mock import patch, MagicMock
+from src import api
+from src.cache import ResponseCache, make_key
+
+
+def make_response(body, status_code=200, headers=None):
+    """Builds a fake response carrying a raw JSON body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = body
+    response.headers = headers or {}
+    return response
+
+
+def test_make_key_ignores_param_order():
+    """
+    Tests that the same params in a different order produce the same key.
+    """
+    assert make_key("https://x", {"a": 1, "b": 2}) == make_key("https://x", {"b": 2, "a": 1})
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """
+    Tests that the oldest untouched entry is dropped once the size limit is hit.
+    """
+    store = ResponseCache(str(tmp_path), max_bytes=25)
+    store.put("a", b"0123456789")
+    store.put("b", b"0123456789")
+    store.get("a")  # 'a' is now more recently used than 'b'
+    store.put("c", b"0123456789")
+
+    assert store.get("a") is not None
+    assert store.get("b") is None
+    assert store.get("c") is not None
+
+
+@patch('src.api.client.get')
+def test_completed_season_is_served_from_cache(mock_get):
+    """
+    Tests that a completed season is fetched once and then read from disk.
+    """
+    api.configure_cache()
+    mock_get.return_value = make_response(b'{"stats": []}')
+
+    first = api.get_player_stats(12345, 2020)
+    second = api.get_player_stats(12345, 2020)
+
+    assert first == second == {"stats": []}
+    mock_get.assert_called_once()
+
+
+@patch('src.api.client.get')
+def test_stale_entry_is_revalidated_with_etag(mock_get):
+    """
+    Tests that an expired entry sends If-None-Match and reuses the body on a 304.
+    """
+    api.configure_cache()
+    mock_get.return_value = make_response(b'{"roster": []}', headers={"ETag": '"v1"'})
+    api.get_roster(113)
+
+    # Expire everything, then have the server say "not modified"
+    with patch('src.cache.time.time', return_value=10 ** 12):
+        mock_get.return_value = make_response(b"", status_code=304)
+        result = api.get_roster(113)
+
+    assert result == {"roster": []}
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch('src.api.client.get')
+def test_poll_with_ttl_zero_revalidates_a_fresh_entry(mock_get):
+    """
+    Tests that a 'watch' / 'roster --diff' poll (ttl=0) revalidates a roster that a
+    normal 'roster' run cached for ROSTER_TTL, instead of reading it from disk.
+    """
+    api.configure_cache()
+    mock_get.return_value = make_response(b'{"roster": []}', headers={"ETag": '"v1"'})
+    api.get_roster(113)
+
+    mock_get.return_value = make_response(b'{"roster": [{"jerseyNumber": "7"}]}', headers={"ETag": '"v2"'})
+    result = api.get_roster(113, ttl=0)
+
+    assert result == {"roster": [{"jerseyNumber": "7"}]}
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_cache_files_without_stored_at_are_upgraded(tmp_path):
+    """
+    Tests that a cache written before entries recorded when they were stored still
+    opens, and that its old entries count as too old for a caller's max_age.
+    """
+    import sqlite3
+    from src.cache import CACHE_FILENAME, is_fresh
+
+    conn = sqlite3.connect(str(tmp_path / CACHE_FILENAME))
+    conn.execute(
+        "CREATE TABLE responses (key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT,"
+        " expires_at REAL, last_access REAL NOT NULL, size INTEGER NOT NULL)"
+    )
+    conn.execute("INSERT INTO responses VALUES ('old', x'7b7d', NULL, NULL, 1e12, 0, 2)")
+    conn.commit()
+    conn.close()
+
+    store = ResponseCache(str(tmp_path))
+    old = store.get("old")
+    assert old.body == b"{}" and old.stored_at is None
+    assert is_fresh(old) and not is_fresh(old, max_age=60)
+
+    store.put("new", b"{}", ttl=60)
+    assert is_fresh(store.get("new"), max_age=60)
+
+
+@patch('src.api.client.get')
+def test_finished_schedule_range_is_kept_for_good(mock_get):
+    """
+    Tests that a date range whose games are all final is never re-requested, even long after.
+    """
+    api.configure_cache()
+    finished = b'{"dates": [{"games": [{"gamePk": 1, "status": {"abstractGameState": "Final"}}]}]}'
+    mock_get.return_value = make_response(finished)
+    api.get_schedule_range("2024-06-01", "2024-06-07")
+
+    with patch('src.cache.time.time', return_value=10 ** 12):
+        result = api.get_schedule_range("2024-06-01", "2024-06-07")
+
+    assert result["dates"][0]["games"][0]["gamePk"] == 1
+    mock_get.assert_called_once()
+
+
+@patch('src.api.client.get')
+def test_schedule_range_with_unfinished_games_expires(mock_get):
+    """
+    Tests that a range with a game still to be played is fetched again once its TTL runs out.
+    """
+    api.configure_cache()
+    pending = b'{"dates": [{"games": [{"gamePk": 1, "status": {"abstractGameState": "Live"}}]}]}'
+    mock_get.return_value = make_response(pending)
+    api.get_schedule_range("2024-06-01", "2024-06-07")
+
+    with patch('src.cache.time.time', return_value=10 ** 12):
+        api.get_schedule_range("2024-06-01", "2024-06-07")
+
+    assert mock_get.call_count == 2
+
+
+@patch('src.api.client.get')
+def test_warming_revalidates_fresh_entries_but_keeps_their_ttl(mock_get):
+    """
+    Tests that inside api.warming() a fresh entry is still revalidated, and that a
+    warmed current-season entry then goes stale after CURRENT_SEASON_TTL like any other.
+    """
+    import time
+    season = datetime.datetime.now().year
+    api.configure_cache()
+    mock_get.return_value = make_response(b'{"stats": []}', headers={"ETag": '"v1"'})
+    api.get_player_stats(592450, season)
+
+    mock_get.return_value = make_response(b"", status_code=304)
+    with api.warming():
+        api.get_player_stats(592450, season)
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    # Still fresh a little later...
+    with patch('src.cache.time.time', return_value=time.time() + 60):
+        api.get_player_stats(592450, season)
+    assert mock_get.call_count == 2
+    # ...but revalidated once the current-season ttl has passed
+    with patch('src.cache.time.time', return_value=time.time() + api.CURRENT_SEASON_TTL + 60):
+        api.get_player_stats(592450, season)
+    assert mock_get.call_count == 3
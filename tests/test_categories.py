@@ -0,0 +1,42 @@
+from src.categories import CATEGORIES, by_group, resolve
+
+
+def test_resolve_codes_and_api_names():
+    """
+    Tests that codes are case-insensitive, API names work too, and duplicates are dropped.
+    """
+    categories, unknown = resolve("hr, onBasePlusSlugging,ERA,HR")
+
+    assert [category.code for category in categories] == ["HR", "OPS", "ERA"]
+    assert unknown == []
+
+
+def test_resolve_reports_unknown_codes():
+    """
+    Tests that unrecognised codes are returned separately.
+    """
+    categories, unknown = resolve("AVG,NOPE")
+
+    assert [category.code for category in categories] == ["AVG"]
+    assert unknown == ["NOPE"]
+
+
+def test_by_group_keeps_first_seen_order():
+    """
+    Tests that categories are split by stat group in the order they first appear.
+    """
+    categories, _ = resolve("ERA,HR,SO,AVG")
+    groups = by_group(categories)
+
+    assert list(groups) == ["pitching", "hitting"]
+    assert [category.code for category in groups["pitching"]] == ["ERA", "SO"]
+    assert [category.code for category in groups["hitting"]] == ["HR", "AVG"]
+
+
+def test_registry_codes_and_api_names_are_unique():
+    """
+    Tests that no two categories share a code or an API name within a group.
+    """
+    keys = [(category.group, category.api_name) for category in CATEGORIES.values()]
+    assert len(keys) == len(set(keys))
+    assert all(code == category.code for code, category in CATEGORIES.items())
@@ -0,0 +1,179 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from src import client
+
+
+def make_response(status_code, headers=None):
+    """Builds a fake response object with the given status code and headers."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    """Makes sure every test starts (and ends) without a cached session."""
+    client.close_session()
+    yield
+    client.close_session()
+
+
+def test_get_session_is_shared():
+    """
+    Tests that every call gets the same pooled session back.
+    """
+    assert client.get_session() is client.get_session()
+
+
+def test_grow_pool_keeps_the_session_in_use():
+    """
+    Tests that growing the pool mounts a bigger adapter on the same session
+    (which other threads may be using) and that a smaller size changes nothing.
+    """
+    session = client.get_session()
+    old_adapter = session.get_adapter("https://statsapi.mlb.com")
+    try:
+        client.grow_pool(client.DEFAULT_POOL_SIZE + 10)
+        adapter = session.get_adapter("https://statsapi.mlb.com")
+        assert client.get_session() is session
+        assert adapter is not old_adapter and adapter._pool_maxsize == client.DEFAULT_POOL_SIZE + 10
+
+        client.grow_pool(2)
+        assert session.get_adapter("https://statsapi.mlb.com") is adapter
+    finally:
+        client.close_session()
+        client.configure(pool_size=client.DEFAULT_POOL_SIZE)
+
+
+@patch('src.client.time.sleep')
+@patch('src.client.get_session')
+def test_get_retries_server_errors(mock_get_session, mock_sleep):
+    """
+    Tests that a 503 is retried and the later successful response is returned.
+    """
+    ok = make_response(200)
+    session = MagicMock()
+    session.get.side_effect = [make_response(503), ok]
+    mock_get_session.return_value = session
+
+    result = client.get("https://example.com/x", params={"a": 1})
+
+    assert result is ok
+    assert session.get.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch('src.client.time.sleep')
+@patch('src.client.get_session')
+def test_get_honours_retry_after(mock_get_session, mock_sleep):
+    """
+    Tests that a 429 with a Retry-After header waits exactly that long.
+    """
+    session = MagicMock()
+    session.get.side_effect = [make_response(429, {"Retry-After": "2"}), make_response(200)]
+    mock_get_session.return_value = session
+
+    client.get("https://example.com/x")
+
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch('src.client.time.sleep')
+@patch('src.client.get_session')
+def test_get_gives_up_after_retries(mock_get_session, mock_sleep):
+    """
+    Tests that the error is raised once every retry has been used up.
+    """
+    session = MagicMock()
+    session.get.return_value = make_response(500)
+    mock_get_session.return_value = session
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("https://example.com/x")
+
+    assert session.get.call_count == client.DEFAULT_RETRIES + 1
+
+
+@patch('src.client.time.sleep')
+@patch('src.client.get_session')
+def test_rate_limit_applies_to_every_attempt(mock_get_session, mock_sleep):
+    """
+    Tests that each attempt, retries included, waits for a rate-limit slot.
+    """
+    session = MagicMock()
+    session.get.side_effect = [make_response(503), make_response(200)]
+    mock_get_session.return_value = session
+    limiter = client.configure_rate_limit(100)
+    try:
+        client.get("https://example.com/x")
+        assert limiter.stats()["requests"] == 2
+    finally:
+        client.configure_rate_limit(None)
+    assert client.get_rate_limiter() is None
+
+
+@patch('src.client.time.sleep')
+@patch('src.client.get_session')
+def test_requests_and_retries_are_measured(mock_get_session, mock_sleep):
+    """
+    Tests that each attempt is reported to metrics hooks with its status, size and retry.
+    """
+    import datetime
+    from src import metrics
+
+    ok = make_response(200)
+    ok.content = b'{"roster": []}'
+    busy = make_response(503)
+    for response in (ok, busy):
+        response.elapsed = datetime.timedelta(milliseconds=20)
+    session = MagicMock()
+    session.get.side_effect = [busy, ok]
+    mock_get_session.return_value = session
+
+    events = []
+    metrics.add_hook(events.append)
+    try:
+        client.get("https://statsapi.mlb.com/api/v1/teams/113/roster")
+    finally:
+        metrics.remove_hook(events.append)
+
+    assert [(event.kind, event.labels.get("status")) for event in events] == [
+        ("request", 503), ("retry", None), ("request", 200)
+    ]
+    assert events[-1].name == "/api/v1/teams/{id}/roster"
+    assert events[-1].size == len(ok.content)
+    assert events[-1].labels["ttfb"] == 0.02
+
+
+
+def test_session_negotiates_compression():
+    """
+    Tests that the session asks for gzip explicitly, and brotli only when it can be decoded.
+    """
+    encodings = client.get_session().headers["Accept-Encoding"].split(", ")
+
+    assert "gzip" in encodings
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        assert "br" not in encodings
+    else:
+        assert encodings[0] == "br"
+
+
+def test_wire_size_reads_the_compressed_byte_count():
+    """
+    Tests that the size over the wire comes from the raw stream, and is None when unknown.
+    """
+    response = MagicMock()
+    response.raw.tell.return_value = 1234
+    assert client.wire_size(response) == 1234
+
+    response.raw = None
+    assert client.wire_size(response) is None
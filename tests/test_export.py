@@ -0,0 +1,79 @@
+import csv
+import json
+import pytest
+from unittest.mock import patch
+from src.export import ExportError, open_writer
+
+ROWS = [{"name": "Player One", "value": 1}, {"name": "Player Two", "value": 2}]
+
+
+def test_ndjson_writer(tmp_path):
+    path = tmp_path / "out.ndjson"
+    with open_writer("ndjson", ["name", "value"], str(path)) as writer:
+        for row in ROWS:
+            writer.write(row)
+
+    assert [json.loads(line) for line in path.read_text().splitlines()] == ROWS
+
+
+def test_json_writer_produces_one_array(tmp_path):
+    path = tmp_path / "out.json"
+    with open_writer("json", ["name", "value"], str(path)) as writer:
+        for row in ROWS:
+            writer.write(row)
+
+    assert json.loads(path.read_text()) == ROWS
+
+
+def test_json_writer_with_no_rows(tmp_path):
+    path = tmp_path / "out.json"
+    with open_writer("json", ["name"], str(path)):
+        pass
+
+    assert json.loads(path.read_text()) == []
+
+
+def test_csv_writer_fills_missing_fields(tmp_path):
+    path = tmp_path / "out.csv"
+    with open_writer("csv", ["name", "value", "extra"], str(path)) as writer:
+        for row in ROWS:
+            writer.write(row)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0] == {"name": "Player One", "value": "1", "extra": ""}
+
+
+def test_parquet_writer(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    with open_writer("parquet", ["name", "value"], str(path)) as writer:
+        for row in ROWS:
+            writer.write(row)
+
+    assert pq.read_table(str(path)).to_pylist() == ROWS
+
+
+
+def test_parquet_writer_fills_in_columns_that_started_empty(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    # Like 'live' before a game starts: no outs yet, and a flush() after every update
+    path = tmp_path / "live.parquet"
+    with open_writer("parquet", ["game_pk", "outs"], str(path)) as writer:
+        writer.write({"game_pk": 1, "outs": None})
+        writer.flush()
+        writer.write({"game_pk": 1, "outs": 2})
+        writer.flush()
+    assert pq.read_table(str(path)).to_pylist() == [{"game_pk": 1, "outs": None}, {"game_pk": 1, "outs": 2}]
+
+    # Across row groups the column is stored as text
+    with patch('src.export.PARQUET_BATCH_SIZE', 1):
+        with open_writer("parquet", ["game_pk", "outs"], str(path)) as writer:
+            writer.write({"game_pk": 1, "outs": None})
+            writer.write({"game_pk": 1, "outs": 2})
+    assert pq.read_table(str(path)).to_pylist() == [{"game_pk": 1, "outs": None}, {"game_pk": 1, "outs": "2"}]
+
+def test_parquet_needs_an_output_file():
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ExportError):
+        open_writer("parquet", ["name"])
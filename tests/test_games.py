@@ -0,0 +1,83 @@
+from src.games import boxscore_notes, describe, game_rows, standings_rows
+
+TEAM_CODES = {147: "NYY", 111: "BOS"}
+
+SCHEDULE = {"dates": [{"date": "2024-06-01", "games": [
+    {
+        "gamePk": 1,
+        "status": {"abstractGameState": "Final", "detailedState": "Final"},
+        "teams": {"away": {"team": {"id": 147}, "score": 5}, "home": {"team": {"id": 111}, "score": 3}},
+        "linescore": {"teams": {"away": {"hits": 9, "errors": 0}, "home": {"hits": 7, "errors": 1}}},
+        "decisions": {"winner": {"fullName": "Gerrit Cole"}, "loser": {"fullName": "Brayan Bello"},
+                      "save": {"fullName": "Clay Holmes"}},
+    },
+    {
+        "gamePk": 2,
+        "status": {"abstractGameState": "Preview", "detailedState": "Scheduled"},
+        "teams": {"away": {"team": {"id": 999, "name": "Some Other Team"}}, "home": {"team": {"id": 147}}},
+    },
+]}]}
+
+
+def test_game_rows_flatten_the_schedule():
+    """
+    Tests that each game becomes one row with scores, hits, errors and decisions.
+    """
+    final, scheduled = game_rows(SCHEDULE, TEAM_CODES)
+
+    assert final["date"] == "2024-06-01"
+    assert (final["away"], final["away_score"], final["away_hits"]) == ("NYY", 5, 9)
+    assert (final["home"], final["home_score"], final["home_errors"]) == ("BOS", 3, 1)
+    assert (final["winner"], final["loser"], final["save"]) == ("Gerrit Cole", "Brayan Bello", "Clay Holmes")
+    # Teams we have no code for keep their name; unplayed games have no score
+    assert scheduled["away"] == "Some Other Team"
+    assert scheduled["away_score"] is None and scheduled["winner"] is None
+
+
+def test_describe_shows_score_and_decisions():
+    """
+    Tests the one-line text form of a finished and an upcoming game.
+    """
+    final, scheduled = game_rows(SCHEDULE, TEAM_CODES)
+
+    assert describe(final) == "  2024-06-01  NYY   5 @ BOS   3  Final  (W: Gerrit Cole, L: Brayan Bello, S: Clay Holmes)"
+    assert describe(scheduled).endswith("Scheduled")
+
+
+def test_boxscore_notes_list_homers_and_starters():
+    """
+    Tests that the box score highlights name every home run and the first pitcher's line.
+    """
+    boxscore = {"teams": {
+        "away": {
+            "team": {"id": 147},
+            "pitchers": [45, 46],
+            "players": {
+                "ID99": {"person": {"fullName": "Aaron Judge"}, "stats": {"batting": {"homeRuns": 2}}},
+                "ID98": {"person": {"fullName": "Anthony Volpe"}, "stats": {"batting": {"homeRuns": 0}}},
+                "ID45": {"person": {"fullName": "Gerrit Cole"}, "stats": {"pitching": {
+                    "inningsPitched": "6.0", "hits": 4, "earnedRuns": 1, "strikeOuts": 8}}},
+            },
+        },
+        "home": {"team": {"id": 111}, "pitchers": [], "players": {}},
+    }}
+
+    assert boxscore_notes(boxscore, TEAM_CODES) == [
+        "NYY HR: Aaron Judge 2",
+        "NYY SP: Gerrit Cole 6.0 IP, 4 H, 1 ER, 8 K",
+    ]
+
+
+def test_standings_rows_name_divisions_by_id():
+    """
+    Tests that standings rows carry the division name even when the API only sends its ID.
+    """
+    standings = {"records": [{"division": {"id": 201}, "teamRecords": [
+        {"team": {"id": 147}, "divisionRank": "1", "wins": 94, "losses": 68, "winningPercentage": ".580",
+         "divisionGamesBack": "-", "streak": {"streakCode": "W3"}},
+    ]}]}
+
+    assert standings_rows(standings, TEAM_CODES) == [{
+        "division": "AL East", "rank": "1", "team": "NYY", "wins": 94, "losses": 68, "pct": ".580",
+        "games_back": "-", "streak": "W3",
+    }]
@@ -0,0 +1,154 @@
+import math
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.leaderboard import ExpressionError, Leaderboard, parse_metric
+from src.snapshot import Snapshot, write_group
+
+
+def hitter(player_id, name, pa, ab, hits, doubles, homers, walks, strikeouts, games=150, league_id=103):
+    """Builds a hitting split with consistent rate stats."""
+    total_bases = hits + doubles + 3 * homers
+    obp = (hits + walks) / (ab + walks)
+    slg = total_bases / ab
+    stat = {
+        "gamesPlayed": games, "plateAppearances": pa, "atBats": ab, "hits": hits, "doubles": doubles,
+        "homeRuns": homers, "baseOnBalls": walks, "strikeOuts": strikeouts, "hitByPitch": 0, "sacFlies": 0,
+        "totalBases": total_bases, "avg": f"{hits / ab:.3f}", "obp": f"{obp:.3f}", "slg": f"{slg:.3f}",
+        "ops": f"{obp + slg:.3f}",
+    }
+    return {"player": {"id": player_id, "fullName": name}, "team": {"id": 1, "name": "Team"},
+            "league": {"id": league_id}, "stat": stat}
+
+
+def pitcher(player_id, name, innings, homers, walks, strikeouts, earned_runs):
+    """Builds a pitching split."""
+    stat = {
+        "inningsPitched": innings, "homeRuns": homers, "baseOnBalls": walks, "hitByPitch": 0,
+        "strikeOuts": strikeouts, "earnedRuns": earned_runs,
+    }
+    return {"player": {"id": player_id, "fullName": name}, "team": {"id": 1, "name": "Team"},
+            "league": {"id": 103}, "stat": stat}
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    write_group(str(tmp_path), 2024, "hitting", [
+        hitter(1, "Slugger", 600, 520, 150, 30, 45, 70, 150),
+        hitter(2, "Slap Hitter", 620, 580, 190, 25, 2, 35, 60),
+        hitter(3, "Bench Bat", 50, 45, 20, 5, 6, 5, 10, games=30),
+    ])
+    write_group(str(tmp_path), 2024, "pitching", [
+        pitcher(10, "Strikeout Artist", "180.0", 20, 50, 240, 60),
+        pitcher(11, "Contact Guy", "190.1", 25, 40, 120, 70),
+        pitcher(12, "Opener", "5.0", 0, 0, 10, 0),
+    ])
+    return Snapshot.load(str(tmp_path), 2024)
+
+
+def test_parse_metric_forms():
+    """
+    Tests raw fields, derived metrics (with aliases), named formulas and bare formulas.
+    """
+    assert parse_metric("homeRuns") == ("homeRuns", None)
+    assert parse_metric("k/9") == ("K9", None)
+    assert parse_metric("ops+") == ("OPS+", None)
+    assert parse_metric("PWR = homeRuns / atBats") == ("PWR", "homeRuns / atBats")
+    assert parse_metric("hits / atBats") == ("hits / atBats", "hits / atBats")
+
+
+def test_derived_stats_are_vectorized(snapshot):
+    """
+    Tests ISO and K/9 for every player at once.
+    """
+    hitting = Leaderboard(snapshot, "hitting")
+    iso = hitting.values("ISO")
+    assert iso[0] == pytest.approx(0.606 - 0.288, abs=1e-9)
+
+    pitching = Leaderboard(snapshot, "pitching")
+    k9 = pitching.values("K9")
+    assert k9[0] == pytest.approx(12.0)
+
+
+def test_fip_constant_makes_league_fip_equal_league_era(snapshot):
+    """
+    Tests that FIP is scaled so the league's FIP matches its ERA.
+    """
+    board = Leaderboard(snapshot, "pitching")
+    innings = board.values("inningsPitched")
+    fip = board.values("FIP")
+
+    league_fip = (fip * innings).sum() / innings.sum()
+    assert league_fip == pytest.approx(board.constants["lg_era"])
+
+
+def test_rank_qualifies_rate_stats(snapshot):
+    """
+    Tests that the bench bat's huge OPS+ doesn't qualify (too few PA), but counts when --min-pa 0.
+    """
+    board = Leaderboard(snapshot, "hitting")
+
+    qualified = board.rank(("OPS+", None), [("homeRuns", None), ("OPS+", None)], limit=5)
+    assert [row["player_id"] for row in qualified] == [1, 2]
+    assert qualified[0]["homeRuns"] == "45"
+
+    everyone = board.rank(("OPS+", None), [("OPS+", None)], limit=5, min_pa=0)
+    assert everyone[0]["player_id"] == 3
+
+
+def test_rank_counting_stats_need_no_minimum(snapshot):
+    """
+    Tests that counting stats rank everyone, and top-k returns only k rows.
+    """
+    board = Leaderboard(snapshot, "hitting")
+
+    rows = board.rank(("homeRuns", None), [("homeRuns", None)], limit=2)
+
+    assert [row["player_id"] for row in rows] == [1, 3]
+
+
+def test_rank_lower_is_better_and_order_override(snapshot):
+    """
+    Tests that FIP ranks lowest first by default and highest first with ascending=False.
+    """
+    board = Leaderboard(snapshot, "pitching")
+
+    best = board.rank(("FIP", None), [("FIP", None)], limit=3)
+    assert [row["player_id"] for row in best] == [10, 11]
+
+    worst = board.rank(("FIP", None), [("FIP", None)], limit=3, ascending=False)
+    assert [row["player_id"] for row in worst] == [11, 10]
+
+
+def test_custom_expression(snapshot):
+    """
+    Tests ranking by a formula, using functions and other derived metrics.
+    """
+    board = Leaderboard(snapshot, "hitting")
+
+    rows = board.rank(("PWR", "max(ISO, 0) * 1000"), [("PWR", "max(ISO, 0) * 1000")], limit=1)
+
+    assert rows[0]["player_id"] == 1
+
+
+@pytest.mark.parametrize("expression", ["__import__('os')", "homeRuns.real", "unknownStat * 2", "1 +"])
+def test_bad_expressions_are_rejected(snapshot, expression):
+    """
+    Tests that only simple arithmetic over known stats is allowed.
+    """
+    board = Leaderboard(snapshot, "hitting")
+
+    with pytest.raises(ExpressionError):
+        board.values("bad", expression)
+
+
+def test_division_by_zero_is_missing_not_infinite(snapshot):
+    """
+    Tests that a 0/0 or x/0 result is treated as missing data.
+    """
+    board = Leaderboard(snapshot, "pitching")
+
+    kbb = board.values("KBB")
+
+    assert math.isnan(kbb[2])
@@ -0,0 +1,182 @@
+import copy
+import pytest
+from unittest.mock import patch
+
+from src.live import (
+    MAX_LIVE_INTERVAL, PREVIEW_INTERVAL, GameTracker, PatchError, apply_patch, describe, follow, schedule_games
+)
+
+
+def make_feed(state="Live", detailed="In Progress", away_runs=0, home_runs=0, timecode="20240601_200000", wait=10):
+    """Builds a (very small) live feed."""
+    return {
+        "metaData": {"timeStamp": timecode, "wait": wait},
+        "gameData": {
+            "status": {"abstractGameState": state, "detailedState": detailed},
+            "teams": {"away": {"abbreviation": "NYY"}, "home": {"abbreviation": "BOS"}},
+        },
+        "liveData": {
+            "linescore": {
+                "currentInningOrdinal": "5th", "inningState": "Top", "outs": 1,
+                "teams": {"away": {"runs": away_runs}, "home": {"runs": home_runs}},
+            },
+            "plays": {"allPlays": [], "currentPlay": {"result": {"description": "Single to left."}}},
+        },
+    }
+
+
+class FakeClock:
+    """A clock that only moves when sleep() is called."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_apply_patch_operations():
+    """
+    Tests add, remove, replace, move, copy and test, including list appends and escaped keys.
+    """
+    document = {"a": {"b": 1}, "list": [1, 2], "x/y": 0}
+
+    result = apply_patch(document, [
+        {"op": "replace", "path": "/a/b", "value": 2},
+        {"op": "add", "path": "/list/-", "value": 3},
+        {"op": "add", "path": "/list/0", "value": 0},
+        {"op": "remove", "path": "/x~1y"},
+        {"op": "copy", "from": "/a", "path": "/c"},
+        {"op": "move", "from": "/a/b", "path": "/moved"},
+        {"op": "test", "path": "/moved", "value": 2},
+    ])
+
+    assert result is document
+    assert document == {"a": {}, "list": [0, 1, 2, 3], "c": {"b": 2}, "moved": 2}
+
+
+@pytest.mark.parametrize("operation", [
+    {"op": "remove", "path": "/missing"},
+    {"op": "replace", "path": "/a/missing/deeper", "value": 1},
+    {"op": "test", "path": "/a", "value": "something else"},
+    {"op": "frobnicate", "path": "/a"},
+])
+def test_apply_patch_rejects_what_does_not_fit(operation):
+    """
+    Tests that a patch for a different version of the document raises PatchError.
+    """
+    with pytest.raises(PatchError):
+        apply_patch({"a": 1}, [operation])
+
+
+@patch('src.live.api.get_live_feed')
+@patch('src.live.api.get_live_diff')
+def test_tracker_fetches_once_then_applies_patches(mock_diff, mock_feed):
+    """
+    Tests that only the first poll downloads the full feed; later polls apply patches.
+    """
+    mock_feed.return_value = make_feed()
+    mock_diff.side_effect = [
+        [{"diff": [
+            {"op": "replace", "path": "/metaData/timeStamp", "value": "20240601_200100"},
+            {"op": "replace", "path": "/liveData/linescore/teams/away/runs", "value": 2},
+        ]}],
+        [],
+    ]
+    tracker = GameTracker(123, clock=lambda: 0.0)
+
+    assert tracker.poll() is True
+    assert tracker.poll() is True
+    assert tracker.poll() is False
+
+    mock_feed.assert_called_once_with(123)
+    assert [call.args for call in mock_diff.call_args_list] == [(123, "20240601_200000"), (123, "20240601_200100")]
+    assert tracker.summary().away_runs == 2
+    assert (tracker.full_fetches, tracker.patch_updates) == (1, 1)
+
+
+@patch('src.live.api.get_live_feed')
+@patch('src.live.api.get_live_diff')
+def test_tracker_recovers_with_a_full_fetch(mock_diff, mock_feed):
+    """
+    Tests that a patch that doesn't apply, or a full feed sent instead of patches, replaces our copy.
+    """
+    mock_feed.side_effect = [make_feed(), make_feed(home_runs=4)]
+    mock_diff.side_effect = [
+        [{"diff": [{"op": "remove", "path": "/liveData/nothingHere"}]}],
+        make_feed(home_runs=5, timecode="20240601_210000"),
+    ]
+    tracker = GameTracker(123, clock=lambda: 0.0)
+
+    tracker.poll()
+    tracker.poll()
+    assert tracker.summary().home_runs == 4
+    tracker.poll()
+    assert tracker.summary().home_runs == 5
+    assert tracker.full_fetches == 3
+
+
+@patch('src.live.api.get_live_feed')
+@patch('src.live.api.get_live_diff')
+def test_polling_interval_adapts(mock_diff, mock_feed):
+    """
+    Tests the feed's wait while things change, back-off while quiet, and slow polls before the game.
+    """
+    mock_feed.return_value = make_feed(wait=8)
+    mock_diff.return_value = []
+    tracker = GameTracker(123, clock=lambda: 100.0)
+
+    tracker.poll()
+    assert tracker.interval == 8
+    assert tracker.due_at == 108.0
+
+    intervals = [tracker.poll() or tracker.interval for _ in range(10)]
+    assert intervals[0] == 12
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == MAX_LIVE_INTERVAL
+
+    preview = GameTracker(456, clock=lambda: 0.0)
+    mock_feed.return_value = make_feed(state="Preview", detailed="Scheduled")
+    preview.poll()
+    assert preview.interval == PREVIEW_INTERVAL
+
+
+@patch('src.live.api.get_live_feed')
+@patch('src.live.api.get_live_diff')
+def test_follow_stops_when_every_game_is_final(mock_diff, mock_feed):
+    """
+    Tests that follow() polls games as they come due and stops once they're all final.
+    """
+    final = make_feed(state="Final", detailed="Final", away_runs=3, home_runs=1, timecode="20240601_230000")
+    patch_to_final = [{"diff": [
+        {"op": "replace", "path": "/gameData", "value": copy.deepcopy(final["gameData"])},
+        {"op": "replace", "path": "/metaData/timeStamp", "value": "20240601_230000"},
+    ]}]
+    mock_feed.return_value = make_feed()
+    mock_diff.side_effect = [[], patch_to_final]
+    clock = FakeClock()
+    updates = []
+
+    tracker = GameTracker(123, clock=clock)
+    follow(
+        [tracker], lambda t: updates.append(describe(t.summary())),
+        lambda due: [(t, t.poll()) for t in due], sleep=clock.sleep, clock=clock,
+    )
+
+    assert tracker.finished
+    assert updates == ["[NYY 0 @ BOS 0] Top 5th, 1 out - Single to left.", "[NYY 0 @ BOS 0] Final - Single to left."]
+    # 10s after the first poll, then 15s (backed off after a quiet poll)
+    assert clock.now == 25
+
+
+def test_schedule_games():
+    """
+    Tests that games are listed across every date in a schedule.
+    """
+    schedule = {"dates": [{"games": [{"gamePk": 1}, {"gamePk": 2}]}, {"games": [{"gamePk": 3}]}]}
+
+    assert [game["gamePk"] for game in schedule_games(schedule)] == [1, 2, 3]
+    assert schedule_games(None) == []
@@ -1,3 +1,5 @@
+import datetime
+import json
 import pytest
 from unittest.mock import patch, MagicMock, call
 from src.main import main # We import the main function itself
@@ -82,8 +84,8 @@ def test_leaders_command_success(mock_print, mock_get_leaders):
     # 1. Arrange:
     test_args = ['main.py', 'leaders', 'HR']
     
-    # We need to know the current year, which is 2025
-    current_year = 2025 
+    # Without --season the current year is used
+    current_year = datetime.datetime.now().year
     
     fake_leaders = {
         "leagueLeaders": [
@@ -100,7 +102,7 @@ def test_leaders_command_success(mock_print, mock_get_leaders):
         
     # 3. Assert:
     # Check that the function was called with the *translated* API term
-    mock_get_leaders.assert_called_once_with("homeRuns", current_year, group="hitting")
+    mock_get_leaders.assert_called_once_with(["homeRuns"], current_year, group="hitting", limit=10, league_id=None)
     
     all_output = get_all_print_output(mock_print)
     assert "Test Hitter" in all_output
@@ -167,4 +169,672 @@ def test_stats_command_success(mock_print, mock_search_player, mock_get_stats):
     all_output = get_all_print_output(mock_print)
     assert "--- Stats for Test Player (2024) ---" in all_output
     assert "AVG: .300 | HR: 50 | RBI: 120" in all_output
-    assert "Games: 162 | Hits: 200 | SB: 30" in all_output
\ No newline at end of file
+    assert "Games: 162 | Hits: 200 | SB: 30" in all_output
+
+
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_roster_command_multiple_teams(mock_print, mock_get_roster):
+    """
+    Tests that a comma-separated list fetches every team and prints each roster.
+    """
+    # Return a roster whose only player is named after the team ID
+    mock_get_roster.side_effect = lambda team_id: {
+        "roster": [{"person": {"fullName": f"Player {team_id}"}, "jerseyNumber": "1", "position": {"name": "Pitcher"}}]
+    }
+
+    with patch('sys.argv', ['main.py', 'roster', 'CIN,nyy', '--workers', '2']):
+        main()
+
+    assert sorted(c.args[0] for c in mock_get_roster.call_args_list) == [113, 147]
+    all_output = get_all_print_output(mock_print)
+    assert "--- 40-Man Roster: CIN (ID: 113) ---" in all_output
+    assert "--- 40-Man Roster: NYY (ID: 147) ---" in all_output
+    assert "Player 147" in all_output
+
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_roster_command_all_teams(mock_print, mock_get_roster):
+    """
+    Tests that 'roster --all' asks for every team in TEAM_MAP exactly once.
+    """
+    mock_get_roster.return_value = {"roster": []}
+
+    with patch('sys.argv', ['main.py', 'roster', '--all']):
+        main()
+
+    assert mock_get_roster.call_count == 30
+
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_roster_command_list_with_invalid_team(mock_print, mock_get_roster):
+    """
+    Tests that one bad code in a list stops the command before any API call.
+    """
+    with patch('sys.argv', ['main.py', 'roster', 'CIN,XXX']):
+        main()
+
+    mock_get_roster.assert_not_called()
+    assert any("XXX not found" in str(c) for c in mock_print.call_args_list)
+
+@patch('src.main.get_people_stats')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_multiple_players(mock_print, mock_search_player, mock_get_people_stats):
+    """
+    Tests that several names are searched once each and their stats fetched in one batch.
+    """
+    test_args = ['main.py', 'stats', 'Player One', 'player one', 'Player Two', 'Nobody', '--season', '2024']
+
+    ids = {"Player One": 1, "Player Two": 2, "Nobody": None}
+    mock_search_player.side_effect = lambda name: ids[name]
+    hitting = {"group": {"displayName": "hitting"}, "splits": [{"stat": {"avg": ".250", "homeRuns": 10, "rbi": 40}}]}
+    mock_get_people_stats.return_value = {"people": [{"id": 1, "stats": [hitting]}, {"id": 2, "stats": []}]}
+
+    with patch('sys.argv', test_args):
+        main()
+
+    # 'player one' is a duplicate of 'Player One', so only 3 searches happen
+    assert mock_search_player.call_count == 3
+    mock_get_people_stats.assert_called_once_with({1, 2}, 2024)
+
+    all_output = get_all_print_output(mock_print)
+    assert "--- Stats for Player One (2024) ---" in all_output
+    assert "AVG: .250 | HR: 10 | RBI: 40" in all_output
+    assert "No hitting or pitching stats found for Player Two in 2024." in all_output
+    assert "Could not find an active player named 'Nobody'" in all_output
+
+@patch('src.main.get_people_stats')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_reads_names_from_file(mock_print, mock_search_player, mock_get_people_stats, tmp_path):
+    """
+    Tests that --file adds the names listed in a file (one per line).
+    """
+    names_file = tmp_path / "players.txt"
+    names_file.write_text("Player One\n\nPlayer Two\n")
+    mock_search_player.side_effect = lambda name: {"Player One": 1, "Player Two": 2}[name]
+    mock_get_people_stats.return_value = {"people": []}
+
+    with patch('sys.argv', ['main.py', 'stats', '--file', str(names_file), '--season', '2024']):
+        main()
+
+    mock_get_people_stats.assert_called_once_with({1, 2}, 2024)
+
+@patch('src.main.get_players')
+@patch('builtins.print')
+def test_index_build_command(mock_print, mock_get_players, tmp_path):
+    """
+    Tests that 'index build' downloads the season's players and saves the index.
+    """
+    mock_get_players.return_value = {"people": [{"id": 1, "fullName": "Test Player", "active": True}]}
+
+    with patch('sys.argv', ['main.py', 'index', 'build', '--season', '2024', '--cache-dir', str(tmp_path)]):
+        main()
+
+    mock_get_players.assert_called_once_with(2024)
+    assert (tmp_path / "player_index.json.gz").exists()
+
+@patch('src.main.get_players')
+@patch('src.main.stream_players')
+@patch('builtins.print')
+def test_index_build_streams_players(mock_print, mock_stream_players, mock_get_players, tmp_path):
+    """
+    Tests that 'index build --stream' builds the index from the streamed players.
+    """
+    from src.player_index import PlayerIndex, index_path
+    mock_stream_players.return_value = iter([{"id": 1, "fullName": "Test Player", "active": True}])
+
+    with patch('sys.argv', ['main.py', 'index', 'build', '--season', '2024', '--stream', '--cache-dir', str(tmp_path)]):
+        main()
+
+    mock_get_players.assert_not_called()
+    assert len(PlayerIndex.load(index_path(str(tmp_path)))) == 1
+
+@patch('src.main.stream_players')
+@patch('builtins.print')
+def test_index_build_stream_cut_off_saves_nothing(mock_print, mock_stream_players, tmp_path):
+    """
+    Tests that a streamed player list that breaks off partway doesn't leave a partial index behind.
+    """
+    from src.api import StreamError
+
+    def players():
+        yield {"id": 1, "fullName": "Test Player", "active": True}
+        raise StreamError("Connection broken")
+
+    mock_stream_players.return_value = players()
+
+    with patch('sys.argv', ['main.py', 'index', 'build', '--season', '2024', '--stream', '--cache-dir', str(tmp_path)]):
+        main()
+
+    assert not (tmp_path / "player_index.json.gz").exists()
+    assert "the index was not saved" in get_all_print_output(mock_print)
+
+@patch('src.main.get_player_stats')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_uses_player_index(mock_print, mock_search_player, mock_get_stats, tmp_path):
+    """
+    Tests that a built index resolves the name without calling the search API.
+    """
+    from src.player_index import PlayerIndex, index_path
+    PlayerIndex([[99999, "Test Player", True]]).save(index_path(str(tmp_path)))
+    mock_get_stats.return_value = {"stats": []}
+
+    with patch('sys.argv', ['main.py', 'stats', 'test player', '--season', '2024', '--cache-dir', str(tmp_path)]):
+        main()
+
+    mock_search_player.assert_not_called()
+    mock_get_stats.assert_called_once_with(99999, 2024)
+
+@patch('src.main.get_people_stats')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_multiple_players_reports_ambiguous_names(mock_print, mock_search_player, mock_get_people_stats, tmp_path):
+    """
+    Tests that with several names, a name the index can't pin down lists the other candidates.
+    """
+    from src.player_index import PlayerIndex, index_path
+    PlayerIndex([[1, "Will Smith", True], [2, "Will Smith", True], [3, "Test Player", True]]).save(index_path(str(tmp_path)))
+    mock_get_people_stats.return_value = {"people": []}
+
+    with patch('sys.argv', ['main.py', 'stats', 'Will Smith', 'Test Player', '--season', '2024', '--cache-dir', str(tmp_path)]):
+        main()
+
+    mock_search_player.assert_not_called()
+    assert "Note: 'Will Smith' also matches: Will Smith (2)" in get_all_print_output(mock_print)
+
+@patch('src.main.get_player_stat_history')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_seasons_range(mock_print, mock_search_player, mock_get_history):
+    """
+    Tests that --seasons uses the one-request yearByYear history and only shows the asked seasons.
+    """
+    mock_search_player.return_value = 99999
+    mock_get_history.return_value = {
+        "stats": [
+            {"type": {"displayName": "yearByYear"}, "group": {"displayName": "hitting"}, "splits": [
+                {"season": "2022", "team": {"name": "Test Team"}, "stat": {"homeRuns": 5, "atBats": 100, "hits": 20}},
+                {"season": "2023", "team": {"name": "Test Team"}, "stat": {"homeRuns": 30, "atBats": 500, "hits": 150}},
+                {"season": "2024", "team": {"name": "Test Team"}, "stat": {"homeRuns": 40, "atBats": 500, "hits": 160}},
+            ]}
+        ]
+    }
+
+    with patch('sys.argv', ['main.py', 'stats', 'Test Player', '--seasons', '2023-2024']):
+        main()
+
+    mock_get_history.assert_called_once_with(99999)
+    all_output = get_all_print_output(mock_print)
+    assert "--- hitting for Test Player (2023-2024) ---" in all_output
+    assert "2022" not in all_output
+    # The totals line adds up the two seasons: 70 HR, 310 H in 1000 AB
+    total_line = [line for line in all_output.splitlines() if line.strip().startswith("Total")][0]
+    assert "70" in total_line and ".310" in total_line
+
+@patch('src.main.get_player_stat_history')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_seasons_traded_player(mock_print, mock_search_player, mock_get_history):
+    """
+    Tests that a season split across two teams shows once (the season total), not three times.
+    """
+    mock_search_player.return_value = 99999
+    mock_get_history.return_value = {
+        "stats": [
+            {"type": {"displayName": "yearByYear"}, "group": {"displayName": "hitting"}, "splits": [
+                {"season": "2023", "team": {"name": "Test Team"}, "stat": {"homeRuns": 30, "atBats": 500, "hits": 150}},
+                {"season": "2024", "team": {"name": "Test Team"}, "stat": {"homeRuns": 10, "atBats": 200, "hits": 60}},
+                {"season": "2024", "team": {"name": "Other Team"}, "stat": {"homeRuns": 15, "atBats": 300, "hits": 100}},
+                {"season": "2024", "stat": {"homeRuns": 25, "atBats": 500, "hits": 160}},
+            ]}
+        ]
+    }
+
+    with patch('sys.argv', ['main.py', 'stats', 'Test Player', '--seasons', '2023-2024']):
+        main()
+
+    lines = get_all_print_output(mock_print).splitlines()
+    assert len([line for line in lines if line.strip().startswith("2024")]) == 1
+    # 55 HR and 310 H in 1000 AB, not the 2024 numbers counted twice
+    total_line = [line for line in lines if line.strip().startswith("Total")][0]
+    assert "55" in total_line and ".310" in total_line
+
+@patch('src.main.get_player_stats')
+@patch('src.main.get_player_stat_history')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_seasons_falls_back_per_season(mock_print, mock_search_player, mock_get_history, mock_get_stats):
+    """
+    Tests that a failed history request falls back to one request per season.
+    """
+    mock_search_player.return_value = 99999
+    mock_get_history.return_value = None
+    mock_get_stats.return_value = {"stats": [{"group": {"displayName": "hitting"}, "splits": [{"stat": {"homeRuns": 1}}]}]}
+
+    with patch('sys.argv', ['main.py', 'stats', 'Test Player', '--seasons', '2021-2023']):
+        main()
+
+    assert sorted(c.args[1] for c in mock_get_stats.call_args_list) == [2021, 2022, 2023]
+
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_roster_command_exports_csv(mock_print, mock_get_roster, tmp_path):
+    """
+    Tests that --format csv --output writes one row per player with the team code.
+    """
+    mock_get_roster.return_value = {
+        "roster": [{"person": {"id": 1, "fullName": "Elly De La Cruz"}, "jerseyNumber": "44", "position": {"name": "Shortstop"}}]
+    }
+    output = tmp_path / "roster.csv"
+
+    with patch('sys.argv', ['main.py', 'roster', 'CIN', '--format', 'csv', '--output', str(output)]):
+        main()
+
+    lines = output.read_text().splitlines()
+    assert lines[0] == "team,team_id,player_id,name,jersey_number,position,status"
+    assert lines[1] == "CIN,113,1,Elly De La Cruz,44,Shortstop,"
+    # The roster itself isn't printed as text when exporting
+    assert "--- 40-Man Roster ---" not in get_all_print_output(mock_print)
+
+@patch('src.main.get_player_stats')
+@patch('src.main.search_for_player')
+@patch('builtins.print')
+def test_stats_command_exports_ndjson(mock_print, mock_search_player, mock_get_stats, tmp_path):
+    """
+    Tests that the stats command exports one NDJSON row per stat group.
+    """
+    mock_search_player.return_value = 99999
+    mock_get_stats.return_value = {
+        "stats": [{"group": {"displayName": "hitting"}, "splits": [{"season": "2024", "stat": {"homeRuns": 50}}]}]
+    }
+    output = tmp_path / "stats.ndjson"
+
+    with patch('sys.argv', ['main.py', 'stats', 'Test Player', '--season', '2024', '--format', 'ndjson', '--output', str(output)]):
+        main()
+
+    [row] = [json.loads(line) for line in output.read_text().splitlines()]
+    assert row["player"] == "Test Player"
+    assert row["player_id"] == 99999
+    assert row["group"] == "hitting"
+    assert row["homeRuns"] == 50
+
+@patch('src.main.get_league_leaders')
+@patch('builtins.print')
+def test_leaders_command_groups_categories_into_one_request_per_group(mock_print, mock_get_leaders):
+    """
+    Tests that 'leaders HR,AVG,ERA' makes one hitting and one pitching request,
+    passing --season, --limit and --league through, and prints in the order asked.
+    """
+    def fake_leaders(categories, season, group, limit, league_id):
+        return {"leagueLeaders": [
+            {"leaderCategory": name, "leaders": [
+                {"rank": 1, "person": {"fullName": f"{name} Leader"}, "team": {"name": "Team"}, "value": "1"}
+            ]}
+            for name in categories
+        ]}
+
+    mock_get_leaders.side_effect = fake_leaders
+
+    with patch('sys.argv', ['main.py', 'leaders', 'hr,ERA,AVG', '--season', '2024', '--limit', '50', '--league', 'al']):
+        main()
+
+    assert mock_get_leaders.call_count == 2
+    mock_get_leaders.assert_any_call(["homeRuns", "battingAverage"], 2024, group="hitting", limit=50, league_id=103)
+    mock_get_leaders.assert_any_call(["earnedRunAverage"], 2024, group="pitching", limit=50, league_id=103)
+
+    all_output = get_all_print_output(mock_print)
+    assert "--- Top 50 pitching leaders for ERA (2024, AL) ---" in all_output
+    assert all_output.index("homeRuns Leader") < all_output.index("earnedRunAverage Leader") < all_output.index("battingAverage Leader")
+
+@patch('src.main.get_league_leaders')
+@patch('builtins.print')
+def test_leaders_command_unknown_category(mock_print, mock_get_leaders):
+    """
+    Tests that an unknown code is reported without calling the API.
+    """
+    with patch('sys.argv', ['main.py', 'leaders', 'HR,XYZ']):
+        main()
+
+    mock_get_leaders.assert_not_called()
+    assert "Error: Unknown stat category 'XYZ'" in get_all_print_output(mock_print)
+
+@patch('src.main.get_league_leaders')
+@patch('src.main.search_for_player')
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_snapshot_then_offline_commands(mock_print, mock_get_roster, mock_search, mock_get_leaders, tmp_path):
+    """
+    Tests that 'snapshot 2024' stores the season and that leaders, stats and roster
+    can then answer with --offline without calling the API.
+    """
+    pytest.importorskip("numpy")
+
+    def fake_page(group, season, offset=0, limit=1000):
+        if group == "hitting":
+            stat = {"gamesPlayed": 150, "plateAppearances": 600, "homeRuns": 44, "avg": ".300"}
+            splits = [{"player": {"id": 1, "fullName": "Offline Slugger"}, "team": {"id": 113, "name": "Cincinnati Reds"},
+                       "league": {"id": 104}, "position": {"name": "Outfielder"}, "stat": stat}]
+        else:
+            splits = []
+        return {"stats": [{"totalSplits": len(splits), "splits": splits}]}
+
+    with patch('src.api.get_season_stats_page', side_effect=fake_page):
+        with patch('sys.argv', ['main.py', 'snapshot', '2024', '--cache-dir', str(tmp_path)]):
+            main()
+
+    # Without --season the newest snapshot answers, whatever the calendar year
+    for args in (['leaders', 'HR', '--season', '2024'], ['stats', 'Offline Slugger', '--season', '2024'], ['roster', 'CIN'],
+                 ['leaders', 'HR'], ['stats', 'Offline Slugger']):
+        with patch('sys.argv', ['main.py', *args, '--offline', '--cache-dir', str(tmp_path)]):
+            main()
+
+    mock_get_leaders.assert_not_called()
+    mock_search.assert_not_called()
+    mock_get_roster.assert_not_called()
+
+    all_output = get_all_print_output(mock_print)
+    assert "Saved 1 hitting lines." in all_output
+    assert "Offline Slugger           (Cincinnati Reds) - 44" in all_output
+    assert "AVG: .300 | HR: 44 | RBI: N/A" in all_output
+    assert "--- 2024 Players: CIN (ID: 113, offline) ---" in all_output
+    assert "No offline snapshot" not in all_output
+
+@patch('builtins.print')
+def test_offline_without_a_snapshot(mock_print, tmp_path):
+    """
+    Tests that --offline explains how to build the missing snapshot.
+    """
+    with patch('sys.argv', ['main.py', 'leaders', 'HR', '--season', '2023', '--offline', '--cache-dir', str(tmp_path)]):
+        main()
+
+    assert "Run 'snapshot 2023' first." in get_all_print_output(mock_print)
+
+@patch('builtins.print')
+def test_leaderboard_command_exports_formulas(mock_print, tmp_path):
+    """
+    Tests that 'leaderboard' ranks snapshot players by a derived stat and exports custom formulas.
+    """
+    pytest.importorskip("numpy")
+    from src.snapshot import write_group
+
+    def pitcher(player_id, name, innings, strikeouts):
+        stat = {"inningsPitched": innings, "strikeOuts": strikeouts, "baseOnBalls": 10, "homeRuns": 5,
+                "hitByPitch": 1, "earnedRuns": 20}
+        return {"player": {"id": player_id, "fullName": name}, "team": {"id": 113, "name": "Reds"}, "stat": stat}
+
+    write_group(str(tmp_path), 2024, "pitching", [pitcher(1, "Power Arm", "100.0", 150), pitcher(2, "Soft Toss", "100.0", 50)])
+    output = tmp_path / "board.csv"
+
+    test_args = ['main.py', 'leaderboard', '--sort', 'K/9', '--metric', 'K2=strikeOuts * 2', '--min-ip', '0',
+                 '--cache-dir', str(tmp_path), '--format', 'csv', '--output', str(output)]
+    with patch('sys.argv', test_args):
+        main()
+
+    lines = output.read_text().splitlines()
+    assert lines[0] == "rank,player_id,name,team,K2,K9"
+    assert lines[1] == "1,1,Power Arm,Reds,300,13.50"
+    assert lines[2] == "2,2,Soft Toss,Reds,100,4.50"
+
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_roster_diff_reports_only_changes(mock_print, mock_get_roster, tmp_path):
+    """
+    Tests that 'roster --diff' saves a baseline first, then prints only the changes,
+    and always asks the API to revalidate (ttl=0).
+    """
+    def roster(*names):
+        return {"roster": [
+            {"person": {"id": index, "fullName": name}, "status": {"description": "Active"}, "position": {"name": "Pitcher"}}
+            for index, name in enumerate(names)
+        ]}
+
+    test_args = ['main.py', 'roster', 'CIN', '--diff', '--cache-dir', str(tmp_path)]
+
+    mock_get_roster.return_value = roster("Old Guy", "Staying Put")
+    with patch('sys.argv', test_args):
+        main()
+    mock_get_roster.assert_called_with(113, ttl=0)
+    assert "[CIN] Baseline saved (2 players)." in get_all_print_output(mock_print)
+
+    mock_print.reset_mock()
+    with patch('sys.argv', test_args):
+        main()
+    assert "No roster changes." in get_all_print_output(mock_print)
+
+    mock_print.reset_mock()
+    mock_get_roster.return_value = {"roster": roster("Old Guy", "Staying Put", "New Guy")["roster"][1:]}
+    with patch('sys.argv', test_args):
+        main()
+    all_output = get_all_print_output(mock_print)
+    assert "[CIN] - Removed: Old Guy" in all_output
+    assert "[CIN] + Added: New Guy (Active)" in all_output
+    assert "Staying Put" not in all_output
+
+@patch('src.main.get_roster')
+@patch('builtins.print')
+def test_watch_exports_events_as_ndjson(mock_print, mock_get_roster, tmp_path):
+    """
+    Tests that 'watch --count 2' checks twice and exports the change between checks.
+    """
+    first = {"roster": [{"person": {"id": 1, "fullName": "Reliever"}, "status": {"description": "Active"}}]}
+    second = {"roster": [{"person": {"id": 1, "fullName": "Reliever"}, "status": {"description": "Injured 15-Day"}}]}
+    mock_get_roster.side_effect = [first, second]
+    output = tmp_path / "events.ndjson"
+
+    test_args = ['main.py', 'watch', 'CIN', '--count', '2', '--interval', '0', '--cache-dir', str(tmp_path),
+                 '--format', 'ndjson', '--output', str(output)]
+    with patch('sys.argv', test_args):
+        main()
+
+    [event] = [json.loads(line) for line in output.read_text().splitlines()]
+    assert event == {"team": "CIN", "team_id": 113, "kind": "status", "player_id": 1, "name": "Reliever",
+                     "before": "Active", "after": "Injured 15-Day"}
+
+
+@patch('src.live.api.get_live_diff')
+@patch('src.live.api.get_live_feed')
+@patch('src.main.get_schedule')
+@patch('builtins.print')
+def test_live_follows_only_the_team_s_game(mock_print, mock_schedule, mock_feed, mock_diff):
+    """
+    Tests that 'live CIN' picks the Reds' game off the schedule and prints its state.
+    """
+    mock_schedule.return_value = {"dates": [{"games": [
+        {"gamePk": 1, "teams": {"away": {"team": {"id": 147}}, "home": {"team": {"id": 111}}}},
+        {"gamePk": 2, "teams": {"away": {"team": {"id": 113}}, "home": {"team": {"id": 138}}}},
+    ]}]}
+    mock_feed.return_value = {
+        "metaData": {"timeStamp": "20240601_200000"},
+        "gameData": {"status": {"abstractGameState": "Final", "detailedState": "Final"},
+                     "teams": {"away": {"abbreviation": "CIN"}, "home": {"abbreviation": "STL"}}},
+        "liveData": {"linescore": {"teams": {"away": {"runs": 6}, "home": {"runs": 2}}}},
+    }
+
+    test_args = ['main.py', 'live', 'CIN', '--date', '2024-06-01', '--no-cache']
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_schedule.assert_called_once_with("2024-06-01")
+    mock_feed.assert_called_once_with(2)
+    mock_diff.assert_not_called()
+    output = get_all_print_output(mock_print)
+    assert "[CIN 6 @ STL 2] Final" in output
+    assert "1 full feed download(s), 0 patch update(s)" in output
+
+
+@patch('src.main.get_roster')
+def test_timings_and_metrics_out(mock_get_roster, capsys, tmp_path):
+    """
+    Tests that --timings prints a summary to stderr and --metrics-out saves the phases as JSON.
+    """
+    mock_get_roster.return_value = {"roster": []}
+    metrics_file = tmp_path / "metrics.json"
+
+    test_args = ['main.py', 'roster', 'CIN', '--no-cache', '--timings', '--metrics-out', str(metrics_file)]
+    with patch('sys.argv', test_args):
+        main()
+
+    captured = capsys.readouterr()
+    assert "--- Timings ---" in captured.err
+    assert "phase roster" in captured.err
+    assert "Timings" not in captured.out
+    phases = json.loads(metrics_file.read_text())["histograms"]["phase"]
+    assert {"setup", "roster", "output"} <= set(phases)
+
+
+TEAM_ROSTER_STATS = {"roster": [
+    {"person": {"id": 1, "fullName": "Slugger", "primaryPosition": {"abbreviation": "1B"}, "stats": [
+        {"group": {"displayName": "hitting"}, "splits": [{"season": "2024", "team": {"id": 113}, "stat": {
+            "gamesPlayed": 150, "atBats": 500, "hits": 150, "homeRuns": 40, "baseOnBalls": 60, "hitByPitch": 0,
+            "sacFlies": 0, "totalBases": 300, "plateAppearances": 560, "avg": ".300"}}]}]}},
+    {"person": {"id": 2, "fullName": "Ace", "primaryPosition": {"abbreviation": "P"}, "stats": [
+        {"group": {"displayName": "pitching"}, "splits": [{"season": "2024", "team": {"id": 113}, "stat": {
+            "inningsPitched": "180.0", "earnedRuns": 60, "hits": 150, "baseOnBalls": 48, "strikeOuts": 200,
+            "era": "3.00"}}]}]}},
+]}
+
+
+@patch('src.main.get_people_stats')
+@patch('src.main.get_team_roster_stats')
+@patch('builtins.print')
+def test_team_stats_command(mock_print, mock_team_stats, mock_people_stats):
+    """
+    Tests that 'team-stats CIN' prints each group with a team line, from a single request.
+    """
+    pytest.importorskip("numpy")
+    mock_team_stats.return_value = TEAM_ROSTER_STATS
+
+    test_args = ['main.py', 'team-stats', 'CIN', '--season', '2024', '--no-cache']
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_team_stats.assert_called_once_with(113, 2024, roster_type="fullSeason")
+    mock_people_stats.assert_not_called()
+    output = get_all_print_output(mock_print)
+    assert "--- CIN 2024 hitting (1 players) ---" in output
+    assert "Slugger" in output and "Ace" in output
+    assert "   .300" in output  # Team AVG
+    assert "   3.00" in output  # Team ERA
+
+
+@patch('src.main.get_people_stats')
+@patch('src.main.get_team_roster_stats')
+@patch('builtins.print')
+def test_team_stats_falls_back_to_bulk_people_stats(mock_print, mock_team_stats, mock_people_stats):
+    """
+    Tests that a roster without hydrated stats is completed with one bulk people request.
+    """
+    pytest.importorskip("numpy")
+    people = [entry["person"] for entry in TEAM_ROSTER_STATS["roster"]]
+    mock_team_stats.return_value = {"roster": [{"person": {"id": p["id"], "fullName": p["fullName"]}} for p in people]}
+    mock_people_stats.return_value = {"people": people}
+
+    test_args = ['main.py', 'team-stats', 'CIN', '--season', '2024', '--no-cache']
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_people_stats.assert_called_once_with([1, 2], 2024)
+    assert "Slugger" in get_all_print_output(mock_print)
+
+
+
+GAMES_SCHEDULE = {"dates": [{"date": "2024-06-01", "games": [
+    {
+        "gamePk": 1,
+        "status": {"abstractGameState": "Final", "detailedState": "Final"},
+        "teams": {"away": {"team": {"id": 147}, "score": 5}, "home": {"team": {"id": 111}, "score": 3}},
+        "decisions": {"winner": {"fullName": "Gerrit Cole"}, "loser": {"fullName": "Brayan Bello"}},
+    },
+    {
+        "gamePk": 2,
+        "status": {"abstractGameState": "Preview", "detailedState": "Scheduled"},
+        "teams": {"away": {"team": {"id": 113}}, "home": {"team": {"id": 138}}},
+    },
+]}]}
+
+
+@patch('src.main.get_boxscore')
+@patch('src.main.get_schedule_range')
+@patch('builtins.print')
+def test_games_command_fetches_boxscores_of_started_games(mock_print, mock_schedule_range, mock_boxscore):
+    """
+    Tests that 'games --from --to --boxscores' makes one schedule request and
+    fetches box scores only for games that have been played, marked as final.
+    """
+    mock_schedule_range.return_value = GAMES_SCHEDULE
+    mock_boxscore.return_value = {"teams": {"away": {"team": {"id": 147}, "players": {
+        "ID99": {"person": {"fullName": "Aaron Judge"}, "stats": {"batting": {"homeRuns": 1}}},
+    }}}}
+
+    test_args = ['main.py', 'games', '--from', '2024-06-01', '--to', '2024-06-02', '--boxscores', '--no-cache']
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_schedule_range.assert_called_once_with("2024-06-01", "2024-06-02", team_id=None)
+    mock_boxscore.assert_called_once_with(1, final=True)
+    output = get_all_print_output(mock_print)
+    assert "NYY   5 @ BOS   3  Final  (W: Gerrit Cole, L: Brayan Bello)" in output
+    assert "NYY HR: Aaron Judge" in output
+    assert "CIN     @ STL      Scheduled" in output
+
+
+@patch('src.main.get_schedule_range')
+def test_games_command_exports_one_team(mock_schedule_range, tmp_path):
+    """
+    Tests that a single team is filtered by the API and exported row by row.
+    """
+    mock_schedule_range.return_value = GAMES_SCHEDULE
+    output_file = tmp_path / "games.json"
+
+    test_args = ['main.py', 'games', 'NYY', '--from', '2024-06-01', '--no-cache', '--format', 'json',
+                 '--output', str(output_file)]
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_schedule_range.assert_called_once_with("2024-06-01", "2024-06-01", team_id=147)
+    rows = json.loads(output_file.read_text())
+    assert [(row["away"], row["home"], row["winner"]) for row in rows] == [("NYY", "BOS", "Gerrit Cole")]
+
+
+@patch('src.main.get_standings')
+@patch('builtins.print')
+def test_standings_command_for_one_league(mock_print, mock_standings):
+    """
+    Tests that 'standings --league AL' asks for the AL only and prints each division.
+    """
+    mock_standings.return_value = {"records": [{"division": {"id": 201}, "teamRecords": [
+        {"team": {"id": 147}, "divisionRank": "1", "wins": 94, "losses": 68, "winningPercentage": ".580",
+         "divisionGamesBack": "-", "streak": {"streakCode": "W3"}},
+    ]}]}
+
+    test_args = ['main.py', 'standings', '--season', '2024', '--league', 'AL', '--no-cache']
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_standings.assert_called_once_with(2024, league_ids=[103])
+    output = get_all_print_output(mock_print)
+    assert "--- 2024 AL East ---" in output
+    assert "NYY" in output and ".580" in output and "W3" in output
+
+
+@patch('src.main.get_roster')
+@patch('src.main.stream_roster')
+def test_roster_stream_exports_entries(mock_stream_roster, mock_get_roster, tmp_path):
+    """
+    Tests that 'roster --stream' hands streamed entries straight to the exporter.
+    """
+    mock_stream_roster.return_value = iter([
+        {"person": {"id": 1, "fullName": "Elly De La Cruz"}, "jerseyNumber": "44", "position": {"name": "Shortstop"}},
+    ])
+    output_file = tmp_path / "roster.csv"
+
+    test_args = ['main.py', 'roster', 'CIN', '--stream', '--no-cache', '--format', 'csv', '--output', str(output_file)]
+    with patch('sys.argv', test_args):
+        main()
+
+    mock_stream_roster.assert_called_once_with(113)
+    mock_get_roster.assert_not_called()
+    assert "Elly De La Cruz,44,Shortstop" in output_file.read_text()
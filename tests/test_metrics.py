@@ -0,0 +1,103 @@
+import json
+import pytest
+
+from src import metrics
+
+
+@pytest.fixture
+def collector():
+    """A Collector registered as a hook for the length of one test."""
+    collector = metrics.add_hook(metrics.Collector())
+    yield collector
+    metrics.remove_hook(collector)
+
+
+def test_endpoint_groups_ids():
+    """
+    Tests that IDs in a URL are replaced so calls for different teams or players group together.
+    """
+    assert metrics.endpoint("https://statsapi.mlb.com/api/v1/teams/113/roster") == "/api/v1/teams/{id}/roster"
+    assert metrics.endpoint("https://statsapi.mlb.com/api/v1.1/game/745123/feed/live") == "/api/v1.1/game/{id}/feed/live"
+
+
+def test_emit_without_hooks_does_nothing():
+    """
+    Tests that nothing is measured (or fails) when no hook is listening.
+    """
+    assert not metrics.enabled()
+    metrics.emit("request", "/x", 0.1)
+
+
+def test_collector_aggregates_events(collector):
+    """
+    Tests that requests, cache lookups, retries and phases end up in the right counters and histograms.
+    """
+    metrics.emit("request", "/api/v1/teams/{id}/roster", 0.2, 5000, status=200, attempt=0, ttfb=0.15)
+    metrics.emit("request", "/api/v1/teams/{id}/roster", 0.4, 0, status=503, attempt=0, ttfb=0.3)
+    metrics.emit("retry", "/api/v1/teams/{id}/roster", reason="503")
+    metrics.emit("cache", "hit", size=100)
+    metrics.emit("cache", "miss")
+    with metrics.timer("phase", "roster"):
+        pass
+
+    assert collector.counter("requests") == 2
+    assert collector.counter("requests", "503") == 1
+    assert collector.counter("bytes_received") == 5000
+    assert collector.counter("retries") == 1
+    assert collector.counter("cache", "hit") == 1
+
+    data = collector.as_dict()
+    request = data["histograms"]["request"]["/api/v1/teams/{id}/roster"]
+    assert request["count"] == 2
+    assert request["max"] == 0.4
+    assert request["buckets"]["0.25"] == 1
+    assert "roster" in data["histograms"]["phase"]
+    json.loads(collector.to_json())
+
+    summary = collector.summary()
+    assert "requests: 2 (200: 1, 503: 1)" in summary
+    assert "cache: 1/2 served from cache" in summary
+
+
+def test_openmetrics_histograms_are_cumulative(collector):
+    """
+    Tests the OpenMetrics text: cumulative buckets, a count, a sum and the closing # EOF.
+    """
+    metrics.emit("request", "/x", 0.003, status=200)
+    metrics.emit("request", "/x", 2.0, status=200)
+
+    text = collector.openmetrics()
+
+    assert '# TYPE mlb_cli_request_seconds histogram' in text
+    assert 'mlb_cli_request_seconds_bucket{name="/x",le="0.005"} 1' in text
+    assert 'mlb_cli_request_seconds_bucket{name="/x",le="+Inf"} 2' in text
+    assert 'mlb_cli_request_seconds_count{name="/x"} 2' in text
+    assert 'mlb_cli_requests_total{label="200"} 2' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_summary_reports_bytes_over_the_wire(collector):
+    """
+    Tests that compressed and plain responses add up to a wire total next to the decoded one.
+    """
+    metrics.emit("request", "/api/v1/stats", 0.1, 8000, status=200, wire=1000, encoding="gzip")
+    metrics.emit("request", "/api/v1/stats", 0.1, 2000, status=200, wire=2000, encoding="identity")
+
+    assert collector.counter("bytes_wire") == 3000
+    assert "over the wire: 2.9 KB, 30% of decoded (gzip 1, identity 1)" in collector.summary()
+
+
+def test_broken_hooks_are_ignored(collector):
+    """
+    Tests that a failing user hook neither breaks the caller nor stops other hooks.
+    """
+    def broken(event):
+        raise RuntimeError("oops")
+
+    metrics.add_hook(broken)
+    try:
+        metrics.emit("cache", "hit")
+    finally:
+        metrics.remove_hook(broken)
+
+    assert collector.counter("cache", "hit") == 1
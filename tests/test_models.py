@@ -0,0 +1,50 @@
+import pytest
+from src.models import LeaderEntry, RosterEntry, SeasonStatLine, loads, parse_stat_groups
+
+
+def test_loads_accepts_bytes_and_str():
+    assert loads(b'{"a": 1}') == loads('{"a": 1}') == {"a": 1}
+
+
+def test_roster_entry_from_json_with_missing_fields():
+    """
+    Tests that missing fields fall back to the same defaults the CLI prints.
+    """
+    entry = RosterEntry.from_json({"person": {"id": 1, "fullName": "Test Player"}, "position": {}})
+
+    assert entry.player.full_name == "Test Player"
+    assert entry.jersey_number == "N/A"
+    assert entry.position == "Unknown"
+
+
+def test_leader_entry_from_json():
+    entry = LeaderEntry.from_json(
+        {"rank": 1, "person": {"id": 5, "fullName": "Test Hitter"}, "team": {"name": "Test Team"}, "value": "99"}
+    )
+
+    assert (entry.rank, entry.player.id, entry.team, entry.value) == (1, 5, "Test Team", "99")
+
+
+def test_season_stat_line_keeps_only_known_fields():
+    """
+    Tests that unused stat fields are dropped and the kept ones are readable by name.
+    """
+    stat_groups = [
+        {"group": {"displayName": "hitting"}, "splits": [
+            {"season": "2024", "stat": {"homeRuns": 44, "avg": ".310", "someNewStat": 1}}
+        ]}
+    ]
+
+    [line] = parse_stat_groups(stat_groups)
+
+    assert line.get("homeRuns") == 44
+    assert line.get("rbi", "N/A") == "N/A"
+    assert "someNewStat" not in line.as_dict()
+
+
+def test_models_are_slotted_and_frozen():
+    line = SeasonStatLine.from_json("pitching", {"stat": {"era": "2.50"}})
+
+    assert not hasattr(line, "__dict__")
+    with pytest.raises(AttributeError):
+        line.group = "hitting"
@@ -0,0 +1,70 @@
+import pytest
+from src.player_index import PlayerIndex, normalize_name
+
+# [id, fullName, active] rows, like the ones saved in the index file
+PLAYERS = [
+    [660670, "Ronald Acuña Jr.", True],
+    [660271, "Shohei Ohtani", True],
+    [545361, "Mike Trout", True],
+    [669257, "Will Smith", True],
+    [519293, "Will Smith", False],
+]
+
+
+@pytest.fixture
+def index():
+    return PlayerIndex(PLAYERS, seasons=[2024])
+
+
+def test_normalize_name_strips_accents_and_punctuation():
+    assert normalize_name("  Ronald Acuña Jr. ") == "ronald acuna jr"
+
+
+def test_lookup_exact_and_accent_insensitive(index):
+    """
+    Tests exact names and names typed without accents or the "Jr." suffix.
+    """
+    assert index.lookup("shohei ohtani").player_id == 660271
+    assert index.lookup("Ronald Acuna").player_id == 660670
+
+
+def test_lookup_returns_ambiguous_candidates(index):
+    """
+    Tests that a shared name picks the active player but reports both.
+    """
+    match = index.lookup("Will Smith")
+
+    assert match.player_id == 669257
+    assert [player_id for player_id, _ in match.candidates] == [669257, 519293]
+
+
+def test_lookup_prefix_and_fuzzy(index):
+    """
+    Tests that a unique prefix and a small typo both find the player.
+    """
+    assert index.lookup("mike tro").player_id == 545361
+    assert index.lookup("Shohei Otani").player_id == 660271
+    assert index.lookup("Nobody At All").player_id is None
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    path = str(tmp_path / "index.json.gz")
+    index.save(path)
+
+    loaded = PlayerIndex.load(path)
+
+    assert len(loaded) == len(index)
+    assert loaded.seasons == [2024]
+    assert loaded.lookup("Mike Trout").player_id == 545361
+
+
+def test_from_api_deduplicates_players():
+    people_by_season = {
+        2023: {"people": [{"id": 1, "fullName": "Old Name", "active": True}]},
+        2024: {"people": [{"id": 1, "fullName": "New Name", "active": True}, {"id": 2, "fullName": "Other"}]},
+    }
+
+    index = PlayerIndex.from_api(people_by_season)
+
+    assert len(index) == 2
+    assert index.lookup("New Name").player_id == 1
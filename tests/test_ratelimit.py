@@ -0,0 +1,89 @@
+import pytest
+
+from src.ratelimit import RateLimiter, fcntl, lock_path
+
+
+class FakeClock:
+    """A clock that only moves when sleep() is called."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_burst_then_steady_rate():
+    """
+    Tests that 'burst' requests go straight out, then callers wait 1/rate seconds each.
+    """
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+    waits = [limiter.acquire() for _ in range(5)]
+
+    assert waits == [0, 0, 0, 0.5, 0.5]
+    assert limiter.stats() == {"requests": 5, "waited": 2, "total_wait": 1.0, "max_wait": 0.5}
+
+
+def test_bucket_refills_while_idle():
+    """
+    Tests that a quiet period earns the burst back (but never more than the burst).
+    """
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, burst=2, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 60
+
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+
+def test_reservations_queue_in_order():
+    """
+    Tests that callers who reserve at the same moment are spaced out instead of all retrying at once.
+    """
+    clock = FakeClock()
+    limiter = RateLimiter(rate=4, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert [limiter.reserve() for _ in range(4)] == [0, 0.25, 0.5, 0.75]
+
+
+@pytest.mark.skipif(fcntl is None, reason="needs fcntl to share the budget between processes")
+def test_lockfile_shares_the_budget(tmp_path):
+    """
+    Tests that two limiters on the same lockfile (like two CLI processes) share one budget.
+    """
+    clock = FakeClock()
+    path = lock_path(str(tmp_path))
+    first = RateLimiter(rate=1, burst=1, path=path, clock=clock, sleep=clock.sleep)
+    second = RateLimiter(rate=1, burst=1, path=path, clock=clock, sleep=clock.sleep)
+
+    assert first.reserve() == 0
+    assert second.reserve() == 1.0
+    assert first.reserve() == 2.0
+
+
+def test_unusable_lockfile_falls_back_to_this_process(tmp_path):
+    """
+    Tests that the limit still applies (within the process) if the lockfile can't be opened.
+    """
+    blocker = tmp_path / "not_a_folder"
+    blocker.write_text("")
+    limiter = RateLimiter(rate=1, burst=1, path=str(blocker / "ratelimit.lock"))
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() > 0.9
+    assert limiter.path is None
+
+
+def test_rate_must_be_positive():
+    """
+    Tests that a zero rate is rejected.
+    """
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -0,0 +1,91 @@
+from src.roster_diff import RosterState, describe, diff_players, fingerprint, roster_players
+
+
+def roster(*players):
+    """Builds a get_roster() response from (id, name, status, position, jersey) tuples."""
+    return {"roster": [
+        {"person": {"id": player_id, "fullName": name}, "status": {"description": status},
+         "position": {"name": position}, "jerseyNumber": jersey}
+        for player_id, name, status, position, jersey in players
+    ]}
+
+
+BASE = roster(
+    (1, "Elly De La Cruz", "Active", "Shortstop", "44"),
+    (2, "Hunter Greene", "Active", "Pitcher", "21"),
+)
+
+
+def test_first_roster_is_a_baseline():
+    """
+    Tests that the first roster seen for a team is stored without events.
+    """
+    state = RosterState()
+
+    assert state.update("CIN", 113, BASE) == []
+    assert state.has_team(113)
+
+
+def test_unchanged_roster_is_skipped_by_hash():
+    """
+    Tests that an identical roster produces no events (and the hash matches).
+    """
+    state = RosterState()
+    state.update("CIN", 113, BASE)
+
+    assert state.update("CIN", 113, BASE) == []
+    assert state.teams["113"]["hash"] == fingerprint(roster_players(BASE))
+
+
+def test_adds_removes_and_status_changes():
+    """
+    Tests that a call-up, a DFA and an IL move each become one event.
+    """
+    state = RosterState()
+    state.update("CIN", 113, BASE)
+
+    changed = roster(
+        (1, "Elly De La Cruz", "Active", "Shortstop", "44"),
+        (2, "Hunter Greene", "Injured 15-Day", "Pitcher", "21"),
+        (3, "Call Up", "Active", "Outfielder", "99"),
+    )
+    events = state.update("CIN", 113, changed)
+
+    assert sorted((event.kind, event.player_id) for event in events) == [("added", 3), ("status", 2)]
+    status = [event for event in events if event.kind == "status"][0]
+    assert describe(status) == "[CIN] ~ Status: Hunter Greene: Active -> Injured 15-Day"
+
+    events = state.update("CIN", 113, roster((2, "Hunter Greene", "Injured 15-Day", "Pitcher", "21")))
+    assert sorted((event.kind, event.player_id) for event in events) == [("removed", 1), ("removed", 3)]
+
+
+def test_position_and_jersey_changes():
+    """
+    Tests that the other tracked fields are compared too.
+    """
+    old = roster_players(BASE)
+    new = roster_players(roster(
+        (1, "Elly De La Cruz", "Active", "Third Base", "44"),
+        (2, "Hunter Greene", "Active", "Pitcher", "22"),
+    ))
+
+    events = diff_players("CIN", 113, old, new)
+
+    assert [(event.kind, event.before, event.after) for event in events] == [
+        ("position", "Shortstop", "Third Base"), ("jersey", "21", "22")
+    ]
+
+
+def test_state_round_trip(tmp_path):
+    """
+    Tests that saved state is read back, so the next run only reports new changes.
+    """
+    path = str(tmp_path / "roster_state.json")
+    state = RosterState()
+    state.update("CIN", 113, BASE)
+    state.save(path)
+
+    loaded = RosterState.load(path)
+
+    assert loaded.update("CIN", 113, BASE) == []
+    assert RosterState.load(str(tmp_path / "missing.json")).teams == {}
@@ -0,0 +1,84 @@
+import threading
+import pytest
+import requests
+from unittest.mock import patch
+from src import api
+from src.server import make_server, read_state
+
+
+@pytest.fixture
+def server():
+    """Starts a server on a free port in a background thread."""
+    server = make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    api.configure_server(f"http://{host}:{port}")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@patch('src.api.fetch_body')
+def test_forwarded_requests_share_the_server_memory_cache(mock_fetch_body, server):
+    """
+    Tests that two identical calls through the server only fetch from the API once.
+    """
+    mock_fetch_body.return_value = b'{"roster": []}'
+
+    assert api.get_roster(113) == {"roster": []}
+    assert api.get_roster(113) == {"roster": []}
+
+    mock_fetch_body.assert_called_once()
+    assert server.memory.hits == 1
+
+
+
+@patch('src.api.fetch_body')
+def test_polls_with_ttl_zero_skip_the_server_memory_cache(mock_fetch_body, server):
+    """
+    Tests that a 'watch' poll (ttl=0) after a normal roster read reaches the API
+    instead of getting the body the read left in the server's memory.
+    """
+    mock_fetch_body.side_effect = [b'{"roster": []}', b'{"roster": [{"jerseyNumber": "7"}]}']
+
+    assert api.get_roster(113) == {"roster": []}
+    assert api.get_roster(113, ttl=0) == {"roster": [{"jerseyNumber": "7"}]}
+
+    assert mock_fetch_body.call_count == 2
+    assert mock_fetch_body.call_args.kwargs["ttl"] == 0
+
+@patch('src.api.fetch_body')
+@patch('builtins.print')
+def test_upstream_failure_is_reported_like_a_local_one(mock_print, mock_fetch_body, server):
+    """
+    Tests that an API error inside the server makes the client function return None.
+    """
+    mock_fetch_body.side_effect = requests.exceptions.RequestException("503 Error")
+
+    assert api.get_roster(113) is None
+    assert any("503 Error" in str(c) for c in mock_print.call_args_list)
+
+
+def test_server_refuses_other_hosts(server):
+    host, port = server.server_address[:2]
+
+    response = requests.get(f"http://{host}:{port}/fetch", params={"url": "https://example.com/"})
+
+    assert response.status_code == 403
+
+
+@patch('src.api.client.get')
+def test_unreachable_server_falls_back_to_direct_calls(mock_get):
+    """
+    Tests that a stale server address is dropped and the call is made directly.
+    """
+    mock_get.return_value.content = b'{"roster": []}'
+    api.configure_server("http://127.0.0.1:9")  # Nothing listens on the discard port
+
+    assert api.get_roster(113) == {"roster": []}
+    assert api._server_url is None
+
+
+def test_read_state_without_a_server(tmp_path):
+    assert read_state(str(tmp_path)) is None
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from src.singleflight import SingleFlight, AsyncSingleFlight
+from src.api import get_roster
+from src.async_api import AsyncAPI
+
+
+def test_concurrent_identical_calls_run_once():
+    """
+    Tests that threads asking for the same key at the same time share one call.
+    """
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(timeout=2)
+        return b"body"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(flights.do, "key", slow_fetch) for _ in range(5)]
+        # Give every thread time to join the flight before the first call returns
+        deadline = time.time() + 2
+        while flights.shared < 4 and time.time() < deadline:
+            time.sleep(0.005)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [b"body"] * 5
+    assert len(calls) == 1
+    assert flights.shared == 4
+
+
+def test_errors_reach_every_waiter_and_the_key_is_forgotten():
+    """
+    Tests that a failed call raises for everyone, and that the next call runs again.
+    """
+    flights = SingleFlight()
+
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flights.do("key", failing)
+
+    # Not a cache: once the first call is done, a new one runs
+    assert flights.do("key", lambda: "fresh") == "fresh"
+
+
+def test_different_keys_do_not_share():
+    """
+    Tests that calls with different keys each run.
+    """
+    flights = SingleFlight()
+    assert flights.do("a", lambda: 1) == 1
+    assert flights.do("b", lambda: 2) == 2
+    assert flights.shared == 0
+
+
+def test_async_identical_awaits_share_one_task():
+    """
+    Tests that concurrent awaits with the same key run the coroutine once.
+    """
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    async def run():
+        return await asyncio.gather(*(flights.do("key", fetch) for _ in range(4)))
+
+    assert asyncio.run(run()) == [{"ok": True}] * 4
+    assert len(calls) == 1
+    assert flights.shared == 3
+
+
+@patch('src.api.client.get')
+def test_api_threads_share_one_request(mock_get):
+    """
+    Tests that several threads fetching the same roster make only one HTTP request,
+    and that each one gets its own parsed copy.
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_get(url, params=None, headers=None):
+        started.set()
+        release.wait(timeout=2)
+        response = MagicMock()
+        response.content = json.dumps({"roster": []}).encode()
+        return response
+
+    mock_get.side_effect = slow_get
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(get_roster, 113) for _ in range(4)]
+        started.wait(timeout=2)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [{"roster": []}] * 4
+    assert mock_get.call_count == 1
+    assert len({id(result) for result in results}) == 4
+
+
+def test_async_api_coalesces_identical_calls():
+    """
+    Tests that AsyncAPI runs identical concurrent calls once.
+    """
+    calls = []
+
+    def fake_get_roster(team_id):
+        calls.append(team_id)
+        time.sleep(0.01)
+        return {"team": team_id}
+
+    async def run():
+        async with AsyncAPI(concurrency=4) as mlb:
+            return await mlb.gather([mlb.get_roster(113), mlb.get_roster(113), mlb.get_roster(147)])
+
+    with patch('src.async_api.api.get_roster', side_effect=fake_get_roster):
+        results = asyncio.run(run())
+
+    assert results == [{"team": 113}, {"team": 113}, {"team": 147}]
+    assert sorted(calls) == [113, 147]
@@ -0,0 +1,157 @@
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("numpy")
+
+from src.categories import CATEGORIES
+from src.snapshot import Snapshot, available_seasons, collapse_splits, download_splits, write_group
+
+
+def make_split(player_id, name, team_id, stat, league_id=103, position="Shortstop"):
+    """Builds one split like the bulk /stats endpoint returns."""
+    split = {
+        "player": {"id": player_id, "fullName": name},
+        "league": {"id": league_id},
+        "position": {"name": position},
+        "stat": stat,
+    }
+    if team_id is not None:
+        split["team"] = {"id": team_id, "name": f"Team {team_id}"}
+    return split
+
+
+HITTING = [
+    make_split(1, "Big Slugger", 113, {"gamesPlayed": 150, "plateAppearances": 600, "homeRuns": 40, "avg": ".280"}),
+    make_split(2, "Part Timer", 113, {"gamesPlayed": 40, "plateAppearances": 120, "homeRuns": 10, "avg": ".350"}),
+    make_split(3, "Contact Hitter", 147, {"gamesPlayed": 160, "plateAppearances": 650, "homeRuns": 10, "avg": ".310"}, league_id=104),
+    # Traded mid-season: one split per team plus the season total
+    make_split(4, "Traded Guy", 113, {"gamesPlayed": 60, "plateAppearances": 250, "homeRuns": 8, "avg": ".250"}),
+    make_split(4, "Traded Guy", 147, {"gamesPlayed": 90, "plateAppearances": 350, "homeRuns": 12, "avg": ".270"}),
+    make_split(4, "Traded Guy", None, {"gamesPlayed": 150, "plateAppearances": 600, "homeRuns": 20, "avg": ".262"}),
+]
+
+PITCHING = [
+    make_split(10, "Ace Starter", 113, {"inningsPitched": "200.1", "era": "2.10", "strikeOuts": 250}, position="Pitcher"),
+    make_split(11, "Mop Up", 147, {"inningsPitched": "20.0", "era": "1.00", "strikeOuts": 20}, position="Pitcher"),
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    """A 2024 snapshot built from the fake splits above."""
+    write_group(str(tmp_path), 2024, "hitting", HITTING)
+    write_group(str(tmp_path), 2024, "pitching", PITCHING)
+    return Snapshot.load(str(tmp_path), 2024)
+
+
+def test_collapse_prefers_the_season_total():
+    """
+    Tests that a traded player keeps only the split without a team (the season total).
+    """
+    rows = collapse_splits(HITTING)
+
+    assert [row["player"]["id"] for row in rows] == [1, 2, 3, 4]
+    assert "team" not in rows[-1]
+    assert rows[-1]["stat"]["homeRuns"] == 20
+
+
+def test_stat_groups_look_like_the_api(snapshot, tmp_path):
+    """
+    Tests that a player's line comes back in the shape get_player_stats() returns.
+    """
+    assert available_seasons(str(tmp_path)) == [2024]
+
+    [hitting] = snapshot.stat_groups(1)
+    split = hitting["splits"][0]
+
+    assert hitting["group"]["displayName"] == "hitting"
+    assert split["stat"]["homeRuns"] == 40
+    assert split["stat"]["avg"] == ".280"
+    assert split["team"]["name"] == "Team 113"
+
+    [pitching] = snapshot.stat_groups(10)
+    assert pitching["splits"][0]["stat"]["inningsPitched"] == "200.1"
+    assert snapshot.stat_groups(999) == []
+
+
+def test_player_index_finds_names(snapshot):
+    """
+    Tests that names are looked up in the snapshot without any network call.
+    """
+    assert snapshot.player_index().lookup("big slugger").player_id == 1
+
+
+def test_roster_includes_traded_players(snapshot):
+    """
+    Tests that a team's roster lists everyone who had a split for it.
+    """
+    roster = snapshot.roster(113)["roster"]
+
+    assert [entry["person"]["fullName"] for entry in roster] == ["Ace Starter", "Big Slugger", "Part Timer", "Traded Guy"]
+
+
+def test_counting_leaders(snapshot):
+    """
+    Tests that counting stats rank everyone, biggest first, with ties sharing a rank.
+    """
+    leaders = snapshot.leaders(CATEGORIES["HR"], limit=4)
+
+    assert [leader["person"]["fullName"] for leader in leaders] == ["Big Slugger", "Traded Guy", "Part Timer", "Contact Hitter"]
+    assert [leader["rank"] for leader in leaders] == [1, 2, 3, 3]
+    assert leaders[0]["value"] == "40"
+
+
+def test_rate_leaders_need_to_qualify(snapshot):
+    """
+    Tests that rate stats skip players without enough PA / IP, and that ERA ranks lowest first.
+    """
+    avg = snapshot.leaders(CATEGORIES["AVG"], limit=10)
+    # 160 team games -> 496 PA to qualify, so the .350 part-timer is left out
+    assert [leader["person"]["id"] for leader in avg] == [3, 1, 4]
+    assert avg[0]["value"] == ".310"
+
+    era = snapshot.leaders(CATEGORIES["ERA"], limit=10)
+    assert [leader["person"]["id"] for leader in era] == [10]
+
+
+def test_leaders_by_league(snapshot):
+    """
+    Tests that --league filters on the league of each player's line.
+    """
+    leaders = snapshot.leaders(CATEGORIES["HR"], limit=10, league_id=104)
+
+    assert [leader["person"]["id"] for leader in leaders] == [3]
+
+
+def test_category_without_a_snapshot_field(snapshot):
+    """
+    Tests that categories the snapshot can't answer return None.
+    """
+    assert snapshot.leaders(CATEGORIES["XBH"]) is None
+
+
+@patch('src.api.get_season_stats_page')
+def test_download_splits_follows_pagination(mock_page):
+    """
+    Tests that the remaining pages are requested after the first one reports totalSplits.
+    """
+    def fake_page(group, season, offset=0, limit=2):
+        splits = HITTING[offset:offset + limit]
+        return {"stats": [{"totalSplits": len(HITTING), "splits": splits}]}
+
+    mock_page.side_effect = fake_page
+
+    splits = download_splits("hitting", 2024, workers=2, page_size=2)
+
+    assert splits == HITTING
+    assert sorted(call.kwargs["offset"] for call in mock_page.call_args_list) == [0, 2, 4]
+
+
+@patch('src.api.get_season_stats_page')
+def test_download_splits_fails_if_a_page_fails(mock_page):
+    """
+    Tests that a failed page fails the whole download (no partial snapshot).
+    """
+    mock_page.side_effect = [{"stats": [{"totalSplits": 4, "splits": HITTING[:2]}]}, None]
+
+    assert download_splits("hitting", 2024, workers=1, page_size=2) is None
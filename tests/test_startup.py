@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import pytest
+from src.startup import parse_importtime
+
+
+def test_parse_importtime_reads_depth_and_times():
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        300 | src.api",
+        "import time:       200 |        200 |   src.cache",
+        "Some other stderr line",
+    ]
+
+    timings = parse_importtime(lines)
+
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("src.api", 100, 300, 0),
+        ("src.cache", 200, 200, 1),
+    ]
+
+
+@pytest.mark.parametrize("module", ["requests", "asyncio"])
+@pytest.mark.parametrize("argv", [["--help"], ["roster", "INVALIDCODE"]])
+def test_cli_does_not_import_requests_without_network_calls(argv, module, tmp_path):
+    """
+    Tests that --help and rejected arguments never load the HTTP stack (or asyncio).
+    (Runs in a fresh interpreter, since this test process has already imported both.)
+    """
+    code = (
+        "import sys\n"
+        f"sys.argv = ['main.py'] + {argv!r}\n"
+        "from src.main import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print({module!r} in sys.modules, file=sys.stderr)\n"
+    )
+    env = {"MLB_STATS_CACHE_DIR": str(tmp_path), "PATH": ""}
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=repo_root)
+
+    assert result.stderr.strip().splitlines()[-1] == "False"
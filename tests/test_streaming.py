@@ -0,0 +1,49 @@
+import io
+import pytest
+from src import streaming
+
+DOCUMENT = b'{"stats": [{"splits": [{"id": 1}, {"id": 2}]}, {"splits": [{"id": 3, "avg": 0.25}]}], "copyright": "x"}'
+
+
+def test_walk_follows_a_prefix_through_lists():
+    """
+    Tests that "item" in a prefix steps into every element of a list.
+    """
+    data = {"stats": [{"splits": [{"id": 1}, {"id": 2}]}, {"splits": [{"id": 3}]}]}
+
+    assert [split["id"] for split in streaming.walk(data, "stats.item.splits.item")] == [1, 2, 3]
+    assert list(streaming.walk(data, "missing.item")) == []
+
+
+def test_iter_items_reads_records_from_a_file():
+    """
+    Tests that records come out one by one, with plain int/float numbers, from a binary stream.
+    """
+    pytest.importorskip("ijson")
+
+    records = list(streaming.iter_items(io.BytesIO(DOCUMENT), "stats.item.splits.item"))
+
+    assert records == [{"id": 1}, {"id": 2}, {"id": 3, "avg": 0.25}]
+    assert type(records[2]["avg"]) is float
+
+
+def test_iter_items_is_lazy():
+    """
+    Tests that the first record is available before the rest of the document has been read.
+    """
+    pytest.importorskip("ijson")
+    source = io.BytesIO(b'{"people": [{"id": 1}, ' + b'{"id": 2}, ' * 20000 + b'{"id": 3}]}')
+
+    records = streaming.iter_items(source, "people.item")
+
+    assert next(records) == {"id": 1}
+    assert source.tell() < len(source.getvalue())
+
+
+def test_iter_items_without_ijson(monkeypatch):
+    """
+    Tests that without ijson the document is parsed whole and walked the same way.
+    """
+    monkeypatch.setattr(streaming, "_ijson", False)
+
+    assert list(streaming.iter_items(DOCUMENT, "stats.item.splits.item")) == [{"id": 1}, {"id": 2}, {"id": 3, "avg": 0.25}]
@@ -0,0 +1,67 @@
+import pytest
+from src.models import SeasonStatLine
+from src.table import StatTable, format_stat
+
+
+def hitting_line(season, **stat):
+    return SeasonStatLine.from_json("hitting", {"season": season, "team": {"name": "Test Team"}, "stat": stat})
+
+
+def pitching_line(season, **stat):
+    return SeasonStatLine.from_json("pitching", {"season": season, "stat": stat})
+
+
+def test_sort_by_reorders_every_column():
+    """
+    Tests that sorting by one stat keeps each row's values together.
+    """
+    table = StatTable.from_lines("hitting", [
+        hitting_line("2022", homeRuns=10, hits=100),
+        hitting_line("2023", homeRuns=30, hits=150),
+        hitting_line("2024", hits=90),  # No homeRuns value: sorts last
+    ])
+
+    ordered = table.sort_by("homeRuns")
+
+    assert ordered.column("season") == ["2023", "2022", "2024"]
+    assert ordered.column("hits") == [150, 100, 90]
+
+
+def test_hitting_totals_recompute_rate_stats():
+    """
+    Tests that totals add counting stats and recompute AVG/OBP/SLG from them.
+    """
+    table = StatTable.from_lines("hitting", [
+        hitting_line("2023", atBats=100, hits=30, baseOnBalls=10, hitByPitch=0, sacFlies=0, totalBases=50, avg=".300"),
+        hitting_line("2024", atBats=300, hits=70, baseOnBalls=0, hitByPitch=0, sacFlies=0, totalBases=110, avg=".233"),
+    ])
+
+    totals = table.totals()
+
+    assert totals["hits"] == 100
+    assert totals["avg"] == pytest.approx(0.25)
+    assert totals["obp"] == pytest.approx(110 / 410)
+    assert totals["slg"] == pytest.approx(0.4)
+
+
+def test_pitching_totals_use_real_innings():
+    """
+    Tests that "6.2" innings count as 6 2/3 when computing ERA.
+    """
+    table = StatTable.from_lines("pitching", [
+        pitching_line("2024", inningsPitched="6.2", earnedRuns=2, hits=5, baseOnBalls=1),
+        pitching_line("2024", inningsPitched="2.1", earnedRuns=1, hits=1, baseOnBalls=2),
+    ])
+
+    totals = table.totals()
+
+    assert format_stat("inningsPitched", totals["inningsPitched"]) == "9.0"
+    assert totals["era"] == pytest.approx(3.0)
+    assert totals["whip"] == pytest.approx(1.0)
+
+
+def test_format_stat():
+    assert format_stat("avg", 0.3) == ".300"
+    assert format_stat("era", 2.5) == "2.50"
+    assert format_stat("homeRuns", 44.0) == "44"
+    assert format_stat("homeRuns", None) == "-"
@@ -0,0 +1,91 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.team_stats import TeamStats, team_split
+
+
+def person(player_id, name, group, *splits, position="SS"):
+    """Builds a hydrated person with one stats group."""
+    return {
+        "id": player_id, "fullName": name, "primaryPosition": {"abbreviation": position},
+        "stats": [{"type": {"displayName": "season"}, "group": {"displayName": group}, "splits": list(splits)}],
+    }
+
+
+def hitting(team_id, ab, hits, homers, walks, pa=None):
+    stat = {"atBats": ab, "hits": hits, "homeRuns": homers, "baseOnBalls": walks, "hitByPitch": 0, "sacFlies": 0,
+            "totalBases": hits + 3 * homers, "plateAppearances": pa or ab + walks, "avg": f"{hits / ab:.3f}"}
+    split = {"season": "2024", "stat": stat}
+    if team_id is not None:
+        split["team"] = {"id": team_id, "name": f"Team {team_id}"}
+    return split
+
+
+def test_team_split_prefers_the_team_s_own_line():
+    """
+    Tests that a traded player counts only their line for this team.
+    """
+    splits = [hitting(147, 100, 30, 5, 10), hitting(113, 200, 50, 10, 20), hitting(None, 300, 80, 15, 30)]
+
+    assert team_split(splits, 113)["stat"]["atBats"] == 200
+    assert team_split([hitting(None, 300, 80, 15, 30)], 113)["stat"]["atBats"] == 300
+    assert team_split(splits, 111) is None
+
+
+def test_totals_recompute_rate_stats():
+    """
+    Tests that counting stats are summed and AVG/OBP/SLG come from the sums, not an average of averages.
+    """
+    people = [
+        person(1, "Regular", "hitting", hitting(113, 500, 150, 30, 50)),
+        person(2, "Traded In", "hitting", hitting(147, 300, 60, 5, 10), hitting(113, 100, 20, 2, 5)),
+        person(3, "Elsewhere", "hitting", hitting(147, 300, 60, 5, 10)),
+        person(4, "Pitcher", "pitching", {"team": {"id": 113}, "stat": {"inningsPitched": "10.1", "earnedRuns": 3}}),
+    ]
+
+    report = TeamStats.from_people("hitting", people, 113)
+    totals = report.totals()
+
+    assert len(report) == 2
+    assert totals["atBats"] == 600
+    assert totals["homeRuns"] == 32
+    assert isinstance(totals["homeRuns"], int)
+    assert totals["avg"] == pytest.approx(170 / 600)
+    assert totals["slg"] == pytest.approx((170 + 96) / 600)
+
+
+def test_rows_most_playing_time_first():
+    """
+    Tests the per-player lines: most PA first, numbers converted, missing stats as None.
+    """
+    people = [
+        person(1, "Bench", "hitting", hitting(113, 50, 10, 1, 5)),
+        person(2, "Starter", "hitting", hitting(113, 550, 160, 25, 60), position="CF"),
+    ]
+
+    rows = list(TeamStats.from_people("hitting", people, 113).rows())
+
+    assert [row["name"] for row in rows] == ["Starter", "Bench"]
+    assert rows[0]["position"] == "CF"
+    assert rows[0]["homeRuns"] == 25
+    assert rows[0]["avg"] == pytest.approx(0.291)
+    assert rows[0]["rbi"] is None
+
+
+def test_pitching_totals_use_real_innings():
+    """
+    Tests that innings like "10.1" are added as 10 1/3 before ERA is computed.
+    """
+    people = [
+        person(1, "Starter", "pitching", {"team": {"id": 113}, "stat": {"inningsPitched": "10.1", "earnedRuns": 4,
+                                                                       "hits": 9, "baseOnBalls": 2}}),
+        person(2, "Reliever", "pitching", {"team": {"id": 113}, "stat": {"inningsPitched": "1.2", "earnedRuns": 0,
+                                                                        "hits": 1, "baseOnBalls": 0}}),
+    ]
+
+    totals = TeamStats.from_people("pitching", people, 113).totals()
+
+    assert totals["inningsPitched"] == pytest.approx(12)
+    assert totals["era"] == pytest.approx(3.0)
+    assert totals["whip"] == pytest.approx(1.0)
@@ -0,0 +1,100 @@
+import datetime
+import pytest
+from unittest.mock import patch
+from src.warm import Schedule, ScheduleError, WarmState, job_tasks, parse_duration, parse_window, in_window, run_schedule
+
+TEAM_MAP = {"CIN": 113, "NYY": 147}
+
+
+def at(hour, minute=0):
+    """A timestamp for a local time of day."""
+    return datetime.datetime(2024, 6, 1, hour, minute).timestamp()
+
+
+def schedule(off_peak=None, **job_overrides):
+    jobs = [
+        {"name": "rosters", "query": "roster", "teams": "all", "every": "1d", "priority": 1, "deadline": "6h"},
+        {"name": "leaders", "query": "leaders", "categories": ["HR", "AVG,ERA"], "every": "1h", "priority": 2},
+        {"name": "watchlist", "query": "stats", "players": ["Elly De La Cruz", 592450], "every": "6h", **job_overrides},
+    ]
+    return Schedule.from_dict({"off_peak": off_peak, "jobs": jobs}, TEAM_MAP)
+
+
+def test_parse_duration_and_window():
+    """
+    Tests durations with and without units, and windows that wrap past midnight.
+    """
+    assert parse_duration(90) == 90
+    assert parse_duration("15m") == 900
+    assert parse_duration("1d") == 86400
+    with pytest.raises(ScheduleError):
+        parse_duration("soon")
+
+    window = parse_window("22:00-05:00")
+    assert in_window(window, at(23)) and in_window(window, at(4, 59))
+    assert not in_window(window, at(5)) and not in_window(window, at(12))
+
+
+def test_bad_schedules_are_rejected():
+    """
+    Tests that unknown queries, team codes and categories are caught when the schedule is loaded.
+    """
+    for job in ({"query": "boxscores", "every": 60},
+                {"query": "roster", "teams": ["XYZ"], "every": 60},
+                {"query": "leaders", "categories": ["HRR"], "every": 60},
+                {"query": "stats", "every": 60}):
+        with pytest.raises(ScheduleError):
+            Schedule.from_dict({"jobs": [job]}, TEAM_MAP)
+
+
+def test_due_jobs_wait_for_the_window_unless_past_their_deadline():
+    """
+    Tests that outside the off-peak window only jobs past their deadline run, and inside it
+    every due job runs, most urgent first.
+    """
+    plan = schedule(off_peak="01:00-06:00")
+    now = at(12)
+    # Rosters ran 31 hours ago (past 1d + 6h); leaders 2 hours ago (due, no deadline); watchlist just ran
+    last_runs = {"rosters": now - 31 * 3600, "leaders": now - 2 * 3600, "watchlist": now - 60}
+
+    assert [job.name for job in plan.due(last_runs, now)] == ["rosters"]
+    assert [job.name for job in plan.due(last_runs, now, ignore_window=True)] == ["rosters", "leaders"]
+    assert [job.name for job in plan.due({}, at(3))] == ["rosters", "leaders", "watchlist"]
+
+
+@patch('src.warm.api')
+def test_job_tasks_make_the_interactive_calls(mock_api):
+    """
+    Tests that each job expands into the same API calls 'roster', 'leaders' and 'stats' make.
+    """
+    mock_api.search_for_player.return_value = 682829
+    rosters, leaders, watchlist = schedule().jobs
+    season = datetime.datetime.now().year
+
+    for _, func in job_tasks(rosters, TEAM_MAP) + job_tasks(leaders, TEAM_MAP) + job_tasks(watchlist, TEAM_MAP):
+        func()
+
+    assert [call.args for call in mock_api.get_roster.call_args_list] == [(113,), (147,)]
+    assert [(call.args[0], call.kwargs["group"]) for call in mock_api.get_league_leaders.call_args_list] == [
+        (["homeRuns"], "hitting"), (["battingAverage"], "hitting"), (["earnedRunAverage"], "pitching"),
+    ]
+    mock_api.search_for_player.assert_called_once_with("Elly De La Cruz")
+    assert [call.args for call in mock_api.get_player_stats.call_args_list] == [(682829, season), (592450, season)]
+
+
+@patch('src.warm.api.get_roster')
+def test_run_schedule_once_records_successful_jobs(mock_get_roster, tmp_path):
+    """
+    Tests that a --once run refreshes the due jobs, records when they ran and saves the state.
+    """
+    mock_get_roster.return_value = {"roster": []}
+    plan = Schedule.from_dict({"jobs": [{"name": "rosters", "query": "roster", "every": "1d"}]}, TEAM_MAP)
+    state = WarmState()
+    path = str(tmp_path / "warm_state.json")
+    lines = []
+
+    run_schedule(plan, state, path, TEAM_MAP, once=True, report=lines.append, clock=lambda: at(12))
+
+    assert mock_get_roster.call_count == 2
+    assert "  rosters: 2/2 refreshed" in lines
+    assert WarmState.load(path).last_runs() == {"rosters": at(12)}